@@ -0,0 +1,11 @@
+# __main__.py
+# 상위 폴더에서 python -m Plan_man <명령> 으로 명령줄 도구(cli.py)를 실행합니다.
+import os
+import sys
+
+# 모듈들이 'from core ...', 'from modules ...' 형태로 불러오므로 이 폴더를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from cli import main
+
+sys.exit(main())
@@ -0,0 +1,75 @@
+# benchmarks/bench_event_index.py
+# 기존 {date: [이벤트 딕셔너리, ...]} 구조와 EventIndex의 조회 속도/메모리 비교
+# 실행 방법 (Plan_man 폴더에서): python -m benchmarks.bench_event_index
+import datetime
+import random
+import time
+import tracemalloc
+from modules.event_model import Event, EventIndex
+
+EVENT_COUNTS = [1000, 10000, 50000] # 약 1년, 10년, 50년치 (하루 평균 3개 정도)
+QUERIES = 2000
+START = datetime.datetime(2020, 1, 1)
+
+def make_events(count):
+    """회의(1시간), 자정을 넘는 일정, 여러 날 종일 일정이 섞인 이벤트를 만듭니다."""
+    rng = random.Random(count)
+    days = max(1, count // 3)
+    events = []
+    for i in range(count):
+        start = START + datetime.timedelta(days=rng.randrange(days), hours=rng.randrange(8, 23))
+        kind = i % 10
+        if kind == 0: # 여러 날 종일 일정
+            start = start.replace(hour=0)
+            events.append(Event(f"ev{i}", start, start + datetime.timedelta(days=1 + i % 4), True, f"종일 {i}", "primary"))
+        elif kind == 1: # 자정을 넘는 일정
+            events.append(Event(f"ev{i}", start, start + datetime.timedelta(hours=5), False, f"야간 {i}", "primary"))
+        else:
+            events.append(Event(f"ev{i}", start, start + datetime.timedelta(hours=1), False, f"회의 {i}", "primary"))
+    return events, days
+
+def build_dict(events):
+    """변경 전 구조: 시작 날짜를 키로 이벤트 정보 딕셔너리 리스트 (여러 날 이벤트는 첫날에만 보임)"""
+    events_by_date = {}
+    for event in events:
+        events_by_date.setdefault(event.start.date(), []).append(
+            {"id": event.id, "summary": event.summary, "calendar_id": event.calendar, "color": "#4285f4",
+             "start": event.start, "end": event.end, "all_day": event.all_day})
+    return events_by_date
+
+def build_index(events):
+    """변경 후 구조: Event 레코드를 새로 만들어 EventIndex에 담음 (레코드 생성 비용까지 포함하여 비교)"""
+    return EventIndex(Event(event.id, event.start, event.end, event.all_day, event.summary, event.calendar)
+                      for event in events)
+
+def measure_memory(build, events):
+    tracemalloc.start()
+    result = build(events)
+    peak_kb = tracemalloc.get_traced_memory()[1] / 1024
+    tracemalloc.stop()
+    del result
+    return peak_kb
+
+def main():
+    print(f"{'이벤트 수':>9}{'딕셔너리(KB)':>14}{'인덱스(KB)':>12}{'날짜 조회(us)':>14}{'주간 조회(us)':>14}")
+    for count in EVENT_COUNTS:
+        events, days = make_events(count)
+        # 같은 정보(시작/끝 시각 포함)를 담는 데 드는 메모리 비교 (datetime 객체는 두 경우 모두 공유)
+        dict_kb = measure_memory(build_dict, events)
+        index_kb = measure_memory(build_index, events)
+
+        index = EventIndex(events)
+        rng = random.Random(0)
+        query_days = [(START + datetime.timedelta(days=rng.randrange(days))).date() for _ in range(QUERIES)]
+        started = time.perf_counter()
+        for day in query_days:
+            index.on_date(day)
+        day_us = (time.perf_counter() - started) * 1e6 / QUERIES
+        started = time.perf_counter()
+        for day in query_days:
+            index.overlapping(day, day + datetime.timedelta(days=7))
+        week_us = (time.perf_counter() - started) * 1e6 / QUERIES
+        print(f"{count:>9}{dict_kb:>14.0f}{index_kb:>12.0f}{day_us:>14.1f}{week_us:>14.1f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+# benchmarks/bench_feed_parser.py
+# 기존 BeautifulSoup 방식과 스트리밍 파서(news_fetcher.parse_feed_stream)의 속도/메모리 비교
+# 실행 방법 (Plan_man 폴더에서): python -m benchmarks.bench_feed_parser
+import time
+import tracemalloc
+from bs4 import BeautifulSoup
+from benchmarks.stub_servers import build_feed
+from modules.news_fetcher import parse_feed_stream, FEED_CHUNK_SIZE, MAX_NEWS_ITEMS
+
+FIXTURES = {"RSS": "rss_sample.xml", "Atom": "atom_sample.xml"}
+FEED_SIZES = [15, 200, 2000] # 피드에 들어있는 항목 수
+REPEAT = 20
+
+def parse_with_beautifulsoup(content):
+    """변경 전 get_news_items_by_category의 파싱 방식 (전체 디코딩 + 전체 트리 생성)"""
+    try:
+        text = content.decode('utf-8')
+    except UnicodeDecodeError:
+        text = content.decode('cp949', 'ignore')
+    soup = BeautifulSoup(text, "xml")
+    items = soup.find_all("item")
+    if not items:
+        items = soup.find_all("entry")
+    news_list = []
+    for item in items[:MAX_NEWS_ITEMS]:
+        title_tag = item.find("title")
+        link_tag = item.find("link")
+        title = title_tag.text.strip() if title_tag else "제목 없음"
+        link = ""
+        if link_tag:
+            if link_tag.text:
+                link = link_tag.text.strip()
+            elif link_tag.get('href'):
+                link = link_tag.get('href').strip()
+        news_list.append({"title": title, "link": link})
+    return news_list
+
+def parse_with_stream(content):
+    chunks = (content[i:i + FEED_CHUNK_SIZE] for i in range(0, len(content), FEED_CHUNK_SIZE))
+    # 비교를 위해 BeautifulSoup 방식에는 없는 발행 시각은 제외
+    return [{"title": item["title"], "link": item["link"]} for item in parse_feed_stream(chunks)[0]]
+
+def measure(parse_func, content):
+    """(평균 소요 시간(ms), 최대 메모리 사용량(KB), 결과) 튜플을 반환합니다."""
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        result = parse_func(content)
+    elapsed_ms = (time.perf_counter() - started) * 1000 / REPEAT
+
+    tracemalloc.start()
+    parse_func(content)
+    peak_kb = tracemalloc.get_traced_memory()[1] / 1024
+    tracemalloc.stop()
+    return elapsed_ms, peak_kb, result
+
+def main():
+    print(f"{'피드':<6}{'항목 수':>8}{'크기(KB)':>10}{'BS4(ms)':>10}{'스트림(ms)':>12}{'BS4(KB)':>10}{'스트림(KB)':>12}")
+    for feed_type, file_name in FIXTURES.items():
+        for item_count in FEED_SIZES:
+            content = build_feed(file_name, item_count)
+            bs_ms, bs_kb, bs_result = measure(parse_with_beautifulsoup, content)
+            st_ms, st_kb, st_result = measure(parse_with_stream, content)
+            if bs_result != st_result:
+                print(f"경고: {feed_type} {item_count}개 피드의 파싱 결과가 서로 다릅니다.")
+            print(f"{feed_type:<6}{item_count:>8}{len(content) / 1024:>10.1f}"
+                  f"{bs_ms:>10.2f}{st_ms:>12.2f}{bs_kb:>10.0f}{st_kb:>12.0f}")
+
+if __name__ == '__main__':
+    main()
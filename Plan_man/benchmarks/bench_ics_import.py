@@ -0,0 +1,73 @@
+# benchmarks/bench_ics_import.py
+# ICS 가져오기(modules/ics_importer.py)의 파일 읽기 시간/메모리와 월 보기 시간 측정
+# 10년치를 내보낸 파일을 흉내 낸 ICS(한 번만 있는 일정 + 반복 일정)를 임시 폴더에 만들어 사용합니다.
+# 실행 방법 (Plan_man 폴더에서): python -m benchmarks.bench_ics_import
+import datetime
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from modules import ics_importer
+
+SINGLE_EVENTS = 60000
+RECURRING_EVENTS = 400
+YEARS = 10
+RULES = ["FREQ=DAILY", "FREQ=WEEKLY;BYDAY=MO,WE,FR", "FREQ=WEEKLY;INTERVAL=2;BYDAY=TU", "FREQ=MONTHLY;BYDAY=2TU",
+         "FREQ=MONTHLY;BYMONTHDAY=-1", "FREQ=MONTHLY;BYDAY=MO,TU,WE,TH,FR;BYSETPOS=-1", "FREQ=YEARLY",
+         "FREQ=DAILY;COUNT=2000", "FREQ=WEEKLY;UNTIL=20331231T000000Z"]
+DESCRIPTION = "회의 안건과 준비물을 확인하세요. " * 6 # 실제 내보내기 파일처럼 쓰지 않는 긴 속성도 넣음
+
+def _fold(line):
+    # 75자 근처에서 접어 쓰기 (읽을 때 이어 붙이는 처리도 측정되도록)
+    return "\r\n ".join(line[i:i + 70] for i in range(0, len(line), 70)) + "\r\n"
+
+def write_export(path, rng):
+    first = datetime.datetime(2024, 1, 1)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Bench//KO\r\nX-WR-CALNAME:벤치마크 내보내기\r\n")
+        for i in range(SINGLE_EVENTS):
+            start = first + datetime.timedelta(minutes=rng.randrange(YEARS * 365 * 24 * 4) * 15)
+            end = start + datetime.timedelta(minutes=rng.choice((30, 60, 90, 180)))
+            f.write(f"BEGIN:VEVENT\r\nUID:single-{i}@bench\r\nDTSTART:{start:%Y%m%dT%H%M%S}\r\n"
+                    f"DTEND:{end:%Y%m%dT%H%M%S}\r\nSUMMARY:일정 {i}\r\n" + _fold(f"DESCRIPTION:{DESCRIPTION}")
+                    + "BEGIN:VALARM\r\nACTION:DISPLAY\r\nTRIGGER:-PT10M\r\nEND:VALARM\r\nEND:VEVENT\r\n")
+        for i in range(RECURRING_EVENTS):
+            start = first + datetime.timedelta(days=rng.randrange(365), hours=rng.randrange(8, 20))
+            exdates = ",".join(f"{start + datetime.timedelta(days=rng.randrange(3650)):%Y%m%dT%H%M%S}" for _ in range(5))
+            f.write(f"BEGIN:VEVENT\r\nUID:recurring-{i}@bench\r\nDTSTART;TZID=Asia/Seoul:{start:%Y%m%dT%H%M%S}\r\n"
+                    f"DURATION:PT1H\r\nRRULE:{RULES[i % len(RULES)]}\r\nEXDATE;TZID=Asia/Seoul:{exdates}\r\n"
+                    f"SUMMARY:반복 일정 {i}\r\nEND:VEVENT\r\n")
+        f.write("END:VCALENDAR\r\n")
+
+def main():
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory(prefix="planman-ics-") as work_dir:
+        path = os.path.join(work_dir, "export.ics")
+        write_export(path, rng)
+        print(f"파일 크기: {os.path.getsize(path) / 1024 / 1024:.1f}MB "
+              f"(한 번만 있는 일정 {SINGLE_EVENTS}개, 반복 일정 {RECURRING_EVENTS}개)")
+
+        started = time.perf_counter()
+        calendar = ics_importer.load_ics(path)
+        parse_ms = (time.perf_counter() - started) * 1000
+        # 메모리는 별도로 한 번 더 읽어 측정 (tracemalloc이 실행 속도를 늦추기 때문)
+        tracemalloc.start()
+        ics_importer.load_ics(path)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"읽기: {parse_ms:.0f}ms, 최대 메모리 {peak / 1024 / 1024:.1f}MB, 읽은 뒤 보관 {current / 1024 / 1024:.1f}MB")
+
+        print(f"{'월':>8}{'처음(ms)':>10}{'다시(ms)':>10}{'일정 수':>8}")
+        for year, month in ((2024, 1), (2028, 7), (2033, 12)):
+            first_day = datetime.date(year, month, 1)
+            next_month = datetime.date(year + month // 12, month % 12 + 1, 1)
+            timings = []
+            for _ in range(2): # 두 번째는 (반복 규칙, 기간) 계산 결과를 재사용
+                started = time.perf_counter()
+                events = calendar.events_between(first_day, next_month)
+                timings.append((time.perf_counter() - started) * 1000)
+            print(f"{year}-{month:02d}{timings[0]:>10.2f}{timings[1]:>10.2f}{len(events):>8}")
+
+if __name__ == '__main__':
+    main()
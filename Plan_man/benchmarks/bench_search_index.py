@@ -0,0 +1,43 @@
+# benchmarks/bench_search_index.py
+# 검색 색인(modules/search_index.py)의 색인 시간과 검색 시간 측정
+# 실행 방법 (Plan_man 폴더에서): python -m benchmarks.bench_search_index
+import random
+import time
+from benchmarks.bench_event_index import make_events
+from modules import search_index
+
+EVENT_COUNTS = [1000, 10000, 50000]
+NEWS_COUNT = 250 # 5개 카테고리 x 피드당 최대 50개
+WORDS = ["주간", "회의", "팀", "스터디", "운동", "병원", "예약", "수업", "과제", "마감", "세미나", "점심", "저녁", "약속",
+         "Project", "Review", "Sync"]
+QUERIES = ["회의", "주간회의", "간회", "스터", "마감 과제", "review", "회ㅇ", "점", "병원 예약", "없는검색어"]
+REPEAT = 200
+
+def _title(rng):
+    return "".join(rng.sample(WORDS, 2)) + " " + rng.choice(WORDS) + f" {rng.randrange(100)}"
+
+def main():
+    rng = random.Random(0)
+    news = [{"title": _title(rng), "link": f"https://news.example/{i}", "published": 1.7e9 - i * 60}
+            for i in range(NEWS_COUNT)]
+    print(f"{'일정 수':>7}{'색인(ms)':>10}" + "".join(f"{query:>12}" for query in QUERIES) + "   (검색 us, 결과 수)")
+    for count in EVENT_COUNTS:
+        events, _ = make_events(count)
+        for event in events:
+            event.summary = _title(rng)
+        search_index._index = search_index.SearchIndex()
+        started = time.perf_counter()
+        search_index.index_events(events, "primary", replace=True)
+        search_index.index_news("정치", news)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        cells = []
+        for query in QUERIES:
+            started = time.perf_counter()
+            for _ in range(REPEAT):
+                found = search_index.search(query)
+            cells.append(f"{(time.perf_counter() - started) * 1e6 / REPEAT:>7.0f}/{len(found):<3}")
+        print(f"{count:>7}{build_ms:>10.0f}" + "".join(f"{cell:>12}" for cell in cells))
+
+if __name__ == '__main__':
+    main()
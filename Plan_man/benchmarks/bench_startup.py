@@ -0,0 +1,106 @@
+# benchmarks/bench_startup.py
+# 시작 시간 측정: main.py를 불러오는 데 걸리는 시간(모듈별 내역)과 첫 화면 표시까지의 시간
+# 실행 방법 (Plan_man 폴더에서): python -m benchmarks.bench_startup [--target-ms 150]
+# 목표 시간을 넘으면 종료 코드 1을 반환하므로 회귀 확인에 사용할 수 있습니다.
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+
+PLAN_MAN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPORT_TARGET_MS = 150 # main.py import 시간 목표
+FIRST_PAINT_TARGET_MS = 500 # 첫 화면 표시 시간 목표
+TOP_N = 15
+RUNS = 5
+
+# 지연 로딩으로 시작 시 불러오지 않아야 하는 무거운 모듈
+DEFERRED_MODULES = ("tkcalendar", "requests", "lxml", "googleapiclient", "google_auth_oauthlib",
+                    "modules.news_fetcher", "modules.calendar_manager")
+
+_IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+def import_profile(code="import main"):
+    """python -X importtime 결과를 [(누적 시간(ms), 자체 시간(ms), 깊이, 모듈 이름)]으로 반환합니다."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            cwd=PLAN_MAN_DIR, capture_output=True, text=True, check=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((int(cumulative_us) / 1000, int(self_us) / 1000, (len(indent) - 1) // 2, name))
+    return rows
+
+def modules_under(rows, root_name):
+    """importtime 결과(후위 순서)에서 root_name과 그 아래에서 불러온 모듈만 골라냅니다."""
+    end = next(i for i, row in enumerate(rows) if row[3] == root_name and row[2] == 0)
+    start = end
+    while start > 0 and rows[start - 1][2] > 0:
+        start -= 1
+    return rows[start:end + 1]
+
+def measure_import(runs):
+    """main.py import 시간(ms)의 중앙값과 마지막 실행의 모듈별 내역을 반환합니다."""
+    totals = []
+    rows = []
+    for _ in range(runs):
+        rows = modules_under(import_profile(), "main")
+        totals.append(rows[-1][0])
+    totals.sort()
+    return totals[len(totals) // 2], rows
+
+def measure_first_paint(runs):
+    """
+    main.py --startup-probe를 실행하여 (앱이 측정한 첫 화면 시간, 프로세스 실행부터의 전체 시간) 중앙값을 반환합니다.
+    디스플레이가 없으면 None을 반환합니다.
+    """
+    app_times, wall_times = [], []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = subprocess.run([sys.executable, "main.py", "--startup-probe"],
+                                cwd=PLAN_MAN_DIR, capture_output=True, text=True, timeout=60)
+        wall_ms = (time.perf_counter() - started) * 1000
+        match = re.search(r"first_paint_ms=([\d.]+)", result.stdout)
+        if not match:
+            return None
+        app_times.append(float(match.group(1)))
+        wall_times.append(wall_ms)
+    app_times.sort()
+    wall_times.sort()
+    return app_times[len(app_times) // 2], wall_times[len(wall_times) // 2]
+
+def main():
+    parser = argparse.ArgumentParser(description="Plan Man 시작 시간 측정")
+    parser.add_argument("--target-ms", type=float, default=IMPORT_TARGET_MS, help="main.py import 시간 목표(ms)")
+    parser.add_argument("--paint-target-ms", type=float, default=FIRST_PAINT_TARGET_MS, help="첫 화면 표시 시간 목표(ms)")
+    parser.add_argument("--runs", type=int, default=RUNS)
+    args = parser.parse_args()
+
+    import_ms, rows = measure_import(args.runs)
+    print(f"main.py import: {import_ms:.1f}ms (목표 {args.target_ms:.0f}ms, {args.runs}회 중앙값)\n")
+    print(f"{'누적(ms)':>9}{'자체(ms)':>9}  모듈 (누적 시간 상위 {TOP_N}개)")
+    for cumulative, self_ms, depth, name in sorted(rows, reverse=True)[:TOP_N]:
+        print(f"{cumulative:>9.1f}{self_ms:>9.1f}  {'  ' * depth}{name}")
+
+    loaded = {name for _, _, _, name in rows}
+    eager = [name for name in DEFERRED_MODULES if name in loaded]
+    if eager:
+        print(f"\n경고: 시작 시 불러오지 않아야 할 모듈이 불러와졌습니다: {', '.join(eager)}")
+
+    failed = import_ms > args.target_ms or bool(eager)
+    paint = measure_first_paint(args.runs)
+    if paint is None:
+        print("\n첫 화면 표시 시간: 측정 불가 (디스플레이가 없음)")
+    else:
+        app_ms, wall_ms = paint
+        print(f"\n첫 화면 표시: {app_ms:.1f}ms (인터프리터 시작 포함 전체 {wall_ms:.1f}ms, 목표 {args.paint_target_ms:.0f}ms)")
+        failed = failed or app_ms > args.paint_target_ms
+
+    if failed:
+        print("\n시작 시간 목표를 넘었습니다.")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
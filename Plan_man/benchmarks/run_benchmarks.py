@@ -0,0 +1,316 @@
+# benchmarks/run_benchmarks.py
+# 로컬 스텁 서버(stub_servers.py)를 대상으로 news_fetcher, calendar_manager와
+# PlanManApp의 화면 없이 실행 가능한 부분을 측정합니다.
+# 실행 방법 (Plan_man 폴더에서):
+#   python -m benchmarks.run_benchmarks                       # 결과를 benchmarks/results/ 에 저장
+#   python -m benchmarks.run_benchmarks --compare 이전결과.json  # 이전 결과와 비교
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import tempfile
+import threading
+import time
+import tracemalloc
+import types
+import httplib2
+from googleapiclient.discovery import build
+from googleapiclient.http import BatchHttpRequest, HttpRequest
+from benchmarks.stub_servers import FakeCalendar, StubServer
+from modules import article_reader, calendar_manager, news_fetcher, weather_fetcher
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), 'results')
+FEED_SIZES = (15, 200, 2000)
+CALENDAR_EVENT_COUNT = 3000
+SUBSCRIBED_CALENDARS = 10 # 여러 캘린더 시나리오에서 구독 중인 캘린더 수
+BENCH_YEAR = datetime.date.today().year # 가짜 캘린더 일정의 연도 (전체 동기화 기간 안에 들도록 올해)
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def measure(name, func, iterations, setup=None):
+    """
+    func를 iterations번 실행하여 처리량, p50/p99 지연 시간, 최대 메모리 사용량을 측정합니다.
+    setup이 있으면 매 실행 전에 호출하며, 그 시간은 측정에서 제외합니다.
+    """
+    latencies = []
+    for i in range(iterations):
+        if setup:
+            setup(i)
+        started = time.perf_counter()
+        func(i)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    # 메모리는 별도로 한 번 더 실행하여 측정 (tracemalloc이 실행 속도를 늦추기 때문)
+    if setup:
+        setup(iterations)
+    tracemalloc.start()
+    func(iterations)
+    peak_kb = tracemalloc.get_traced_memory()[1] / 1024
+    tracemalloc.stop()
+
+    latencies.sort()
+    total_seconds = sum(latencies) / 1000
+    return {
+        "name": name,
+        "iterations": iterations,
+        "throughput_per_s": iterations / total_seconds if total_seconds else float("inf"),
+        "p50_ms": percentile(latencies, 0.50),
+        "p99_ms": percentile(latencies, 0.99),
+        "peak_kb": peak_kb,
+    }
+
+def use_stub_calendar_service(server):
+    """스텁 서버를 가리키는 캘린더 서비스를 만들어 calendar_manager가 인증 없이 사용하도록 바꿔 끼웁니다."""
+    local = threading.local()
+
+    def thread_http():
+        if not hasattr(local, 'http'):
+            local.http = httplib2.Http(timeout=10)
+        return local.http
+
+    service = build('calendar', 'v3', http=thread_http(), static_discovery=True,
+                    requestBuilder=lambda http, *args, **kwargs: HttpRequest(thread_http(), *args, **kwargs),
+                    client_options={'api_endpoint': server.base_url})
+    # 라이브러리는 api_endpoint와 관계없이 discovery 문서의 주소로 배치 요청을 보내므로 스텁 서버 주소를 직접 지정
+    batch_uri = f"{server.base_url}batch/calendar/v3"
+    service.new_batch_http_request = lambda callback=None: BatchHttpRequest(callback=callback, batch_uri=batch_uri)
+    calendar_manager.get_calendar_service = lambda: service
+
+def reset_event_store(work_dir, name):
+    """calendar_manager가 새 SQLite 파일을 사용하도록 합니다."""
+    with calendar_manager._db_lock:
+        if calendar_manager._db is not None:
+            calendar_manager._db.close()
+        calendar_manager._db = None
+        calendar_manager.EVENT_DB_FILE = os.path.join(work_dir, f"{name}.db")
+
+def bench_news(server, work_dir, iterations):
+    results = []
+    news_fetcher.FEED_CACHE_DIR = os.path.join(work_dir, 'feed_cache')
+
+    for size in FEED_SIZES:
+        # 캐시가 없는 첫 요청: URL마다 쿼리 문자열을 달리하여 매번 캐시를 비껴감
+        url = server.feed_url("rss", size)
+        news_fetcher.CATEGORY_RSS = {"bench": url}
+        results.append(measure(
+            f"news.cold_fetch[{size}]",
+            lambda i: news_fetcher._fetch_feed_items(f"{url}?cold={i}"),
+            iterations))
+
+    # 신선도 유지 시간 안의 요청: 네트워크 없이 디스크 캐시에서 읽음 (RSS 예시는 <ttl>10</ttl>)
+    url = server.feed_url("rss", 200)
+    news_fetcher._fetch_feed_items(url)
+    results.append(measure("news.fresh_cache_hit", lambda i: news_fetcher._fetch_feed_items(url), iterations))
+
+    # TTL이 지난 요청: 조건부 GET에 304 응답 (Atom 예시에는 <ttl>이 없으므로 기본 TTL을 0으로)
+    url = server.feed_url("atom", 200)
+    default_ttl = news_fetcher.DEFAULT_FEED_TTL
+    news_fetcher.DEFAULT_FEED_TTL = 0
+    try:
+        news_fetcher._fetch_feed_items(url)
+        results.append(measure("news.revalidate_304", lambda i: news_fetcher._fetch_feed_items(url), iterations))
+    finally:
+        news_fetcher.DEFAULT_FEED_TTL = default_ttl
+
+    # 5개 카테고리 병렬 가져오기 (매번 새 URL)
+    def point_categories(i):
+        news_fetcher.CATEGORY_RSS = {f"cat{n}": f"{server.feed_url('rss', 200)}?all={i}-{n}" for n in range(5)}
+        news_fetcher._news_cache.clear()
+    results.append(measure("news.fetch_all_categories", lambda i: news_fetcher.fetch_all_categories(),
+                           max(1, iterations // 2), setup=point_categories))
+    return results
+
+def bench_articles(server, work_dir, iterations):
+    """기사 열기: 캐시가 없을 때(요청 + 본문 추출)와 미리 가져온 기사를 디스크 캐시에서 열 때"""
+    results = []
+    article_reader._cache = article_reader.ArticleCache(os.path.join(work_dir, 'article_cache'))
+    results.append(measure("article.open_cold", lambda i: article_reader.get_article(server.article_url(i)),
+                           iterations))
+    results.append(measure("article.open_cached",
+                           lambda i: article_reader.get_cached_article(server.article_url(i % iterations)),
+                           iterations))
+    return results
+
+def bench_weather(server, work_dir, iterations):
+    """
+    날씨 예보: 캐시가 없을 때, 디스크 캐시만 있을 때(프로그램을 다시 시작한 경우), 메모리 캐시(화면을 다시 연 경우),
+    같은 지역을 8개 스레드가 동시에 요청할 때(요청 하나로 합쳐지는지)
+    """
+    results = []
+    weather_fetcher.WEATHER_CACHE_DIR = os.path.join(work_dir, 'weather_cache')
+    weather_fetcher.PROVIDERS["stub"] = weather_fetcher.OpenMeteoProvider(server.forecast_url)
+    weather_fetcher.WEATHER_PROVIDER = "stub"
+
+    def forget(memory_only):
+        def setup(i):
+            weather_fetcher._forecasts.clear()
+            if not memory_only:
+                shutil.rmtree(weather_fetcher.WEATHER_CACHE_DIR, ignore_errors=True)
+        return setup
+    location = weather_fetcher.DEFAULT_LOCATION
+    results.append(measure("weather.cold_fetch", lambda i: weather_fetcher.get_forecast(location), iterations,
+                           setup=forget(memory_only=False)))
+    results.append(measure("weather.disk_hit", lambda i: weather_fetcher.get_forecast(location), iterations,
+                           setup=forget(memory_only=True)))
+    requests_before = server.request_count
+    result = measure("weather.memory_hit", lambda i: weather_fetcher.get_forecast(location), iterations)
+    result["requests_per_call"] = (server.request_count - requests_before) / (iterations + 1)
+    results.append(result)
+
+    def concurrent_open(i):
+        threads = [threading.Thread(target=weather_fetcher.get_forecast, args=(location,)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    requests_before = server.request_count
+    result = measure("weather.concurrent_8", concurrent_open, iterations, setup=forget(memory_only=False))
+    result["requests_per_call"] = (server.request_count - requests_before) / (iterations + 1)
+    results.append(result)
+    return results
+
+def bench_calendar(server, calendar, work_dir, iterations):
+    results = []
+    use_stub_calendar_service(server)
+
+    # 동기화 전: 매번 API로 한 달치를 가져옴
+    reset_event_store(work_dir, "unsynced")
+    results.append(measure("calendar.month_api",
+                           lambda i: calendar_manager.get_events_for_month(BENCH_YEAR, i % 12 + 1), iterations))
+
+    # 전체 동기화 (매번 새 저장소)
+    results.append(measure("calendar.full_sync", lambda i: calendar_manager.sync_events(),
+                           max(1, iterations // 5), setup=lambda i: reset_event_store(work_dir, f"full{i}")))
+
+    # 증분 동기화: 일부 이벤트를 바꾼 뒤 변경분만 가져옴
+    reset_event_store(work_dir, "incremental")
+    calendar_manager.sync_events()
+    results.append(measure("calendar.incremental_sync", lambda i: calendar_manager.sync_events(),
+                           iterations, setup=lambda i: calendar.mutate()))
+
+    # 동기화 후: 로컬 저장소에서 한 달치 조회
+    results.append(measure("calendar.month_store",
+                           lambda i: calendar_manager.get_events_for_month(BENCH_YEAR, i % 12 + 1), iterations))
+    return results
+
+def bench_multi_calendar(work_dir, iterations):
+    """구독 캘린더 SUBSCRIBED_CALENDARS개의 한 달치를 가져오기 (캘린더마다 요청하지 않고 배치 요청 하나로)"""
+    calendars = {"primary": FakeCalendar(CALENDAR_EVENT_COUNT, start=datetime.date(BENCH_YEAR, 1, 1))}
+    for i in range(1, SUBSCRIBED_CALENDARS):
+        calendars[f"sub{i}@group.calendar.google.com"] = FakeCalendar(
+            300, start=datetime.date(BENCH_YEAR, 1, 1), summary=f"구독 {i}", color="#0b8043")
+    with StubServer(calendars=calendars) as server:
+        use_stub_calendar_service(server)
+        reset_event_store(work_dir, "multi")
+        calendar_manager.list_calendars(refresh=True)
+        requests_before = server.request_count
+        result = measure(f"calendar.month_api_{SUBSCRIBED_CALENDARS}_calendars",
+                         lambda i: calendar_manager.get_events_for_month(BENCH_YEAR, i % 12 + 1), iterations)
+        result["requests_per_call"] = (server.request_count - requests_before) / (iterations + 1)
+    calendar_manager._calendar_list = None # 다른 시나리오가 이 서버의 캘린더 목록을 쓰지 않도록 함
+    return [result]
+
+def bench_app(server, work_dir, iterations):
+    """PlanManApp의 월 이동 경로 (MonthCache + MonthPrefetcher, 화면 없이 실행 가능)"""
+    results = []
+    reset_event_store(work_dir, "app")
+    use_stub_calendar_service(server) # 동기화되지 않은 저장소: 월 이동마다 API 경로를 사용
+
+    def navigate(i):
+        prefetcher = calendar_manager.MonthPrefetcher(calendar_manager.MonthCache())
+        try:
+            for month in range(1, 13): # 한 달씩 앞으로 넘김
+                prefetcher.show(BENCH_YEAR, month).result()
+                time.sleep(0.01) # 사용자가 화면을 보는 짧은 시간 동안 인접 월을 미리 가져옴
+        finally:
+            prefetcher.shutdown()
+    results.append(measure("app.month_navigation_12", navigate, max(1, iterations // 5)))
+    return results
+
+def bench_marker_redraw(iterations):
+    """Tk 디스플레이가 있을 때만 실행: 달력 마커 갱신 (PlanManApp.update_event_markers)"""
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return [] # 디스플레이 없음
+    root.withdraw()
+    from tkcalendar import Calendar
+    from ui.interface import PlanManApp, EVENT_MARKER_TAGS, EVENT_MARKER_COLORS
+    from modules.event_model import Event, EventIndex
+    try:
+        cal = Calendar(root, selectmode='day', year=BENCH_YEAR, month=1, day=1)
+        for tag, (background, foreground) in zip(EVENT_MARKER_TAGS, EVENT_MARKER_COLORS):
+            cal.tag_config(tag, background=background, foreground=foreground)
+        # 달력 위젯과 마커 상태만 가진 객체로 화면 갱신 메소드를 실행
+        view = types.SimpleNamespace(cal=cal, monthly_events_cache=None, event_marker_ids={})
+        months = []
+        for m in range(1, 13):
+            day_starts = [datetime.datetime(BENCH_YEAR, m, d, 9) for d in range(1, 29) for _ in range(1 + (d + m) % 3)]
+            months.append(EventIndex(Event(f"{m}-{i}", start, start + datetime.timedelta(hours=1), False, "일정", "primary")
+                                     for i, start in enumerate(day_starts)))
+
+        def redraw(i):
+            view.monthly_events_cache = months[i % 12]
+            PlanManApp.update_event_markers(view, BENCH_YEAR, i % 12 + 1)
+        return [measure("ui.marker_redraw", redraw, iterations)]
+    finally:
+        root.destroy()
+
+def print_results(results, previous=None):
+    previous = {r["name"]: r for r in (previous or [])}
+    header = f"{'항목':<30}{'처리량(/s)':>12}{'p50(ms)':>10}{'p99(ms)':>10}{'메모리(KB)':>12}"
+    print(header + ("   p50 변화" if previous else ""))
+    for r in results:
+        line = (f"{r['name']:<30}{r['throughput_per_s']:>12.1f}{r['p50_ms']:>10.2f}"
+                f"{r['p99_ms']:>10.2f}{r['peak_kb']:>12.0f}")
+        before = previous.get(r["name"])
+        if before and before["p50_ms"]:
+            line += f"   {(r['p50_ms'] / before['p50_ms'] - 1) * 100:+.0f}%"
+        print(line)
+
+def main():
+    parser = argparse.ArgumentParser(description="Plan Man 벤치마크")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본: benchmarks/results/bench-<시각>.json)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    args = parser.parse_args()
+
+    calendar = FakeCalendar(CALENDAR_EVENT_COUNT, start=datetime.date(BENCH_YEAR, 1, 1))
+    work_dir = tempfile.mkdtemp(prefix="planman-bench-")
+    results = []
+    try:
+        with StubServer(calendars={"primary": calendar}) as server:
+            results += bench_news(server, work_dir, args.iterations)
+            results += bench_articles(server, work_dir, args.iterations)
+            results += bench_weather(server, work_dir, args.iterations)
+            results += bench_calendar(server, calendar, work_dir, args.iterations)
+            results += bench_multi_calendar(work_dir, args.iterations)
+            results += bench_app(server, work_dir, args.iterations)
+            results += bench_marker_redraw(args.iterations)
+    finally:
+        reset_event_store(work_dir, "closed")
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            previous = json.load(f)["results"]
+    print_results(results, previous)
+
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"bench-{datetime.datetime.now():%Y%m%d-%H%M%S}.json")
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({"created": datetime.datetime.now().isoformat(timespec="seconds"),
+                   "python": platform.python_version(), "platform": platform.platform(),
+                   "iterations": args.iterations, "results": results}, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output}")
+
+if __name__ == '__main__':
+    main()
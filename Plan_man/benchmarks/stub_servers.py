@@ -0,0 +1,309 @@
+# benchmarks/stub_servers.py
+# 실제 연합뉴스/전자신문/Google 서버 대신 사용하는 로컬 HTTP 서버
+# - /rss/<rss|atom>/<항목 수>: 예시 피드를 원하는 크기로 늘린 RSS/Atom 피드 (ETag, 304 지원)
+# - /calendars/<캘린더 ID>/events: Calendar API events.list 흉내 (pageToken, syncToken, 410 지원)
+# - /users/me/calendarList: calendarList.list 흉내
+# - POST /batch/calendar/v3: 위 요청들을 multipart/mixed로 묶은 배치 요청
+# - /article/<번호>: 메뉴, 광고, 댓글 사이에 본문이 있는 뉴스 기사 HTML
+# - POST /freeBusy: freebusy.query 흉내 (시각이 있는 이벤트만 바쁜 시간으로 봄)
+# - /v1/forecast: Open-Meteo 예보 API 흉내 (시간별 배열, 위경도로 정해지는 값)
+import datetime
+import email.parser
+import json
+import os
+import re
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, unquote
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+FEED_FIXTURES = {"rss": "rss_sample.xml", "atom": "atom_sample.xml"}
+DEFAULT_PAGE_SIZE = 250 # Calendar API의 maxResults 기본값
+CALENDAR_TZ = datetime.timezone(datetime.timedelta(hours=9)) # 스텁 캘린더의 시간대 (종일 이벤트의 날짜 기준)
+
+_feed_cache = {}
+
+def build_feed(file_name, item_count):
+    """예시 피드의 <item>/<entry>를 반복하여 원하는 항목 수의 피드(bytes)를 만듭니다."""
+    key = (file_name, item_count)
+    if key in _feed_cache:
+        return _feed_cache[key]
+    with open(os.path.join(FIXTURES_DIR, file_name), 'rb') as f:
+        data = f.read()
+    tag = b"item" if b"<item>" in data else b"entry"
+    blocks = re.findall(rb"\s*<%s>.*?</%s>" % (tag, tag), data, re.S)
+    head = data[:data.index(blocks[0])]
+    tail = data[data.index(blocks[-1]) + len(blocks[-1]):]
+    body = b"".join(blocks[i % len(blocks)] for i in range(item_count))
+    _feed_cache[key] = head + body + tail
+    return _feed_cache[key]
+
+ARTICLE_PARAGRAPHS = 12
+
+def build_article(number):
+    """본문 추출을 시험할 수 있도록 메뉴/관련 기사/댓글 영역을 섞은 기사 HTML(bytes)을 만듭니다."""
+    paragraphs = "".join(f"<p>기사 {number}의 {i + 1}번째 문단입니다. 본문 추출기가 이 문장을 찾아야 합니다.</p>"
+                         for i in range(ARTICLE_PARAGRAPHS))
+    page = f"""<!DOCTYPE html><html><head><meta charset="utf-8">
+<meta property="og:title" content="시험 기사 {number}"><title>시험 기사 {number} | 스텁 뉴스</title>
+<script>var tracker = "광고 추적 스크립트는 본문이 아닙니다";</script></head><body>
+<header><nav><ul><li><a href="/">홈</a></li><li><a href="/politics">정치</a></li></ul></nav></header>
+<div class="content"><h1>시험 기사 {number}</h1><div class="article-body">{paragraphs}</div>
+<div class="related-news"><p>관련 기사: 이 문단은 본문이 아니므로 추출 결과에 들어가면 안 됩니다.</p></div>
+<div id="comments"><p>댓글: 좋은 기사 감사합니다. 이 문단도 본문이 아닙니다.</p></div></div>
+<footer><p>Copyright 스텁 뉴스. 무단 전재 및 재배포 금지.</p></footer></body></html>"""
+    return page.encode("utf-8")
+
+def build_forecast(latitude, longitude, days):
+    """Open-Meteo 형식(timeformat=unixtime)의 시간별 예보 JSON(bytes)을 오늘 0시(UTC)부터 days일치 만듭니다."""
+    start = int(datetime.datetime.combine(datetime.date.today(), datetime.time(),
+                                          tzinfo=datetime.timezone.utc).timestamp())
+    hours = range(days * 24)
+    seed = int(abs(latitude * 100 + longitude * 10))
+    codes = (0, 1, 2, 3, 45, 61, 80, 95)
+    data = {
+        "latitude": latitude, "longitude": longitude, "utc_offset_seconds": 0,
+        "hourly_units": {"time": "unixtime", "temperature_2m": "°C", "precipitation": "mm", "weather_code": "wmo code"},
+        "hourly": {
+            "time": [start + hour * 3600 for hour in hours],
+            "temperature_2m": [round(10 + 8 * ((hour + seed) % 24 - 12) / 12, 1) for hour in hours],
+            "precipitation": [round(((hour * 7 + seed) % 10) / 10, 1) if (hour + seed) % 5 == 0 else 0.0 for hour in hours],
+            "weather_code": [codes[(hour // 6 + seed) % len(codes)] for hour in hours],
+        },
+    }
+    return json.dumps(data).encode("utf-8")
+
+class FakeCalendar:
+    """
+    Calendar API의 이벤트 목록을 메모리에 흉내 냅니다.
+    이벤트가 바뀔 때마다 버전이 올라가며, syncToken은 그 시점의 버전을 담습니다.
+    """
+    def __init__(self, event_count, start=datetime.date(2025, 1, 1), days=365, summary="캘린더", color="#4285f4"):
+        self.summary = summary
+        self.color = color
+        self.version = 0
+        self.events = {} # {이벤트 ID: (변경 버전, 이벤트 딕셔너리)}
+        self._lock = threading.Lock()
+        for i in range(event_count):
+            day = start + datetime.timedelta(days=(i * 7919) % days) # 날짜를 고르게 흩뜨림
+            self._put(self._make_event(f"ev{i}", day, i))
+
+    @staticmethod
+    def _make_event(event_id, day, seed):
+        if seed % 5 == 0: # 종일 이벤트 (일부는 여러 날, Google Calendar 화면의 기본값처럼 '한가함')
+            return {"id": event_id, "status": "confirmed", "summary": f"종일 일정 {seed}", "transparency": "transparent",
+                    "start": {"date": day.isoformat()},
+                    "end": {"date": (day + datetime.timedelta(days=1 + seed % 3)).isoformat()}}
+        hour = 8 + seed % 10
+        return {"id": event_id, "status": "confirmed", "summary": f"회의 {seed}",
+                "start": {"dateTime": f"{day.isoformat()}T{hour:02d}:00:00+09:00"},
+                "end": {"dateTime": f"{day.isoformat()}T{hour + 1:02d}:00:00+09:00"}}
+
+    def _put(self, event):
+        self.version += 1
+        self.events[event["id"]] = (self.version, event)
+
+    def mutate(self, changed=10, deleted=5):
+        """일부 이벤트를 바꾸고 지워서 증분 동기화를 흉내 낼 수 있게 합니다."""
+        with self._lock:
+            ids = sorted(event_id for event_id, (_, ev) in self.events.items() if ev["status"] != "cancelled")
+            for event_id in ids[:changed]:
+                event = dict(self.events[event_id][1], summary=f"변경된 일정 {event_id}")
+                self._put(event)
+            for event_id in ids[changed:changed + deleted]:
+                self._put({"id": event_id, "status": "cancelled"})
+
+    def list(self, params):
+        """events.list 요청 파라미터를 받아 (HTTP 상태 코드, 응답 딕셔너리)를 반환합니다."""
+        with self._lock:
+            sync_token = params.get("syncToken")
+            if sync_token:
+                if not sync_token.startswith("v") or int(sync_token[1:]) > self.version:
+                    return 410, {"error": {"code": 410, "message": "Sync token is no longer valid."}}
+                since = int(sync_token[1:])
+                matched = [ev for ver, ev in self.events.values() if ver > since]
+            else:
+                matched = [ev for _, ev in self.events.values() if ev["status"] != "cancelled"]
+                time_min = self._parse_time(params.get("timeMin"))
+                time_max = self._parse_time(params.get("timeMax"))
+                if time_min or time_max:
+                    matched = [ev for ev in matched if self._overlaps(ev, time_min, time_max)]
+            if params.get("orderBy") == "startTime":
+                matched.sort(key=lambda ev: ev["start"].get("dateTime", ev["start"].get("date")))
+            version = self.version
+
+        page_size = int(params.get("maxResults", DEFAULT_PAGE_SIZE))
+        offset = int(params.get("pageToken", 0) or 0)
+        page = matched[offset:offset + page_size]
+        result = {"kind": "calendar#events", "items": page}
+        if offset + page_size < len(matched):
+            result["nextPageToken"] = str(offset + page_size)
+        else:
+            result["nextSyncToken"] = f"v{version}"
+        return 200, result
+
+    def busy(self, time_min, time_max):
+        """[time_min, time_max) (aware datetime)와 겹치는 시각이 있는 이벤트의 바쁜 시간 리스트 (UTC 문자열)"""
+        with self._lock:
+            events = [ev for _, ev in self.events.values()
+                      if ev["status"] != "cancelled" and ev.get("transparency") != "transparent"]
+        busy = []
+        for event in events:
+            start = self._moment(event["start"]).astimezone(datetime.timezone.utc)
+            end = self._moment(event["end"]).astimezone(datetime.timezone.utc)
+            if start < time_max and end > time_min:
+                busy.append((start, end))
+        return [{"start": f"{start:%Y-%m-%dT%H:%M:%SZ}", "end": f"{end:%Y-%m-%dT%H:%M:%SZ}"}
+                for start, end in sorted(busy)]
+
+    @staticmethod
+    def _parse_time(text):
+        return datetime.datetime.fromisoformat(text.replace("Z", "+00:00")) if text else None
+
+    @staticmethod
+    def _moment(time_info):
+        """이벤트의 start/end를 aware datetime으로 (종일 이벤트는 캘린더 시간대의 0시)"""
+        if "dateTime" in time_info:
+            return datetime.datetime.fromisoformat(time_info["dateTime"])
+        return datetime.datetime.combine(datetime.date.fromisoformat(time_info["date"]), datetime.time(),
+                                         CALENDAR_TZ)
+
+    @classmethod
+    def _overlaps(cls, event, time_min, time_max):
+        # 실제 API처럼 [timeMin, timeMax)와 시간이 겹치는 이벤트만
+        return ((not time_max or cls._moment(event["start"]) < time_max)
+                and (not time_min or cls._moment(event["end"]) > time_min))
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1" # keep-alive 연결 재사용을 측정할 수 있도록 함
+    disable_nagle_algorithm = True # 헤더와 본문을 나눠 보낼 때 생기는 지연(약 40ms)이 측정에 섞이지 않도록 함
+
+    def do_GET(self):
+        self.server.request_count += 1
+        self._send(*self._route(self.path, self.headers))
+
+    def do_POST(self):
+        self.server.request_count += 1
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if urlparse(self.path).path.rstrip("/") != "/batch/calendar/v3":
+            self._send(*self._route(self.path, self.headers, body))
+            return
+        # 배치 요청: 각 부분(application/http)을 따로 처리하여 같은 Content-ID로 응답
+        message = email.parser.BytesParser().parsebytes(
+            b"Content-Type: " + self.headers["Content-Type"].encode() + b"\r\n\r\n" + body)
+        boundary = "batch_stub_boundary"
+        out = []
+        for part in message.get_payload():
+            request_line, _, rest = part.get_payload().replace("\r\n", "\n").partition("\n")
+            header_text, _, request_body = rest.partition("\n\n")
+            headers = email.parser.Parser().parsestr(header_text)
+            status, part_body, content_type, _ = self._route(request_line.split()[1], headers,
+                                                             request_body.strip().encode("utf-8"))
+            content_id = " ".join(part["Content-ID"].split()).replace("<", "<response-", 1) # 접힌 헤더 줄 펼침
+            out.append(f"--{boundary}\r\nContent-Type: application/http\r\nContent-ID: {content_id}\r\n\r\n"
+                       f"HTTP/1.1 {status} OK\r\nContent-Type: {content_type}\r\n\r\n".encode() + part_body + b"\r\n")
+        out.append(f"--{boundary}--\r\n".encode())
+        self._send(200, b"".join(out), f"multipart/mixed; boundary={boundary}")
+
+    def _route(self, path, headers, body=b""):
+        """요청 경로(POST이면 본문 포함)를 처리하여 (상태 코드, 본문, Content-Type, 추가 헤더)를 반환합니다."""
+        server = self.server
+        url = urlparse(path)
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+        parts = [unquote(p) for p in url.path.strip("/").split("/")]
+
+        if len(parts) == 3 and parts[0] == "rss" and parts[1] in FEED_FIXTURES:
+            body = build_feed(FEED_FIXTURES[parts[1]], int(parts[2]))
+            etag = f'"{parts[1]}-{parts[2]}"'
+            if headers.get("If-None-Match") == etag:
+                return 304, b"", None, {"ETag": etag}
+            return 200, body, "application/rss+xml; charset=utf-8", {"ETag": etag}
+        if len(parts) == 2 and parts[0] == "article" and parts[1].isdigit():
+            return 200, build_article(int(parts[1])), "text/html; charset=utf-8", {}
+        if parts == ["v1", "forecast"]:
+            return 200, build_forecast(float(params["latitude"]), float(params["longitude"]),
+                                       int(params.get("forecast_days", 7))), "application/json", {}
+        if parts == ["freeBusy"] and body:
+            query = json.loads(body)
+            time_min = datetime.datetime.fromisoformat(query["timeMin"].replace("Z", "+00:00"))
+            time_max = datetime.datetime.fromisoformat(query["timeMax"].replace("Z", "+00:00"))
+            result = {}
+            for item in query.get("items", []):
+                calendar = server.calendars.get(item["id"])
+                if calendar is None:
+                    result[item["id"]] = {"errors": [{"domain": "global", "reason": "notFound"}], "busy": []}
+                else:
+                    result[item["id"]] = {"busy": calendar.busy(time_min, time_max)}
+            return self._json(200, {"kind": "calendar#freeBusy", "timeMin": query["timeMin"],
+                                    "timeMax": query["timeMax"], "calendars": result})
+        if parts == ["users", "me", "calendarList"]:
+            items = [{"id": calendar_id, "summary": calendar.summary, "backgroundColor": calendar.color,
+                      "primary": index == 0, "selected": True}
+                     for index, (calendar_id, calendar) in enumerate(server.calendars.items())]
+            return self._json(200, {"kind": "calendar#calendarList", "items": items})
+        if len(parts) == 3 and parts[0] == "calendars" and parts[2] == "events":
+            calendar = server.calendars.get(parts[1])
+            if calendar is not None:
+                return self._json(*calendar.list(params))
+        return self._json(404, {"error": {"code": 404, "message": "Not Found"}})
+
+    @staticmethod
+    def _json(status, data):
+        return status, json.dumps(data, ensure_ascii=False).encode("utf-8"), "application/json; charset=utf-8", {}
+
+    def _send(self, status, body, content_type=None, headers=None):
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass # 벤치마크 출력이 섞이지 않도록 접근 로그를 끔
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # 스트리밍 파서가 필요한 항목만 읽고 연결을 닫으면 발생하는 오류는 정상 동작이므로 무시
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+class StubServer:
+    """로컬 스텁 서버를 백그라운드 스레드에서 실행합니다. with 문으로 사용할 수 있습니다."""
+    def __init__(self, calendars=None):
+        self.httpd = _QuietHTTPServer(("127.0.0.1", 0), _StubHandler)
+        self.httpd.calendars = calendars or {}
+        self.httpd.request_count = 0
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.httpd.server_port}/"
+
+    @property
+    def request_count(self):
+        return self.httpd.request_count
+
+    def feed_url(self, feed_type, item_count):
+        return f"{self.base_url}rss/{feed_type}/{item_count}"
+
+    def article_url(self, number):
+        return f"{self.base_url}article/{number}"
+
+    @property
+    def forecast_url(self):
+        return f"{self.base_url}v1/forecast"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        return False
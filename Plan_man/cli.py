@@ -0,0 +1,199 @@
+# cli.py
+# 화면(Tk) 없이 사용하는 명령줄 도구
+# 실행 방법:
+#   python cli.py <명령> ...            (Plan_man 폴더에서)
+#   python -m Plan_man <명령> ...       (상위 폴더에서)
+# 명령:
+#   events     기간의 일정을 JSON Lines 또는 ICS로 내보내기
+#   calendars  구독 중인 캘린더 목록
+#   news       뉴스 카테고리별 항목 출력 (--timeline: 모든 카테고리를 발행 시각 순으로 합쳐 출력)
+#   warm       일정 저장소와 피드 캐시를 최신 상태로 유지 (cron에서는 --once, 그 외에는 데몬으로 실행)
+from core import metrics
+import argparse
+import datetime
+import json
+import logging
+import os
+import signal
+import sys
+import threading
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__)) # token.json, events.db, feed_cache가 있는 폴더 (GUI와 같은 곳)
+WARM_INTERVAL = 5 * 60 # warm 명령의 기본 갱신 간격(초)
+
+logger = logging.getLogger("planman.cli")
+
+def _parse_date(text):
+    try:
+        return datetime.date.fromisoformat(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"날짜는 YYYY-MM-DD 형식이어야 합니다: {text}")
+
+def _calendar_ids(requested):
+    """--calendar로 지정한 캘린더, 없으면 구독 중인 모든 캘린더의 ID 리스트"""
+    if requested:
+        return requested
+    from modules import calendar_manager
+    return [calendar["id"] for calendar in calendar_manager.list_calendars()]
+
+def cmd_events(args):
+    from modules import calendar_manager, event_export
+    if args.end <= args.start:
+        print("끝 날짜는 시작 날짜보다 뒤여야 합니다.", file=sys.stderr)
+        return 1
+    calendars = _calendar_ids(args.calendar)
+    events = calendar_manager.iter_events(args.start, args.end, calendars=calendars)
+    write = event_export.WRITERS[args.format]
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as out: # ICS의 CRLF를 그대로 씀
+            count = write(events, out)
+    else:
+        count = write(events, sys.stdout)
+    logger.info("일정 %d개를 내보냈습니다. (캘린더 %d개)", count, len(calendars))
+    return 0
+
+def cmd_calendars(args):
+    from modules import calendar_manager
+    for calendar in calendar_manager.list_calendars(refresh=True):
+        mark = "*" if calendar["primary"] else " "
+        print(f"{mark} {calendar['id']}\t{calendar['color']}\t{calendar['summary']}")
+    return 0
+
+def cmd_news(args):
+    from modules import news_fetcher
+    categories = args.category or list(news_fetcher.CATEGORY_RSS)
+    unknown = [category for category in categories if category not in news_fetcher.CATEGORY_RSS]
+    if unknown:
+        print(f"알 수 없는 카테고리: {', '.join(unknown)} (가능: {', '.join(news_fetcher.CATEGORY_RSS)})", file=sys.stderr)
+        return 1
+    if args.category:
+        # get_cached_news_items는 결과를 타임라인에도 반영함
+        results = {category: news_fetcher.get_cached_news_items(category) for category in categories}
+    else:
+        results = news_fetcher.fetch_all_categories()
+    if args.timeline:
+        return _print_timeline(args, results)
+
+    failed = False
+    for category in categories:
+        items = results[category]
+        failed = failed or news_fetcher.is_error_result(items)
+        if args.format == "jsonl":
+            for item in items:
+                print(json.dumps({"category": category, **item}, ensure_ascii=False))
+        else:
+            print(f"\n--- {category} 뉴스 ---")
+            for item in items:
+                print(f"  {item['title']} ({item['link']})")
+    return 1 if failed else 0
+
+def _print_timeline(args, results):
+    from modules import news_fetcher
+    page = news_fetcher.get_timeline_page(args.page, args.page_size)
+    for item in page["items"]:
+        if args.format == "jsonl":
+            print(json.dumps(item, ensure_ascii=False))
+        else:
+            published = (datetime.datetime.fromtimestamp(item["published"]).strftime("%m-%d %H:%M")
+                         if item.get("published") else "--")
+            print(f"  {published} [{item['category']}] {item['title']} ({item['link']})")
+    if page["has_more"]:
+        logger.info("다음 페이지가 있습니다. (--page %d)", args.page + 1)
+    return 1 if any(news_fetcher.is_error_result(items) for items in results.values()) else 0
+
+def warm_caches():
+    """일정 저장소를 동기화하고 모든 뉴스 피드 캐시를 갱신합니다. 문제가 없으면 True를 반환합니다."""
+    from modules import calendar_manager, news_fetcher
+    ok = True
+    with metrics.span("cli.warm"):
+        sync_results = calendar_manager.sync_all_calendars()
+        if "error" in sync_results:
+            logger.warning("일정 동기화 실패: %s", sync_results["error"])
+            ok = False
+        for calendar_id, result in sync_results.items():
+            if isinstance(result, dict) and "error" in result:
+                logger.warning("일정 동기화 실패 (%s): %s", calendar_id, result["error"])
+                ok = False
+            elif isinstance(result, dict):
+                logger.info("일정 동기화 (%s): 변경 %d개, 삭제 %d개", calendar_id, result["updated"], result["deleted"])
+        for category, items in news_fetcher.fetch_all_categories().items():
+            if news_fetcher.is_error_result(items):
+                logger.warning("뉴스 캐시 갱신 실패 (%s): %s", category, items[0]["title"] if items else "")
+                ok = False
+    return ok
+
+def cmd_warm(args):
+    if args.once:
+        return 0 if warm_caches() else 1
+
+    stop = threading.Event()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signal_number, lambda *_: stop.set())
+    logger.info("캐시 유지 시작 (간격 %d초)", args.interval)
+    while not stop.is_set():
+        warm_caches()
+        stop.wait(args.interval)
+    logger.info("캐시 유지 종료")
+    return 0
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="planman", description="Plan Man 명령줄 도구 (화면 없이 실행)")
+    parser.add_argument("--data-dir", default=DATA_DIR,
+                        help="token.json, events.db, feed_cache가 있는 폴더 (기본: GUI와 같은 Plan_man 폴더)")
+    parser.add_argument("--metrics", action="store_true", help="구간별 소요 시간과 카운터를 기록하고 종료 시 stderr로 출력")
+    parser.add_argument("--log-level", default=os.environ.get("PLANMAN_LOG_LEVEL", "WARNING"),
+                        help="로그 수준 (DEBUG, INFO, WARNING, ...)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    events = commands.add_parser("events", help="기간의 일정을 JSON Lines 또는 ICS로 내보내기")
+    events.add_argument("--start", type=_parse_date, required=True, help="시작 날짜 (YYYY-MM-DD)")
+    events.add_argument("--end", type=_parse_date, required=True, help="끝 날짜 (YYYY-MM-DD, 이 날은 포함하지 않음)")
+    events.add_argument("--calendar", action="append", help="캘린더 ID (여러 번 지정 가능, 기본: 구독 중인 모든 캘린더)")
+    events.add_argument("--format", choices=("jsonl", "ics"), default="jsonl")
+    events.add_argument("--output", "-o", help="저장할 파일 (기본: 표준 출력)")
+    events.set_defaults(func=cmd_events)
+
+    calendars = commands.add_parser("calendars", help="구독 중인 캘린더 목록 (* 표시는 기본 캘린더)")
+    calendars.set_defaults(func=cmd_calendars)
+
+    news = commands.add_parser("news", help="뉴스 카테고리별 항목 출력")
+    news.add_argument("--category", action="append", help="카테고리 (여러 번 지정 가능, 기본: 전체)")
+    news.add_argument("--format", choices=("text", "jsonl"), default="text")
+    news.add_argument("--timeline", action="store_true", help="카테고리를 나누지 않고 발행 시각 순으로 합쳐 출력 (중복 기사 제거)")
+    news.add_argument("--page", type=int, default=0, help="--timeline의 페이지 번호 (0부터)")
+    news.add_argument("--page-size", type=int, default=20, help="--timeline의 페이지당 항목 수")
+    news.set_defaults(func=cmd_news)
+
+    warm = commands.add_parser("warm", help="일정 저장소와 피드 캐시를 최신 상태로 유지")
+    warm.add_argument("--once", action="store_true", help="한 번만 갱신하고 종료 (cron에서 사용)")
+    warm.add_argument("--interval", type=int, default=WARM_INTERVAL, help="갱신 간격(초)")
+    warm.set_defaults(func=cmd_warm)
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level.upper(), format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    if args.metrics:
+        metrics.enable()
+    if getattr(args, "output", None):
+        args.output = os.path.abspath(args.output) # 데이터 폴더로 이동하기 전의 위치 기준
+    os.chdir(args.data_dir) # 모듈들은 데이터 파일을 현재 폴더 기준으로 찾음
+
+    try:
+        return args.func(args)
+    except ConnectionError as e: # Google Calendar 서비스에 연결할 수 없음 (인증 실패 등)
+        print(e, file=sys.stderr)
+        return 1
+    except BrokenPipeError: # 출력을 head 등으로 넘기다 끊긴 경우
+        sys.stderr.close()
+        return 0
+    except Exception as e:
+        logger.debug("명령 실행 중 오류 발생", exc_info=True)
+        print(f"오류: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if metrics.is_enabled():
+            print(metrics.format_report(), file=sys.stderr)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,52 +1,202 @@
 # core/google_auth.py
+# 인증 정보 관리: 토큰 새로고침은 하나의 잠금으로 직렬화하고, 만료되기 전에 백그라운드 스레드에서 미리 새로고침합니다.
+# token.json은 토큰이 실제로 바뀐 경우에만 원자적으로(임시 파일 + os.replace) 다시 씁니다.
+import datetime
+import json
+import logging
 import os.path
+import random
+import threading
+import google_auth_httplib2
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.http import HttpRequest
+from core import metrics
+
+logger = logging.getLogger(__name__)
 
 # 이 SCOPES를 수정하면 token.json 파일을 삭제해야 합니다.
 SCOPES = ['https://www.googleapis.com/auth/calendar.readonly'] # 읽기 전용 범위
 CREDENTIALS_FILE = 'credentials.json'  # API 인증 정보 파일 경로
 TOKEN_FILE = 'token.json'  # 생성된 토큰 저장 파일 경로
+HTTP_TIMEOUT = 10 # API 요청 타임아웃(초)
+REFRESH_AHEAD = 5 * 60 # 만료 몇 초 전에 백그라운드에서 미리 새로고침할지
+REFRESH_RETRY_DELAY = 15 # 새로고침 실패 시 첫 재시도 대기(초), 실패할 때마다 두 배로 늘림
+REFRESH_RETRY_MAX = 5 * 60 # 재시도 대기의 최댓값(초)
+REFRESH_MIN_WAIT = 30 # 새로고침 사이의 최소 대기(초): 토큰 수명이 REFRESH_AHEAD보다 짧아도 쉬지 않고 새로고침하지 않도록 함
 
-def get_calendar_service():
-    """구글 캘린더 API의 기본 사용법을 보여줍니다.
-    사용자 캘린더에서 다음 10개 이벤트의 시작 시간과 이름을 출력합니다.
-    성공 시 calendar service 객체를, 실패 시 None을 반환합니다.
+# 한 번 만든 캘린더 서비스 객체를 프로세스 전체에서 재사용
+_service = None
+_credentials = None
+_service_lock = threading.Lock()
+_thread_local = threading.local() # 스레드별 AuthorizedHttp (httplib2.Http는 스레드 안전하지 않음)
+_refresh_lock = threading.Lock() # 모든 스레드의 토큰 새로고침과 token.json 쓰기를 직렬화
+_saved_token_json = None # 마지막으로 token.json에 저장된(또는 읽은) 내용
+_refresh_thread = None
+_refresh_stop = threading.Event()
+
+class _ManagedCredentials(Credentials):
+    """
+    새로고침을 _refresh_lock으로 직렬화하는 인증 정보입니다.
+    여러 스레드가 동시에 새로고침을 요청하면 하나만 실제로 새로고침하고, 나머지는 그 결과를 그대로 사용합니다.
+    새로고침으로 토큰이 바뀌면 token.json에 저장합니다.
+    """
+    def refresh(self, request):
+        token_before = self.token
+        with _refresh_lock:
+            if self.token != token_before and self.valid:
+                return # 잠금을 기다리는 동안 다른 스레드가 이미 새로고침함
+            with metrics.span("auth.refresh"):
+                super().refresh(request)
+            _save_token(self)
+
+def _save_token(creds):
+    """토큰이 마지막으로 저장한 내용과 다를 때만 token.json을 원자적으로 다시 씁니다. (_refresh_lock 안에서 호출)"""
+    global _saved_token_json
+    data = creds.to_json()
+    if data == _saved_token_json:
+        return
+    temp_path = f"{TOKEN_FILE}.tmp"
+    # 토큰에는 비밀 값이 있으므로 소유자만 읽을 수 있게 만듦
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w') as token:
+        token.write(data)
+    os.replace(temp_path, TOKEN_FILE) # 쓰는 도중 종료되어도 이전 token.json이 그대로 남음
+    _saved_token_json = data
+    metrics.incr("auth.token_saved")
+
+def _seconds_until_refresh(creds):
+    """백그라운드 새로고침까지 남은 시간(초). 만료 시각을 모르면 None"""
+    if creds.expiry is None:
+        return None
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None) # expiry는 시간대 없는 UTC 시각
+    return (creds.expiry - now).total_seconds() - REFRESH_AHEAD
+
+def _background_refresh_loop(creds):
+    failures = 0
+    while True:
+        if failures:
+            # 실패가 이어지면 대기 시간을 늘리고, 여러 프로세스가 같은 순간에 몰리지 않도록 흩뜨림
+            delay = min(REFRESH_RETRY_MAX, REFRESH_RETRY_DELAY * 2 ** (failures - 1))
+            wait = delay * random.uniform(0.5, 1.0)
+        else:
+            wait = _seconds_until_refresh(creds)
+            if wait is None:
+                return # 만료 시각이 없는 토큰은 새로고침할 필요 없음
+            wait = max(REFRESH_MIN_WAIT, wait)
+        if _refresh_stop.wait(wait):
+            return
+        if not creds.refresh_token:
+            return
+        try:
+            creds.refresh(Request())
+            failures = 0
+            logger.debug("토큰을 미리 새로고침했습니다. (만료: %s UTC)", creds.expiry)
+        except Exception as e:
+            failures += 1
+            logger.warning("토큰 백그라운드 새로고침 실패 (%d회째): %s", failures, e)
+
+def start_background_refresh(creds):
+    """토큰이 만료되기 REFRESH_AHEAD초 전에 미리 새로고침하는 스레드를 시작합니다. (이미 실행 중이면 무시)"""
+    global _refresh_thread
+    if _refresh_thread is not None and _refresh_thread.is_alive():
+        return
+    _refresh_stop.clear()
+    _refresh_thread = threading.Thread(target=_background_refresh_loop, args=(creds,),
+                                       name="token-refresh", daemon=True)
+    _refresh_thread.start()
+
+def stop_background_refresh():
+    _refresh_stop.set()
+    if _refresh_thread is not None:
+        _refresh_thread.join(timeout=1)
+
+def _load_credentials():
     """
+    token.json에서 인증 정보를 읽고, 필요하면 새로고침하거나 사용자 로그인을 진행합니다.
+    성공 시 Credentials 객체(_ManagedCredentials)를, 실패 시 None을 반환합니다.
+    """
+    global _saved_token_json
     creds = None
     # token.json 파일은 사용자의 액세스 및 새로고침 토큰을 저장하며,
     # 인증 흐름이 처음 완료될 때 자동으로 생성됩니다.
     if os.path.exists(TOKEN_FILE):
-        creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
+        creds = _ManagedCredentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
+        with _refresh_lock:
+            _saved_token_json = creds.to_json() # 토큰이 바뀌지 않으면 다시 쓰지 않도록 기준으로 삼음
 
     # 유효한 인증 정보가 없으면 사용자가 로그인하도록 합니다.
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
             try:
-                creds.refresh(Request())
+                creds.refresh(Request()) # 토큰이 바뀌면 refresh 안에서 저장됨
+                return creds
             except Exception as e:
-                print(f"토큰 새로고침 실패: {e}")
+                logger.warning("토큰 새로고침 실패: %s", e)
                 # 새로고침 실패 시 재인증으로 대체
                 flow = InstalledAppFlow.from_client_secrets_file(CREDENTIALS_FILE, SCOPES)
                 creds = flow.run_local_server(port=0) # 사용 가능한 포트에서 로컬 서버 실행
         else:
             if not os.path.exists(CREDENTIALS_FILE):
-                print(f"오류: {CREDENTIALS_FILE} 파일을 찾을 수 없습니다. Google Cloud Console에서 다운로드하세요.")
+                logger.error("%s 파일을 찾을 수 없습니다. Google Cloud Console에서 다운로드하세요.", CREDENTIALS_FILE)
                 return None
             flow = InstalledAppFlow.from_client_secrets_file(CREDENTIALS_FILE, SCOPES)
             creds = flow.run_local_server(port=0)
+        # 로그인 흐름이 만든 인증 정보도 같은 방식으로 새로고침되도록 변환
+        creds = _ManagedCredentials.from_authorized_user_info(json.loads(creds.to_json()), SCOPES)
         # 다음 실행을 위해 인증 정보를 저장합니다.
-        with open(TOKEN_FILE, 'w') as token:
-            token.write(creds.to_json())
-
-    try:
-        service = build('calendar', 'v3', credentials=creds)
-        return service
-    except Exception as e:
-        print(f"캘린더 서비스 빌드 중 오류 발생: {e}")
-        return None
+        with _refresh_lock:
+            _save_token(creds)
+    return creds
+
+def get_authorized_http():
+    """
+    현재 스레드에서 사용할 인증된 HTTP 전송 객체를 반환합니다.
+    스레드마다 한 번만 만들어 연결을 계속 재사용하며, 인증 정보는 모든 스레드가 공유합니다.
+    """
+    http = getattr(_thread_local, 'http', None)
+    if http is None or http.credentials is not _credentials:
+        http = google_auth_httplib2.AuthorizedHttp(_credentials, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+        _thread_local.http = http
+    return http
+
+def _build_request(http, *args, **kwargs):
+    # 서비스 객체는 스레드 간에 공유하고, 실제 요청은 호출한 스레드의 HTTP 전송 객체로 보냄
+    return HttpRequest(get_authorized_http(), *args, **kwargs)
+
+def get_calendar_service():
+    """
+    구글 캘린더 API 서비스 객체를 반환합니다.
+    처음 호출할 때 한 번만 인증하고 서비스를 만들며, 이후에는 같은 객체를 재사용합니다. (스레드 안전)
+    discovery 문서는 라이브러리에 포함된 정적 문서를 사용하므로 discovery 요청이 발생하지 않습니다.
+    성공 시 calendar service 객체를, 실패 시 None을 반환합니다.
+    """
+    global _service, _credentials
+    if _service is not None:
+        return _service
+
+    with _service_lock:
+        if _service is not None: # 잠금을 기다리는 동안 다른 스레드가 이미 만든 경우
+            return _service
+
+        with metrics.span("auth.load_credentials"):
+            creds = _load_credentials()
+        if not creds:
+            return None
+        _credentials = creds
+        start_background_refresh(creds) # 이후 요청은 토큰 새로고침을 기다리지 않음
+
+        try:
+            with metrics.span("calendar.service_build"):
+                _service = build('calendar', 'v3', http=get_authorized_http(), requestBuilder=_build_request,
+                                 static_discovery=True, cache_discovery=False)
+            return _service
+        except Exception as e:
+            logger.error("캘린더 서비스 빌드 중 오류 발생: %s", e)
+            return None
 
 if __name__ == '__main__':
     # 이 스크립트를 직접 실행하여 인증 흐름을 테스트합니다.
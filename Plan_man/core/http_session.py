@@ -0,0 +1,96 @@
+# core/http_session.py
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+POOL_CONNECTIONS = 10 # 연결 풀을 유지할 호스트 수
+POOL_MAXSIZE = 10 # 호스트별로 유지할 최대 연결 수 (동시 요청 수 이상이어야 함)
+RETRY_TOTAL = 2 # 일시적인 오류에 대한 재시도 횟수
+RETRY_BACKOFF = 0.3 # 재시도 간격 (0.3초, 0.6초, ...)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_session = None
+_session_lock = threading.Lock()
+
+# 연결 재사용률 확인을 위한 카운터
+_stats = {"connections_opened": 0, "requests": 0}
+_stats_lock = threading.Lock()
+
+def _count(key):
+    with _stats_lock:
+        _stats[key] += 1
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    """새 연결 생성과 요청 횟수를 세는 연결 풀"""
+    def _new_conn(self):
+        _count("connections_opened")
+        return super()._new_conn()
+
+    def _make_request(self, *args, **kwargs):
+        _count("requests")
+        return super()._make_request(*args, **kwargs)
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        _count("connections_opened")
+        return super()._new_conn()
+
+    def _make_request(self, *args, **kwargs):
+        _count("requests")
+        return super()._make_request(*args, **kwargs)
+
+class _PooledAdapter(HTTPAdapter):
+    """연결 풀에 카운터가 달린 풀 클래스를 사용하는 어댑터"""
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+def _create_session():
+    retry = Retry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(["GET", "HEAD"]), # 멱등 요청만 재시도
+        raise_on_status=False, # 재시도 후에도 실패하면 응답을 그대로 돌려줌 (raise_for_status로 처리)
+    )
+    adapter = _PooledAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def get_session():
+    """
+    프로세스 전체에서 공유하는 requests.Session을 반환합니다.
+    keep-alive 연결 풀을 재사용하므로 같은 호스트에 대한 반복 요청은 TCP/TLS 연결 비용을 다시 내지 않습니다.
+    뉴스, 날씨, 기사 등 모든 HTTP 요청은 이 세션을 사용해야 합니다.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _create_session()
+    return _session
+
+def get_connection_stats():
+    """
+    연결 풀 통계를 반환합니다.
+    {"connections_opened": 새로 연 연결 수, "requests": 보낸 요청 수, "connections_reused": 재사용된 연결로 보낸 요청 수}
+    """
+    with _stats_lock:
+        stats = dict(_stats)
+    stats["connections_reused"] = max(0, stats["requests"] - stats["connections_opened"])
+    return stats
+
+if __name__ == '__main__':
+    # 같은 호스트에 두 번 요청하여 연결 재사용 여부를 확인
+    session = get_session()
+    for _ in range(2):
+        res = session.get("https://www.yna.co.kr/rss/politics.xml", timeout=10)
+        print(f"응답 코드: {res.status_code}")
+    print(get_connection_stats())
@@ -0,0 +1,143 @@
+# core/metrics.py
+# 인증, 서비스 빌드, API 호출, RSS 가져오기/파싱, 위젯 갱신 등 주요 구간의 소요 시간과 카운터를 기록합니다.
+# 환경 변수 PLANMAN_METRICS=1 또는 main.py --metrics 로 켭니다. 꺼져 있으면 거의 비용이 없습니다.
+import bisect
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# 지연 시간 히스토그램 구간의 상한(밀리초)
+BUCKET_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+_enabled = os.environ.get("PLANMAN_METRICS", "") not in ("", "0")
+_process_start = time.perf_counter() # main.py가 가장 먼저 불러오므로 프로세스 시작 시각에 가까움
+_lock = threading.Lock()
+_counters = {}   # {이름: 값}
+_histograms = {} # {이름: _Histogram}
+
+class _Histogram:
+    """고정 구간으로 나눈 지연 시간 히스토그램 (샘플을 모두 저장하지 않음)"""
+    __slots__ = ("count", "total", "min", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1) # 마지막 칸은 상한 초과
+
+    def add(self, value_ms):
+        self.count += 1
+        self.total += value_ms
+        self.min = min(self.min, value_ms)
+        self.max = max(self.max, value_ms)
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS_MS, value_ms)] += 1
+
+    def percentile(self, fraction):
+        """구간 상한으로 근사한 백분위수(밀리초)"""
+        target = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= target and bucket_count:
+                return min(BUCKET_BOUNDS_MS[index], self.max) if index < len(BUCKET_BOUNDS_MS) else self.max
+        return self.max
+
+class _Span:
+    __slots__ = ("name", "started")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed_ms = (time.perf_counter() - self.started) * 1000
+        observe(self.name, elapsed_ms)
+        if exc_type is not None:
+            incr(f"{self.name}.error")
+        logger.debug("%s: %.1fms", self.name, elapsed_ms)
+        return False
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+_NOOP_SPAN = _NoopSpan()
+
+def enable(on=True):
+    """측정을 켜거나 끕니다."""
+    global _enabled
+    _enabled = on
+
+def is_enabled():
+    return _enabled
+
+def since_start_ms():
+    """core.metrics를 처음 불러온 시점(프로세스 시작 직후)부터 지금까지의 시간(밀리초)"""
+    return (time.perf_counter() - _process_start) * 1000
+
+def span(name):
+    """with metrics.span("calendar.events_list"): ... 형태로 구간의 소요 시간을 기록합니다."""
+    return _Span(name) if _enabled else _NOOP_SPAN
+
+def observe(name, value_ms):
+    """이름별 히스토그램에 소요 시간(밀리초)을 기록합니다."""
+    if not _enabled:
+        return
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = _Histogram()
+        histogram.add(value_ms)
+
+def incr(name, value=1):
+    """카운터를 증가시킵니다. (예: 캐시 적중 수, 받은 바이트 수)"""
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+def snapshot():
+    """
+    지금까지 기록된 값을 반환합니다.
+    {"counters": {이름: 값}, "latency": {이름: {"count", "mean_ms", "p50_ms", "p95_ms", "max_ms"}}}
+    """
+    with _lock:
+        latency = {
+            name: {
+                "count": h.count,
+                "mean_ms": h.total / h.count,
+                "p50_ms": h.percentile(0.5),
+                "p95_ms": h.percentile(0.95),
+                "max_ms": h.max,
+            }
+            for name, h in _histograms.items() if h.count
+        }
+        return {"counters": dict(_counters), "latency": latency}
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+
+def format_report():
+    """snapshot()을 사람이 읽기 쉬운 표 형태의 문자열로 만듭니다."""
+    data = snapshot()
+    lines = [f"{'구간':<28}{'횟수':>6}{'평균(ms)':>10}{'p50':>8}{'p95':>8}{'최대':>9}"]
+    for name, stats in sorted(data["latency"].items()):
+        lines.append(f"{name:<28}{stats['count']:>6}{stats['mean_ms']:>10.1f}"
+                     f"{stats['p50_ms']:>8.0f}{stats['p95_ms']:>8.0f}{stats['max_ms']:>9.1f}")
+    for name, value in sorted(data["counters"].items()):
+        lines.append(f"{name:<28}{value:>6}")
+    return "\n".join(lines)
@@ -1,10 +1,28 @@
 # main.py
+from core import metrics # 시작 시간 측정을 위해 가장 먼저 불러옴
+import argparse
+import logging
+import os
 from ui.interface import launch_gui
 import tkinter as tk # Tkinter의 TclError 예외 처리를 위해 import
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Plan Man")
+    parser.add_argument("--metrics", action="store_true",
+                        help="구간별 소요 시간과 카운터를 기록하고 종료 시 출력 (환경 변수 PLANMAN_METRICS=1과 같음)")
+    parser.add_argument("--log-level", default=os.environ.get("PLANMAN_LOG_LEVEL", "WARNING"),
+                        help="로그 수준 (DEBUG, INFO, WARNING, ...)")
+    parser.add_argument("--startup-probe", action="store_true",
+                        help="첫 화면이 그려질 때까지 걸린 시간을 출력하고 종료 (benchmarks/bench_startup.py에서 사용)")
+    return parser.parse_args()
+
 if __name__ == "__main__":
+    args = parse_args()
+    logging.basicConfig(level=args.log_level.upper(), format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    if args.metrics:
+        metrics.enable()
     try:
-        launch_gui()
+        launch_gui(startup_probe=args.startup_probe)
     except tk.TclError as e:
         # 애플리케이션이 정상적으로 닫힐 때 발생하는 "application has been destroyed" 오류는 무시
         if "application has been destroyed" in str(e):
@@ -14,4 +32,7 @@ if __name__ == "__main__":
             print(f"예기치 않은 Tkinter 오류가 발생했습니다: {e}")
     except Exception as e:
         # 기타 모든 예외 처리
-        print(f"예기치 않은 오류가 발생했습니다: {e}")
\ No newline at end of file
+        print(f"예기치 않은 오류가 발생했습니다: {e}")
+    finally:
+        if metrics.is_enabled():
+            print(metrics.format_report())
@@ -0,0 +1,242 @@
+# modules/article_reader.py
+# 뉴스 기사 페이지(HTML)에서 본문을 추출하여 앱 안에서 읽을 수 있게 합니다.
+# 추출한 본문은 URL 해시를 키로 디스크에 캐시하며, 전체 크기가 ARTICLE_CACHE_MAX_BYTES를 넘으면
+# 가장 오래 읽지 않은 기사부터 지웁니다. (LRU)
+# 화면에 보이는 목록의 상위 기사는 prefetch_articles로 미리 가져와 두므로 기사를 열 때 네트워크를 기다리지 않습니다.
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from lxml import etree, html
+from core import metrics
+from core.http_session import get_session
+from modules.news_fetcher import USER_AGENT # 뉴스 피드와 같은 User-Agent 사용
+
+ARTICLE_CACHE_DIR = 'article_cache' # 추출한 기사 본문 캐시 폴더
+ARTICLE_CACHE_MAX_BYTES = 20 * 1024 * 1024 # 캐시 폴더의 최대 크기
+ARTICLE_PREFETCH_COUNT = 5 # 목록에서 미리 가져올 상위 기사 수
+ARTICLE_PREFETCH_WORKERS = 2
+ARTICLE_TIMEOUT = 10 # 기사 페이지 요청 제한 시간(초)
+MIN_PARAGRAPH_LENGTH = 20 # 이보다 짧은 문단(메뉴, 버튼 문구 등)은 본문 점수에 넣지 않음
+
+# 본문이 아닌 영역 (메뉴, 광고, 댓글 등)
+_BOILERPLATE_TAGS = ("script", "style", "noscript", "iframe", "form", "nav", "header", "footer", "aside",
+                     "button", "figure", "svg")
+_BOILERPLATE_HINTS = ("comment", "footer", "header", "menu", "nav", "related", "sidebar", "banner", "share",
+                      "copyright", "advert", "popular", "ranking")
+
+logger = logging.getLogger(__name__)
+
+_pending = {} # {URL: 진행 중인 Future}
+_pending_lock = threading.Lock()
+_executor = None
+_cache = None
+
+def _text_of(element):
+    return " ".join("".join(element.itertext()).split())
+
+def _strip_boilerplate(root):
+    """스크립트, 메뉴, 광고, 댓글처럼 본문이 아닌 요소를 지웁니다."""
+    for element in list(root.iter(*_BOILERPLATE_TAGS)):
+        element.drop_tree()
+    for element in list(root.iter()):
+        if not isinstance(element.tag, str) or element.getparent() is None:
+            continue
+        marker = f"{element.get('class', '')} {element.get('id', '')}".lower()
+        if marker.strip() and any(hint in marker for hint in _BOILERPLATE_HINTS):
+            element.drop_tree()
+
+def extract_article(document, url=""):
+    """
+    기사 HTML(bytes 또는 str)에서 제목과 본문을 추출합니다.
+    <p> 문단(또는 <br>로 나뉜 글)의 글자 수를 부모 요소별로 더하여, 가장 많은 글을 담은 요소를 본문으로 봅니다.
+    {"url", "title", "text"} 딕셔너리를 반환합니다. 본문을 찾지 못하면 og:description을 사용합니다.
+    """
+    root = html.document_fromstring(document)
+    title = (root.xpath("string(//meta[@property='og:title']/@content)")
+             or root.xpath("string(//title)")).strip()
+    description = root.xpath("string(//meta[@property='og:description']/@content)").strip()
+    _strip_boilerplate(root)
+
+    scores = {} # {부모 요소: 문단 글자 수 합}
+    for paragraph in root.iter("p", "br"):
+        if paragraph.tag == "br": # <p> 없이 <br>로 문단을 나눈 본문 (일부 언론사)
+            text = (paragraph.tail or "").strip()
+        else:
+            text = _text_of(paragraph)
+        if len(text) >= MIN_PARAGRAPH_LENGTH:
+            parent = paragraph.getparent()
+            scores[parent] = scores.get(parent, 0) + len(text)
+
+    paragraphs = []
+    if scores:
+        body = max(scores, key=scores.get)
+        for element in body.iter("p", "br"):
+            text = (element.tail or "").strip() if element.tag == "br" else _text_of(element)
+            if text:
+                paragraphs.append(text)
+        if body.text and body.text.strip(): # <br>로 나뉜 본문의 첫 문단
+            paragraphs.insert(0, body.text.strip())
+    text = "\n\n".join(paragraphs) or description
+    return {"url": url, "title": title or "제목 없음", "text": text}
+
+class ArticleCache:
+    """
+    추출한 기사를 URL 해시 이름의 JSON 파일로 보관하는 디스크 캐시입니다. (스레드 안전)
+    읽을 때마다 가장 최근 사용으로 옮기고, 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 파일부터 지웁니다.
+    사용 순서는 파일 수정 시각으로 기록하므로 프로그램을 다시 시작해도 유지됩니다.
+    """
+    def __init__(self, directory=ARTICLE_CACHE_DIR, max_bytes=ARTICLE_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = None # OrderedDict {키: 파일 크기} - 오래 사용하지 않은 순 (처음 사용할 때 폴더를 읽음)
+        self._total = 0
+
+    @staticmethod
+    def key(url):
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _load_entries(self):
+        if self._entries is not None:
+            return
+        files = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith(".json"):
+                        stat = entry.stat()
+                        files.append((stat.st_mtime, entry.name[:-5], stat.st_size))
+        except FileNotFoundError:
+            pass
+        files.sort()
+        self._entries = OrderedDict((key, size) for _, key, size in files)
+        self._total = sum(self._entries.values())
+
+    def __contains__(self, url):
+        with self._lock:
+            self._load_entries()
+            return self.key(url) in self._entries
+
+    def get(self, url):
+        """캐시된 기사 딕셔너리를 반환합니다. 없으면 None"""
+        key = self.key(url)
+        with self._lock:
+            self._load_entries()
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            path = self._path(key)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    article = json.load(f)
+                os.utime(path) # 사용 순서를 파일 수정 시각으로 기록
+            except (OSError, ValueError):
+                self._total -= self._entries.pop(key)
+                return None
+        return article if article.get("url") == url else None
+
+    def put(self, article):
+        data = json.dumps(article, ensure_ascii=False).encode('utf-8')
+        key = self.key(article["url"])
+        with self._lock:
+            self._load_entries()
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                path = self._path(key)
+                tmp_path = f"{path}.{threading.get_ident()}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning("기사 캐시 저장 실패 (%s): %s", article["url"], e) # 캐시 저장 실패는 치명적이지 않음
+                return
+            self._total += len(data) - self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            while self._total > self.max_bytes and len(self._entries) > 1:
+                old_key, size = self._entries.popitem(last=False)
+                self._total -= size
+                metrics.incr("article.cache_evicted")
+                try:
+                    os.remove(self._path(old_key))
+                except OSError:
+                    pass
+
+def _get_cache():
+    global _cache
+    with _pending_lock:
+        if _cache is None:
+            _cache = ArticleCache()
+        return _cache
+
+def fetch_article(url):
+    """기사 페이지를 가져와 본문을 추출하고 캐시에 저장합니다. 실패 시 {"error": "에러 메시지"}를 반환합니다."""
+    try:
+        with metrics.span("article.fetch"):
+            res = get_session().get(url, headers={"User-Agent": USER_AGENT}, timeout=ARTICLE_TIMEOUT)
+            res.raise_for_status()
+        with metrics.span("article.extract"):
+            article = extract_article(res.content, url)
+    except requests.exceptions.RequestException as e:
+        return {"error": f"기사를 불러오지 못했습니다: {e}"}
+    except (etree.ParserError, ValueError) as e:
+        return {"error": f"기사 본문을 읽지 못했습니다: {e}"}
+    article["fetched_at"] = time.time()
+    _get_cache().put(article)
+    return article
+
+def get_cached_article(url):
+    """디스크 캐시에 있는 기사를 반환합니다. (네트워크 요청 없음, 없으면 None)"""
+    article = _get_cache().get(url)
+    metrics.incr("article.cache_hit" if article else "article.cache_miss")
+    return article
+
+def get_article(url):
+    """
+    기사를 반환합니다. 캐시에 있으면 바로, 미리 가져오는 중이면 그 결과를 기다리고, 없으면 직접 가져옵니다.
+    {"url", "title", "text"} 또는 {"error": "에러 메시지"}를 반환합니다.
+    """
+    article = get_cached_article(url)
+    if article is not None:
+        return article
+    with _pending_lock:
+        pending = _pending.get(url)
+    if pending is not None:
+        return pending.result()
+    return fetch_article(url)
+
+def _forget(url, future):
+    with _pending_lock:
+        if _pending.get(url) is future:
+            del _pending[url]
+
+def prefetch_articles(urls, count=ARTICLE_PREFETCH_COUNT):
+    """앞의 count개 기사 중 캐시에 없는 것을 백그라운드에서 가져오기 시작합니다. (호출 즉시 반환)"""
+    global _executor
+    cache = _get_cache()
+    submitted = {}
+    with _pending_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=ARTICLE_PREFETCH_WORKERS, thread_name_prefix="article-prefetch")
+        for url in urls[:count]:
+            if url and url not in _pending and url not in cache:
+                submitted[url] = _pending[url] = _executor.submit(fetch_article, url)
+    # 완료 콜백은 잠금 밖에서 등록 (이미 끝난 Future는 콜백이 즉시 실행되기 때문)
+    for url, future in submitted.items():
+        future.add_done_callback(lambda f, u=url: _forget(u, f))
+
+def shutdown():
+    """미리 가져오기 작업 스레드를 멈춥니다. 대기 중인 요청은 취소하고, 진행 중인 요청은 기다리지 않습니다. (프로그램 종료 시)"""
+    global _executor
+    with _pending_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -1,91 +1,758 @@
 # modules/calendar_manager.py
 import datetime
+import logging
+import sqlite3
+import threading
+import heapq
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from calendar import monthrange # 해당 월의 날짜 수를 가져오기 위해 import
+from googleapiclient.errors import HttpError
+from core import metrics
 from core.google_auth import get_calendar_service
+from modules.event_model import Event, EventIndex
+from modules import search_index, ics_importer
+
+logger = logging.getLogger(__name__)
+
+EVENT_DB_FILE = 'events.db' # 동기화된 이벤트를 저장하는 로컬 SQLite 파일
+EVENT_DB_VERSION = 4 # 저장소 형식이 바뀌면 올림 (이전 형식의 저장소는 비우고 전체 동기화를 다시 함)
+SYNC_INTERVAL = 5 * 60 # 백그라운드 동기화 간격(초)
+SYNC_PAST_DAYS = 365 # 전체 동기화로 저장할 기간: 오늘부터 과거로 며칠
+SYNC_FUTURE_DAYS = 2 * 365 # 전체 동기화로 저장할 기간: 오늘부터 미래로 며칠 (남은 기간이 절반보다 짧아지면 다시 잡음)
+MONTH_CACHE_SIZE = 12 # 메모리에 보관할 최대 월 수
+MONTH_CACHE_TTL = 5 * 60 # 월별 이벤트 캐시의 유효 시간(초)
+PREFETCH_WORKERS = 2 # 월별 이벤트를 미리 가져오는 작업 스레드 수
+EVENTS_PAGE_SIZE = 2500 # events().list의 maxResults (API 최댓값): 요청 횟수를 줄임
+# 부분 응답: 화면에 필요한 속성만 내려받음
+EVENT_FIELDS = "items(id,status,summary,start,end,transparency),nextPageToken,nextSyncToken"
+RANGE_CHUNK_DAYS = 92 # 긴 기간은 약 3개월 단위로 나누어 동시에 가져옴
+RANGE_FETCH_WORKERS = 4 # 동시에 가져올 구간 수 (메모리에는 이 두 배까지만 미리 보관)
+CALENDAR_LIST_FIELDS = "items(id,summary,backgroundColor,primary,selected),nextPageToken"
+CALENDAR_LIST_TTL = 30 * 60 # 캘린더 목록을 다시 가져오는 간격(초)
+BATCH_MAX_REQUESTS = 50 # 배치 요청 하나에 담을 최대 요청 수 (Calendar API 권장값)
+DEFAULT_CALENDAR_COLOR = '#4285f4' # 색상 정보가 없는 캘린더에 사용할 색
+FREEBUSY_CHUNK_DAYS = 60 # freeBusy 요청 하나로 조회할 기간 (API의 최대 조회 기간보다 짧게)
+
+_db = None
+_db_lock = threading.RLock() # 하나의 연결을 여러 스레드가 공유하므로 잠금으로 보호
+_sync_lock = threading.Lock() # 동기화는 한 번에 하나만 실행
+_sync_thread = None
+_search_indexed = False # 저장소의 일정을 검색 색인에 넣었는지 여부 (index_stored_events)
+_calendar_list = None # (가져온 시각, [캘린더 정보, ...])
+_calendar_list_lock = threading.Lock()
 
 # 기존 get_upcoming_events 함수는 그대로 두거나 필요 없다면 삭제할 수 있습니다.
 # def get_upcoming_events(max_results=10): ...
 
-def get_events_for_month(year, month):
+def _get_db():
+    """로컬 이벤트 저장소(SQLite) 연결을 반환합니다. 처음 호출 시 테이블과 인덱스를 만듭니다."""
+    global _db
+    with _db_lock:
+        if _db is None:
+            db = sqlite3.connect(EVENT_DB_FILE, check_same_thread=False)
+            if db.execute("PRAGMA user_version").fetchone()[0] < EVENT_DB_VERSION:
+                db.executescript(f"""
+                    DROP TABLE IF EXISTS events;
+                    DROP TABLE IF EXISTS sync_state;
+                    PRAGMA user_version = {EVENT_DB_VERSION};
+                """)
+            db.executescript("""
+                CREATE TABLE IF NOT EXISTS events (
+                    calendar_id TEXT NOT NULL,
+                    event_id    TEXT NOT NULL,
+                    summary     TEXT NOT NULL,
+                    start       TEXT NOT NULL,  -- 시작 시각 (현지 시각 ISO 형식)
+                    end         TEXT NOT NULL,  -- 끝 시각 (포함하지 않음)
+                    start_date  TEXT NOT NULL,  -- YYYY-MM-DD
+                    end_date    TEXT NOT NULL,  -- YYYY-MM-DD (마지막 날 포함)
+                    all_day     INTEGER NOT NULL,
+                    transparent INTEGER NOT NULL,  -- '한가함'으로 표시된 일정 (바쁜 시간에서 제외)
+                    PRIMARY KEY (calendar_id, event_id)
+                );
+                CREATE INDEX IF NOT EXISTS idx_events_range ON events (start_date, end_date);
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    calendar_id TEXT PRIMARY KEY,
+                    sync_token  TEXT,
+                    synced_at   REAL,
+                    window_start TEXT,  -- 전체 동기화한 기간의 시작 (YYYY-MM-DD)
+                    window_end   TEXT   -- 전체 동기화한 기간의 끝 (YYYY-MM-DD, 포함하지 않음)
+                );
+                CREATE TABLE IF NOT EXISTS calendars (
+                    calendar_id TEXT PRIMARY KEY,
+                    summary     TEXT NOT NULL,
+                    color       TEXT NOT NULL,
+                    is_primary  INTEGER NOT NULL
+                );
+            """)
+            _db = db
+        return _db
+
+def _event_to_row(record):
+    """Event를 events 테이블의 행(tuple)으로 변환합니다."""
+    return (record.calendar, record.id, record.summary, record.start.isoformat(), record.end.isoformat(),
+            record.first_day.isoformat(), record.last_day.isoformat(), int(record.all_day), int(record.transparent))
+
+def _row_to_event(row):
+    """events 테이블의 (calendar_id, event_id, summary, start, end, all_day, transparent) 행을 Event로 변환합니다."""
+    calendar_id, event_id, summary, start, end, all_day, transparent = row
+    return Event(event_id, datetime.datetime.fromisoformat(start), datetime.datetime.fromisoformat(end),
+                 bool(all_day), summary, calendar_id, bool(transparent))
+
+def _list_all_pages(service, **params):
+    """nextPageToken을 따라가며 모든 페이지의 이벤트를 가져옵니다. (이벤트 리스트, nextSyncToken) 반환"""
+    events = []
+    page_token = None
+    while True:
+        with metrics.span("calendar.events_list"):
+            result = service.events().list(pageToken=page_token, maxResults=EVENTS_PAGE_SIZE,
+                                           fields=EVENT_FIELDS, **params).execute()
+        events.extend(result.get('items', []))
+        page_token = result.get('nextPageToken')
+        if not page_token:
+            return events, result.get('nextSyncToken')
+
+def _save_calendars(calendars):
+    """캘린더 목록을 저장소에 기록하고, 더 이상 구독하지 않는 캘린더의 이벤트와 동기화 상태를 지웁니다."""
+    db = _get_db()
+    ids = [calendar["id"] for calendar in calendars]
+    placeholders = ", ".join("?" * len(ids))
+    with _db_lock, db:
+        removed = [row[0] for row in db.execute(
+            f"SELECT DISTINCT calendar_id FROM events WHERE calendar_id NOT IN ({placeholders})", ids)]
+        db.execute("DELETE FROM calendars")
+        db.executemany("INSERT INTO calendars VALUES (?, ?, ?, ?)",
+                       [(c["id"], c["summary"], c["color"], int(c["primary"])) for c in calendars])
+        for table in ("events", "sync_state"):
+            db.execute(f"DELETE FROM {table} WHERE calendar_id NOT IN ({placeholders})", ids)
+    for calendar_id in removed:
+        search_index.remove_calendar(calendar_id)
+
+def get_stored_calendars():
+    """마지막으로 가져온 캘린더 목록을 저장소에서 읽습니다. (네트워크 요청 없음)"""
+    db = _get_db()
+    with _db_lock:
+        rows = db.execute("SELECT calendar_id, summary, color, is_primary FROM calendars "
+                          "ORDER BY is_primary DESC, summary").fetchall()
+    return [{"id": calendar_id, "summary": summary, "color": color, "primary": bool(is_primary)}
+            for calendar_id, summary, color, is_primary in rows]
+
+def list_calendars(refresh=False):
     """
-    지정된 연도와 월에 해당하는 모든 Google Calendar 이벤트를 가져옵니다.
-    날짜(date 객체)를 키로, 해당 날짜의 이벤트 요약 문자열 리스트를 값으로 하는 딕셔너리를 반환합니다.
-    오류 발생 시 {"error": "에러 메시지"} 형태의 딕셔너리를 반환합니다.
+    사용자가 구독 중인 캘린더 목록을 calendarList().list()로 가져옵니다. (CALENDAR_LIST_TTL 동안 재사용)
+    [{"id", "summary", "color", "primary"}, ...] 리스트를 기본 캘린더부터 반환하며, 화면에 표시하지 않도록 설정한 캘린더는 제외합니다.
+    서비스에 연결할 수 없으면 ConnectionError를, API 오류는 HttpError를 그대로 발생시킵니다.
+    """
+    global _calendar_list
+    with _calendar_list_lock:
+        if not refresh and _calendar_list and time.time() - _calendar_list[0] < CALENDAR_LIST_TTL:
+            return _calendar_list[1]
+
+        service = get_calendar_service()
+        if not service:
+            raise ConnectionError("Google Calendar 서비스에 연결할 수 없습니다. 인증 상태를 확인하세요.")
+        calendars = []
+        page_token = None
+        while True:
+            with metrics.span("calendar.calendar_list"):
+                result = service.calendarList().list(pageToken=page_token, fields=CALENDAR_LIST_FIELDS).execute()
+            for item in result.get('items', []):
+                if item.get('selected') or item.get('primary'):
+                    calendars.append({"id": item['id'], "summary": item.get('summary', item['id']),
+                                      "color": item.get('backgroundColor', DEFAULT_CALENDAR_COLOR),
+                                      "primary": bool(item.get('primary'))})
+            page_token = result.get('nextPageToken')
+            if not page_token:
+                break
+        calendars.sort(key=lambda calendar: not calendar["primary"])
+
+        try:
+            _save_calendars(calendars)
+        except sqlite3.Error as e:
+            logger.warning("캘린더 목록 저장 실패: %s", e)
+        _calendar_list = (time.time(), calendars)
+        return calendars
+
+def sync_events(calendar_id='primary'):
+    """
+    Google Calendar를 로컬 저장소와 동기화합니다.
+    저장된 syncToken이 없으면 전체 동기화를, 있으면 변경되거나 삭제된 이벤트만 가져옵니다.
+    전체 동기화는 끝이 없는 반복 일정도 유한하게 펼쳐지도록 오늘 기준 SYNC_PAST_DAYS일 전부터 SYNC_FUTURE_DAYS일 후까지만
+    가져오며, 남은 미래 기간이 절반보다 짧아지면 기간을 다시 잡아 전체 동기화합니다.
+    syncToken이 만료되어 410 응답을 받으면 저장소를 비우고 전체 동기화를 다시 합니다.
+    {"full": 전체 동기화 여부, "updated": 추가/변경 수, "deleted": 삭제 수} 또는 {"error": "에러 메시지"}를 반환합니다.
     """
     service = get_calendar_service()
     if not service:
         return {"error": "Google Calendar 서비스에 연결할 수 없습니다. 인증 상태를 확인하세요."}
 
+    with _sync_lock, metrics.span("calendar.sync"):
+        db = _get_db()
+        with _db_lock:
+            row = db.execute("SELECT sync_token, window_start, window_end FROM sync_state WHERE calendar_id = ?",
+                             (calendar_id,)).fetchone()
+        sync_token, window_start, window_end = row if row else (None, None, None)
+        today = datetime.date.today()
+        if sync_token and window_end < (today + datetime.timedelta(days=SYNC_FUTURE_DAYS // 2)).isoformat():
+            logger.info("동기화 기간의 끝이 가까워져 전체 동기화를 다시 합니다. (%s)", calendar_id)
+            sync_token = None
+
+        try:
+            if sync_token:
+                try:
+                    events, next_token = _list_all_pages(service, calendarId=calendar_id,
+                                                         singleEvents=True, syncToken=sync_token)
+                except HttpError as e:
+                    if e.resp.status != 410:
+                        raise
+                    logger.info("syncToken이 만료되어 전체 동기화를 다시 합니다. (%s)", calendar_id)
+                    sync_token = None
+            if not sync_token:
+                # 전체 동기화: 삭제된 이벤트는 필요 없으므로 showDeleted 없이 요청
+                first_day = today - datetime.timedelta(days=SYNC_PAST_DAYS)
+                end_day = today + datetime.timedelta(days=SYNC_FUTURE_DAYS)
+                events, next_token = _list_all_pages(service, calendarId=calendar_id, singleEvents=True,
+                                                     timeMin=_rfc3339(_to_utc_datetime(first_day)),
+                                                     timeMax=_rfc3339(_to_utc_datetime(end_day)))
+                window_start, window_end = first_day.isoformat(), end_day.isoformat()
+        except Exception as e:
+            logger.error("캘린더 동기화 중 오류 발생: %s", e)
+            return {"error": f"캘린더 동기화 중 오류 발생: {e}"}
+
+        records, deleted_ids = [], []
+        with _db_lock, db:
+            if not sync_token:
+                db.execute("DELETE FROM events WHERE calendar_id = ?", (calendar_id,))
+            for event in events:
+                if event.get('status') == 'cancelled':
+                    db.execute("DELETE FROM events WHERE calendar_id = ? AND event_id = ?", (calendar_id, event['id']))
+                    deleted_ids.append(event['id'])
+                else:
+                    record = Event.from_api(event, calendar_id)
+                    db.execute("INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", _event_to_row(record))
+                    records.append(record)
+            db.execute("INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?, ?)",
+                       (calendar_id, next_token, time.time(), window_start, window_end))
+        # 바뀐 일정만 검색 색인에 반영 (전체 동기화는 이 캘린더의 색인을 통째로 바꿈)
+        search_index.index_events(records, calendar_id, replace=not sync_token)
+        search_index.remove_events(calendar_id, deleted_ids)
+        return {"full": not sync_token, "updated": len(records), "deleted": len(deleted_ids)}
+
+def is_synced(calendar_id='primary', start=None, end=None):
+    """
+    로컬 저장소에 해당 캘린더의 전체 동기화가 한 번 이상 완료되었는지 확인합니다.
+    start와 end(date)를 주면 [start, end) 기간이 동기화한 기간 안에 있는지도 확인합니다.
+    """
+    db = _get_db()
+    with _db_lock:
+        row = db.execute("SELECT sync_token, window_start, window_end FROM sync_state WHERE calendar_id = ?",
+                         (calendar_id,)).fetchone()
+    if not (row and row[0]):
+        return False
+    return start is None or (row[1] <= start.isoformat() and end.isoformat() <= row[2])
+
+def get_stored_events_for_month(year, month, calendars=None):
+    """
+    로컬 저장소에서 지정된 월과 겹치는 이벤트를 읽습니다. (네트워크 요청 없음, 오프라인에서도 동작)
+    calendars는 list_calendars() 형식의 캘린더 목록이며, 없으면 저장소에 기록된 목록을 사용합니다.
+    get_events_for_month와 같은 EventIndex를 반환합니다.
+    """
+    if calendars is None:
+        calendars = get_stored_calendars()
+    calendar_ids = [calendar["id"] for calendar in calendars]
+    first_day = datetime.date(year, month, 1)
+    last_day = datetime.date(year, month, monthrange(year, month)[1])
+    db = _get_db()
+    with _db_lock:
+        rows = db.execute(
+            "SELECT calendar_id, event_id, summary, start, end, all_day, transparent FROM events "
+            f"WHERE calendar_id IN ({', '.join('?' * len(calendar_ids))}) AND start_date <= ? AND end_date >= ?",
+            (*calendar_ids, last_day.isoformat(), first_day.isoformat())).fetchall()
+    return EventIndex(_row_to_event(row) for row in rows)
+
+def index_stored_events():
+    """
+    저장소의 모든 일정을 검색 색인에 넣습니다. (프로그램 시작 시 한 번, 네트워크 요청 없음)
+    이후의 변경은 sync_events가 색인에 바로 반영합니다.
+    """
+    global _search_indexed
+    with _sync_lock: # 읽는 도중 동기화가 색인을 고친 뒤 오래된 행으로 덮어쓰지 않도록 동기화와 겹치지 않게 함
+        if _search_indexed:
+            return
+        db = _get_db()
+        with _db_lock:
+            rows = db.execute(
+                "SELECT calendar_id, event_id, summary, start, end, all_day, transparent FROM events").fetchall()
+        with metrics.span("search.index_stored_events"):
+            search_index.index_events(_row_to_event(row) for row in rows)
+        _search_indexed = True
+
+def calendar_colors():
+    """{캘린더 ID: 색상}을 반환합니다. 이미 가져온 캘린더 목록(없으면 저장소)을 사용하며 네트워크 요청은 하지 않습니다."""
+    calendars = _calendar_list[1] if _calendar_list else get_stored_calendars()
+    return {calendar["id"]: calendar["color"] for calendar in calendars + ics_importer.imported_calendars()}
+
+def sync_all_calendars():
+    """구독 중인 모든 캘린더를 차례로 동기화합니다. {캘린더 ID: sync_events 결과} 또는 {"error": "에러 메시지"}를 반환합니다."""
+    try:
+        calendars = list_calendars()
+    except Exception as e:
+        return {"error": f"캘린더 목록을 가져오지 못했습니다: {e}"}
+    return {calendar["id"]: sync_events(calendar["id"]) for calendar in calendars}
+
+def _background_sync_loop(interval):
+    while True:
+        results = sync_all_calendars()
+        if "error" in results:
+            logger.warning("백그라운드 동기화 실패: %s", results['error'])
+        for calendar_id, result in results.items():
+            if isinstance(result, dict) and "error" in result:
+                logger.warning("백그라운드 동기화 실패 (%s): %s", calendar_id, result['error'])
+        time.sleep(interval)
+
+def start_background_sync(interval=SYNC_INTERVAL):
+    """구독 중인 모든 캘린더를 로컬 저장소와 맞추는 백그라운드 동기화 스레드를 시작합니다. (이미 실행 중이면 무시)"""
+    global _sync_thread
+    if _sync_thread is not None and _sync_thread.is_alive():
+        return
+    _sync_thread = threading.Thread(target=_background_sync_loop, args=(interval,),
+                                    name="calendar-sync", daemon=True)
+    _sync_thread.start()
+
+def _to_utc_datetime(value):
+    """
+    date 또는 datetime을 UTC 기준 aware datetime으로 변환합니다.
+    date와 시간대 없는 datetime은 이 컴퓨터의 현지 시각으로 봅니다. (로컬 저장소와 같은 기준)
+    """
+    if not isinstance(value, datetime.datetime):
+        value = datetime.datetime(value.year, value.month, value.day)
+    return value.astimezone(datetime.timezone.utc)
+
+def _rfc3339(value):
+    # Google Calendar API가 요구하는 RFC3339 형식으로 변환 ('Z'는 UTC를 의미)
+    return value.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+def _event_start_utc(event):
+    """이벤트 시작 시각(UTC). 종일 이벤트는 그날 현지 시각 0시로 간주합니다."""
+    start_info = event['start']
+    if 'dateTime' in start_info:
+        return datetime.datetime.fromisoformat(start_info['dateTime'].replace('Z', '+00:00')).astimezone(datetime.timezone.utc)
+    return _to_utc_datetime(datetime.date.fromisoformat(start_info['date']))
+
+def _events_list_request(service, calendar_id, time_min, time_max, page_token=None):
+    """한 캘린더의 [time_min, time_max) 구간 이벤트 목록 요청(HttpRequest)을 만듭니다. (아직 보내지 않음)"""
+    return service.events().list(
+        calendarId=calendar_id,
+        timeMin=_rfc3339(time_min),
+        timeMax=_rfc3339(time_max),
+        singleEvents=True,          # 반복 이벤트를 개별 이벤트로 확장
+        orderBy='startTime',        # 시작 시간 순으로 정렬
+        maxResults=EVENTS_PAGE_SIZE,
+        fields=EVENT_FIELDS,
+        pageToken=page_token,
+    )
+
+def _iter_event_pages(service, calendar_id, time_min, time_max):
+    """한 캘린더의 [time_min, time_max) 구간 이벤트를 페이지 단위(리스트)로 내보냅니다. (시작 시간 순)"""
+    page_token = None
+    while True:
+        with metrics.span("calendar.events_list"):
+            result = _events_list_request(service, calendar_id, time_min, time_max, page_token).execute()
+        items = result.get('items', [])
+        for event in items:
+            event['calendarId'] = calendar_id # 여러 캘린더를 합쳤을 때 출처를 알 수 있도록 표시
+        yield items
+        page_token = result.get('nextPageToken')
+        if not page_token:
+            return
+
+def _execute_batch(service, requests):
+    """
+    {요청 ID: HttpRequest}를 BATCH_MAX_REQUESTS개씩 묶어 배치 요청으로 보냅니다.
+    {요청 ID: 응답 딕셔너리 또는 HttpError}를 반환합니다.
+    """
+    results = {}
+
+    def on_response(request_id, response, exception):
+        results[request_id] = exception if exception is not None else response
+
+    request_ids = list(requests)
+    for i in range(0, len(request_ids), BATCH_MAX_REQUESTS):
+        batch = service.new_batch_http_request(callback=on_response)
+        for request_id in request_ids[i:i + BATCH_MAX_REQUESTS]:
+            batch.add(requests[request_id], request_id=request_id)
+        with metrics.span("calendar.events_batch"):
+            batch.execute()
+    return results
+
+def _fetch_chunk(service, calendar_id, chunk_start, chunk_end, is_first_chunk):
+    """
+    한 구간의 모든 페이지를 가져옵니다.
+    앞 구간과 겹치는 이벤트(구간 시작 전에 시작한 이벤트)는 앞 구간에서 이미 내보냈으므로 제외합니다.
+    """
+    events = []
+    for page in _iter_event_pages(service, calendar_id, chunk_start, chunk_end):
+        events.extend(event for event in page
+                      if is_first_chunk or _event_start_utc(event) >= chunk_start)
+    return events
+
+def _fetch_chunk_batch(service, calendar_ids, chunk_start, chunk_end, is_first_chunk):
+    """
+    여러 캘린더의 한 구간을 배치 요청으로 가져옵니다. 캘린더 수와 관계없이 대개 한 번의 왕복이면 되며,
+    다음 페이지가 남은 캘린더만 모아 다시 배치 요청을 보냅니다.
+    일부 캘린더만 실패하면 경고를 남기고 건너뛰며, 모두 실패하면 첫 번째 오류를 발생시킵니다.
+    캘린더별 이벤트 리스트(시작 시간 순)의 리스트를 반환합니다.
+    """
+    events = {calendar_id: [] for calendar_id in calendar_ids}
+    page_tokens = dict.fromkeys(calendar_ids) # 아직 가져올 페이지가 남은 캘린더 {ID: pageToken}
+    errors = {}
+    while page_tokens:
+        requests = {calendar_id: _events_list_request(service, calendar_id, chunk_start, chunk_end, page_token)
+                    for calendar_id, page_token in page_tokens.items()}
+        page_tokens = {}
+        for calendar_id, result in _execute_batch(service, requests).items():
+            if isinstance(result, Exception):
+                logger.warning("캘린더 %s의 이벤트를 가져오지 못했습니다: %s", calendar_id, result)
+                errors[calendar_id] = result
+                events.pop(calendar_id, None)
+                continue
+            for event in result.get('items', []):
+                if is_first_chunk or _event_start_utc(event) >= chunk_start:
+                    event['calendarId'] = calendar_id
+                    events[calendar_id].append(event)
+            if result.get('nextPageToken'):
+                page_tokens[calendar_id] = result['nextPageToken']
+    if not events and errors:
+        raise next(iter(errors.values()))
+    return list(events.values())
+
+def iter_events(start, end, calendars=('primary',)):
+    """
+    [start, end) 기간의 이벤트(API 이벤트 딕셔너리, 'calendarId' 추가)를 시작 시간 순으로 하나씩 내보내는 제너레이터입니다.
+    start/end가 date 또는 시간대 없는 datetime이면 이 컴퓨터의 현지 시각으로 봅니다. (로컬 저장소의 월 조회와 같은 경계)
+    - 짧은 기간은 페이지 단위로 바로 내보냅니다.
+    - 긴 기간은 RANGE_CHUNK_DAYS 단위 구간으로 나누어 동시에 가져오되, 앞서 가져오는 구간 수를 제한하여
+      몇 년치를 조회해도 메모리 사용량이 일정합니다.
+    - 캘린더가 여럿이면 구간마다 모든 캘린더의 요청을 하나의 배치 요청으로 보냅니다.
+    서비스에 연결할 수 없으면 ConnectionError를, API 오류는 HttpError를 그대로 발생시킵니다.
+    """
+    service = get_calendar_service()
+    if not service:
+        raise ConnectionError("Google Calendar 서비스에 연결할 수 없습니다. 인증 상태를 확인하세요.")
+
+    start = _to_utc_datetime(start)
+    end = _to_utc_datetime(end)
+    chunk = datetime.timedelta(days=RANGE_CHUNK_DAYS)
+    boundaries = []
+    chunk_start = start
+    while chunk_start < end:
+        boundaries.append((chunk_start, min(chunk_start + chunk, end)))
+        chunk_start += chunk
+
+    if len(boundaries) == 1 and len(calendars) == 1:
+        # 구간이 하나뿐이면 스레드 없이 페이지를 받는 대로 내보냄
+        for page in _iter_event_pages(service, calendars[0], start, end):
+            yield from (event for event in page if _event_start_utc(event) < end)
+        return
+
+    def fetch_chunk(index, chunk_start, chunk_end):
+        # 구간 하나에 대한 캘린더별 이벤트 리스트의 리스트
+        if len(calendars) == 1:
+            return [_fetch_chunk(service, calendars[0], chunk_start, chunk_end, index == 0)]
+        return _fetch_chunk_batch(service, calendars, chunk_start, chunk_end, index == 0)
+
+    tasks = deque((index, chunk_start, chunk_end) for index, (chunk_start, chunk_end) in enumerate(boundaries))
+    pending = deque() # 제출한 구간 작업 (구간 순)
+
+    def submit_ahead(executor):
+        # 앞서 가져오는 구간 수를 제한하여 메모리를 일정하게 유지
+        while tasks and len(pending) < RANGE_FETCH_WORKERS * 2:
+            pending.append(executor.submit(fetch_chunk, *tasks.popleft()))
+
+    with ThreadPoolExecutor(max_workers=RANGE_FETCH_WORKERS, thread_name_prefix="event-range") as executor:
+        try:
+            submit_ahead(executor)
+            while pending:
+                per_calendar = pending.popleft().result()
+                submit_ahead(executor)
+                # 한 구간의 캘린더별 결과를 시작 시간 순으로 병합
+                for event in heapq.merge(*per_calendar, key=_event_start_utc):
+                    if _event_start_utc(event) < end:
+                        yield event
+        finally:
+            for future in pending: # 제너레이터를 중간에 멈춘 경우 남은 작업 취소
+                future.cancel()
+
+def get_events_for_month(year, month):
+    """
+    지정된 연도와 월과 겹치는 구독 중인 모든 캘린더의 이벤트를 가져옵니다.
+    성공 시 EventIndex를 반환합니다. (index.on_date(날짜)로 여러 날에 걸친 이벤트까지 날짜별로 조회)
+    오류 발생 시 {"error": "에러 메시지"} 형태의 딕셔너리를 반환합니다.
+    모든 캘린더의 전체 동기화가 끝났고 그 달이 동기화한 기간 안에 있으면 API를 호출하지 않고 로컬 저장소에서 바로 읽습니다.
+    가져온 ICS 캘린더(ics_importer)의 일정도 함께 넣으며, Google 캘린더를 읽지 못해도 이 일정은 보여 줍니다.
+    이때 반환하는 EventIndex의 error에는 Google 캘린더 오류 메시지가 들어 있습니다.
+    """
     try:
         year = int(year)
         month = int(month)
     except ValueError:
         return {"error": "연도와 월은 숫자로 입력해야 합니다."}
 
-    # 해당 월의 첫째 날과 마지막 날 계산
+    # 해당 월의 첫째 날과 다음 달 첫째 날 계산
     try:
-        first_day_of_month = datetime.datetime(year, month, 1, 0, 0, 0)
-        # monthrange(year, month)는 (요일, 해당 월의 날짜 수) 튜플을 반환합니다.
-        num_days_in_month = monthrange(year, month)[1]
-        last_day_of_month = datetime.datetime(year, month, num_days_in_month, 23, 59, 59)
-    except ValueError: # 잘못된 날짜(예: 2월 30일) 입력 방지
+        first_day_of_month = datetime.date(year, month, 1)
+        next_month = _shift_month(year, month, 1)
+        first_day_of_next_month = datetime.date(next_month[0], next_month[1], 1)
+    except ValueError: # 잘못된 날짜(예: 13월) 입력 방지
         return {"error": f"{year}년 {month}월은 유효한 날짜가 아닙니다."}
 
+    imported = ics_importer.events_between(first_day_of_month, first_day_of_next_month)
+    events = _get_google_events_for_month(year, month, first_day_of_month, first_day_of_next_month)
+    if isinstance(events, dict):
+        if not imported:
+            return events
+        error = events["error"]
+        logger.warning("%s년 %s월 Google 캘린더 일정을 가져오지 못해 가져온 ICS 일정만 표시합니다: %s",
+                       year, month, error)
+        events = EventIndex()
+        events.error = error
+    for event in imported:
+        events.add(event)
+    return events
 
-    # Google Calendar API가 요구하는 RFC3339 형식으로 변환 ('Z'는 UTC를 의미)
-    time_min_str = first_day_of_month.isoformat() + 'Z'
-    time_max_str = last_day_of_month.isoformat() + 'Z'
+def _get_google_events_for_month(year, month, first_day_of_month, first_day_of_next_month):
+    """get_events_for_month의 Google 캘린더 부분 (EventIndex 또는 {"error": "에러 메시지"})"""
+    try:
+        calendars = list_calendars()
+    except Exception as e:
+        calendars = get_stored_calendars() # 오프라인: 마지막으로 가져온 목록 사용
+        if not calendars:
+            logger.error("캘린더 목록 가져오기 중 오류 발생: %s", e)
+            return {"error": f"캘린더 목록을 가져오지 못했습니다: {e}"}
 
-    events_by_date = {}  # {datetime.date 객체: [이벤트1 요약, 이벤트2 요약, ...]}
     try:
-        events_result = service.events().list(
-            calendarId='primary',       # 기본 캘린더
-            timeMin=time_min_str,
-            timeMax=time_max_str,
-            singleEvents=True,          # 반복 이벤트를 개별 이벤트로 확장
-            orderBy='startTime'         # 시작 시간 순으로 정렬
-        ).execute()
-        google_api_events = events_result.get('items', [])
-
-        if not google_api_events:
-            return {}  # 해당 월에 이벤트 없음
-
-        for event in google_api_events:
-            start_info = event['start']
-            # 이벤트 시작 날짜/시간 문자열 가져오기
-            start_str = start_info.get('dateTime', start_info.get('date'))
-            
-            # ISO 8601 형식의 날짜/시간 문자열을 datetime.date 객체로 변환
-            # 'dateTime'은 'YYYY-MM-DDTHH:MM:SS...' 형식, 'date'는 'YYYY-MM-DD' 형식
-            if 'T' in start_str:  # 'dateTime' 형식인 경우 (시간 정보 포함)
-                # 시간대 정보를 고려하여 datetime 객체로 변환 후 date 부분만 사용
-                event_date_obj = datetime.datetime.fromisoformat(start_str.replace('Z', '+00:00')).date()
-            else:  # 'date' 형식인 경우 (종일 이벤트)
-                event_date_obj = datetime.date.fromisoformat(start_str)
-            
-            summary = event.get('summary', '제목 없음') # 이벤트 제목
-            
-            if event_date_obj not in events_by_date:
-                events_by_date[event_date_obj] = []
-            events_by_date[event_date_obj].append(summary)
-            
-        return events_by_date
+        if all(is_synced(calendar["id"], first_day_of_month, first_day_of_next_month) for calendar in calendars):
+            with metrics.span("calendar.store_query"):
+                return get_stored_events_for_month(year, month, calendars)
+    except sqlite3.Error as e:
+        logger.warning("로컬 저장소 조회 실패, API로 가져옵니다: %s", e)
 
+    calendar_ids = [calendar["id"] for calendar in calendars]
+    try:
+        events = EventIndex(Event.from_api(event) for event in
+                            iter_events(first_day_of_month, first_day_of_next_month, calendars=calendar_ids))
+        search_index.index_events(events) # 동기화 전에도 본 달의 일정은 검색되도록 함
+        return events
+
+    except ConnectionError as e:
+        return {"error": str(e)}
     except Exception as e:
-        print(f"{year}년 {month}월 이벤트 가져오기 중 오류 발생: {e}")
+        logger.error("%s년 %s월 이벤트 가져오기 중 오류 발생: %s", year, month, e)
         return {"error": f"이벤트 가져오기 중 오류 발생: {e}"}
 
+def _freebusy_request(service, calendar_ids, time_min, time_max):
+    """여러 캘린더의 [time_min, time_max) 구간 바쁜 시간 요청(HttpRequest)을 만듭니다. (아직 보내지 않음)"""
+    return service.freebusy().query(body={
+        "timeMin": _rfc3339(time_min),
+        "timeMax": _rfc3339(time_max),
+        "items": [{"id": calendar_id} for calendar_id in calendar_ids],
+    })
+
+def _utc_to_local(text):
+    """API의 UTC 시각 문자열을 이 컴퓨터의 현지 시각(시간대 정보 없는 datetime)으로 변환합니다."""
+    return datetime.datetime.fromisoformat(text.replace('Z', '+00:00')).astimezone().replace(tzinfo=None)
+
+def get_busy_intervals(start, end):
+    """
+    구독 중인 모든 캘린더에서 [start, end) 기간(date)과 겹치는 바쁜 시간을 [(시작, 끝), ...]로 반환합니다. (정렬하지 않음)
+    시각은 시간대 정보 없는 현지 시각 datetime입니다.
+    freeBusy와 같이 '한가함'으로 표시된(transparency=transparent) 일정은 바쁜 시간으로 보지 않습니다.
+    (종일 일정은 Google Calendar에서 기본으로 '한가함'입니다.)
+    모든 캘린더가 그 기간까지 동기화되어 있으면 저장소에서 읽고, 아니면 FREEBUSY_CHUNK_DAYS 단위 freeBusy 요청들을
+    배치 요청 하나로 보냅니다. 오류 시 {"error": "에러 메시지"}를 반환합니다.
+    """
+    try:
+        calendars = list_calendars()
+    except Exception as e:
+        calendars = get_stored_calendars() # 오프라인: 마지막으로 가져온 목록 사용
+        if not calendars:
+            return {"error": f"캘린더 목록을 가져오지 못했습니다: {e}"}
+    calendar_ids = [calendar["id"] for calendar in calendars]
+
+    try:
+        if all(is_synced(calendar_id, start, end) for calendar_id in calendar_ids):
+            db = _get_db()
+            with _db_lock, metrics.span("calendar.busy_store"):
+                rows = db.execute(
+                    "SELECT start, end FROM events "
+                    f"WHERE calendar_id IN ({', '.join('?' * len(calendar_ids))}) AND transparent = 0 "
+                    "AND start_date < ? AND end_date >= ?",
+                    (*calendar_ids, end.isoformat(), start.isoformat())).fetchall()
+            return [(datetime.datetime.fromisoformat(row_start), datetime.datetime.fromisoformat(row_end))
+                    for row_start, row_end in rows]
+    except sqlite3.Error as e:
+        logger.warning("로컬 저장소 조회 실패, freeBusy로 가져옵니다: %s", e)
+
+    service = get_calendar_service()
+    if not service:
+        return {"error": "Google Calendar 서비스에 연결할 수 없습니다. 인증 상태를 확인하세요."}
+    requests = {}
+    # 기간의 경계도 이 컴퓨터의 현지 시각 0시 (응답 시각을 현지 시각으로 바꾸는 것과 맞춤)
+    chunk_start = _to_utc_datetime(start)
+    time_max = _to_utc_datetime(end)
+    while chunk_start < time_max:
+        chunk_end = min(chunk_start + datetime.timedelta(days=FREEBUSY_CHUNK_DAYS), time_max)
+        requests[str(len(requests))] = _freebusy_request(service, calendar_ids, chunk_start, chunk_end)
+        chunk_start = chunk_end
+    try:
+        responses = _execute_batch(service, requests)
+    except Exception as e:
+        logger.error("바쁜 시간 가져오기 중 오류 발생: %s", e)
+        return {"error": f"바쁜 시간 가져오기 중 오류 발생: {e}"}
+
+    intervals = []
+    for response in responses.values():
+        if isinstance(response, Exception):
+            return {"error": f"바쁜 시간 가져오기 중 오류 발생: {response}"}
+        for calendar_id, result in response.get("calendars", {}).items():
+            if result.get("errors"):
+                logger.warning("캘린더 %s의 바쁜 시간을 가져오지 못했습니다: %s", calendar_id, result["errors"])
+            intervals.extend((_utc_to_local(busy["start"]), _utc_to_local(busy["end"]))
+                             for busy in result.get("busy", []))
+    return intervals
+
+class MonthCache:
+    """
+    (연도, 월)을 키로 get_events_for_month 결과(EventIndex)를 보관하는 메모리 캐시입니다.
+    항목은 ttl초가 지나면 만료되고, max_size개를 넘으면 가장 오래 사용하지 않은 월부터 제거됩니다. (스레드 안전)
+    """
+    def __init__(self, max_size=MONTH_CACHE_SIZE, ttl=MONTH_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict() # {(연도, 월): (저장 시각, 이벤트 딕셔너리)}
+        self._lock = threading.Lock()
+
+    def get(self, year, month):
+        """캐시된 이벤트를 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+        key = (year, month)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, events = entry
+            if time.time() - stored_at >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key) # 최근 사용한 항목으로 표시
+            return events
+
+    def put(self, year, month, events):
+        """이벤트를 저장합니다. 오류 결과({"error": ...})와 일부만 가져온 결과(error가 있는 EventIndex)는 저장하지 않습니다."""
+        if isinstance(events, dict) or events.error: # 다음 요청 때 Google 캘린더를 다시 읽도록 함
+            return
+        key = (year, month)
+        with self._lock:
+            self._entries[key] = (time.time(), events)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False) # 가장 오래 사용하지 않은 월 제거
+
+    def invalidate(self, year=None, month=None):
+        """지정한 월(또는 인자가 없으면 전체)을 캐시에서 제거합니다."""
+        with self._lock:
+            if year is None:
+                self._entries.clear()
+            else:
+                self._entries.pop((year, month), None)
+
+    def fetch(self, year, month):
+        """캐시에 있으면 캐시된 값을, 없으면 get_events_for_month로 가져와 저장한 뒤 반환합니다."""
+        events = self.get(year, month)
+        if events is None:
+            metrics.incr("calendar.month_fetch")
+            events = get_events_for_month(year, month)
+            self.put(year, month, events)
+        return events
+
+def _shift_month(year, month, offset):
+    """(연도, 월)에서 offset개월 이동한 (연도, 월)을 반환합니다."""
+    index = year * 12 + (month - 1) + offset
+    return index // 12, index % 12 + 1
+
+class MonthPrefetcher:
+    """
+    월별 이벤트 로딩 스케줄러입니다.
+    - 같은 (연도, 월)에 대한 동시 요청은 진행 중인 하나의 Future를 공유합니다. (single-flight)
+    - 월 M을 보여주면 M-1, M+1을 백그라운드에서 미리 가져옵니다.
+    - 사용자가 빠르게 넘겨 더 이상 필요 없어진 월의 대기 중인 요청은 취소합니다.
+    """
+    def __init__(self, cache, max_workers=PREFETCH_WORKERS, radius=1):
+        self.cache = cache
+        self.radius = radius # 앞뒤로 미리 가져올 월 수
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="month-prefetch")
+        self._in_flight = {} # {(연도, 월): Future}
+        self._lock = threading.RLock() # 이미 끝난 Future의 완료 콜백은 등록한 스레드에서 바로 실행되므로 재진입 허용
+
+    def request(self, year, month):
+        """(연도, 월)의 이벤트를 담을 Future를 반환합니다. 캐시에 있으면 이미 완료된 Future를 반환합니다."""
+        key = (year, month)
+        events = self.cache.get(year, month)
+        if events is not None:
+            future = Future()
+            future.set_result(events)
+            return future
+
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is None: # 진행 중인 요청이 없을 때만 새로 요청
+                future = self._executor.submit(self.cache.fetch, year, month)
+                self._in_flight[key] = future
+                future.add_done_callback(lambda f, k=key: self._forget(k, f))
+            return future
+
+    def _forget(self, key, future):
+        with self._lock:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    def show(self, year, month):
+        """
+        월 M이 화면에 표시될 때 호출합니다.
+        M 주변이 아닌 월의 대기 중인 요청을 취소하고, M과 인접 월의 요청을 (M 먼저) 제출합니다.
+        월 M의 Future를 반환합니다.
+        """
+        wanted = [(year, month)]
+        for offset in range(1, self.radius + 1):
+            wanted += [_shift_month(year, month, offset), _shift_month(year, month, -offset)]
+
+        with self._lock:
+            for key, future in list(self._in_flight.items()):
+                if key not in wanted:
+                    future.cancel() # 아직 시작하지 않은 요청만 취소됨 (실행 중인 요청은 캐시를 채우고 끝남)
+
+        current = self.request(year, month)
+        for neighbor_year, neighbor_month in wanted[1:]:
+            self.request(neighbor_year, neighbor_month)
+        return current
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
 if __name__ == '__main__':
     # 테스트용: 현재 월의 이벤트를 가져와서 출력
     today = datetime.date.today()
     print(f"--- {today.year}년 {today.month}월 캘린더 일정 테스트 ---")
     monthly_events = get_events_for_month(today.year, today.month)
-    if "error" in monthly_events:
+    if isinstance(monthly_events, dict):
         print(monthly_events["error"])
     elif not monthly_events:
         print("이번 달에는 예정된 이벤트가 없습니다.")
     else:
-        for event_date, summaries in sorted(monthly_events.items()):
-            print(f"\n{event_date.strftime('%Y-%m-%d (%a)')}:") # 날짜와 요일 출력
-            for summary in summaries:
-                print(f"  - {summary}")
\ No newline at end of file
+        for day in range(1, monthrange(today.year, today.month)[1] + 1):
+            event_date = datetime.date(today.year, today.month, day)
+            events_today = monthly_events.on_date(event_date)
+            if events_today:
+                print(f"\n{event_date.strftime('%Y-%m-%d (%a)')}:") # 날짜와 요일 출력
+                for event in events_today:
+                    print(f"  - {event.summary}")
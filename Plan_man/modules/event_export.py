@@ -0,0 +1,83 @@
+# modules/event_export.py
+# calendar_manager.iter_events가 내보내는 API 이벤트를 JSON Lines 또는 iCalendar(ICS) 형식으로 씁니다.
+# 이벤트를 하나씩 받아 바로 쓰므로 몇 년치를 내보내도 메모리 사용량이 일정합니다.
+import datetime
+import json
+
+ICS_PRODID = "-//Plan Man//Calendar Export//KO"
+ICS_LINE_LIMIT = 75 # RFC 5545: 한 줄은 75바이트를 넘지 않도록 접음
+
+def event_to_json(event):
+    """API 이벤트를 내보내기용 딕셔너리로 변환합니다. 시작/끝은 API의 원본 값(시간대 포함)을 그대로 사용합니다."""
+    start = event['start']
+    end = event.get('end', start)
+    return {
+        "id": event['id'],
+        "calendar": event.get('calendarId', 'primary'),
+        "summary": event.get('summary', '제목 없음'),
+        "start": start.get('dateTime', start.get('date')),
+        "end": end.get('dateTime', end.get('date')),
+        "all_day": 'dateTime' not in start,
+    }
+
+def write_jsonl(events, out):
+    """이벤트를 한 줄에 하나씩 JSON으로 씁니다. 쓴 이벤트 수를 반환합니다."""
+    count = 0
+    for event in events:
+        out.write(json.dumps(event_to_json(event), ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+def _ics_escape(text):
+    return text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+def _ics_fold(line):
+    """75바이트를 넘는 줄을 접습니다. (UTF-8 문자가 중간에 잘리지 않도록 글자 단위로 자름)"""
+    if len(line.encode("utf-8")) <= ICS_LINE_LIMIT:
+        return line + "\r\n"
+    parts = []
+    current, size = "", 0
+    limit = ICS_LINE_LIMIT
+    for char in line:
+        char_size = len(char.encode("utf-8"))
+        if size + char_size > limit:
+            parts.append(current)
+            current, size = "", 0
+            limit = ICS_LINE_LIMIT - 1 # 이어지는 줄은 앞의 공백 한 칸을 포함
+        current += char
+        size += char_size
+    parts.append(current)
+    return "\r\n ".join(parts) + "\r\n"
+
+def _ics_time(name, time_info):
+    """start/end 정보를 DTSTART/DTEND 줄로 변환합니다. 시각은 UTC로, 종일 이벤트는 날짜로 씁니다."""
+    if 'dateTime' in time_info:
+        value = datetime.datetime.fromisoformat(time_info['dateTime'].replace('Z', '+00:00'))
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc)
+            return f"{name}:{value:%Y%m%dT%H%M%SZ}"
+        return f"{name}:{value:%Y%m%dT%H%M%S}"
+    return f"{name};VALUE=DATE:{datetime.date.fromisoformat(time_info['date']):%Y%m%d}"
+
+def write_ics(events, out):
+    """이벤트를 하나의 VCALENDAR로 씁니다. 쓴 이벤트 수를 반환합니다."""
+    stamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out.write("BEGIN:VCALENDAR\r\nVERSION:2.0\r\n" + _ics_fold(f"PRODID:{ICS_PRODID}") + "CALSCALE:GREGORIAN\r\n")
+    count = 0
+    for event in events:
+        start = event['start']
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:{event['id']}@{event.get('calendarId', 'primary')}",
+            f"DTSTAMP:{stamp}",
+            _ics_time("DTSTART", start),
+            _ics_time("DTEND", event.get('end', start)),
+            f"SUMMARY:{_ics_escape(event.get('summary', '제목 없음'))}",
+            "END:VEVENT",
+        ]
+        out.write("".join(_ics_fold(line) for line in lines))
+        count += 1
+    out.write("END:VCALENDAR\r\n")
+    return count
+
+WRITERS = {"jsonl": write_jsonl, "ics": write_ics}
@@ -0,0 +1,150 @@
+# modules/event_model.py
+# 캘린더 이벤트 레코드(Event)와 기간 겹침 조회용 인덱스(EventIndex)
+# 시각은 이 컴퓨터의 현지 시각(시간대 정보 없는 datetime)으로 다룹니다.
+# 종일 이벤트는 시작일 0시부터 종료일(다음 날) 0시까지로 봅니다.
+import bisect
+import datetime
+import heapq
+from array import array
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_ONE_DAY = datetime.timedelta(days=1)
+
+def _to_datetime(value):
+    """date 또는 datetime을 시간대 정보 없는 datetime으로 변환합니다. (aware datetime은 적힌 현지 시각을 그대로 사용)"""
+    if isinstance(value, datetime.datetime):
+        return value.replace(tzinfo=None)
+    return datetime.datetime(value.year, value.month, value.day)
+
+def _minutes(value):
+    """정렬/비교에 쓰는 정수 키 (1970-01-01 0시부터의 분)"""
+    delta = _to_datetime(value) - _EPOCH
+    return delta.days * 1440 + delta.seconds // 60
+
+def parse_event_time(time_info):
+    """
+    API 이벤트의 start/end 정보({'dateTime': ...} 또는 {'date': ...})를 (datetime, 종일 여부)로 변환합니다.
+    'dateTime'은 이 컴퓨터의 현지 시각으로 바꿉니다. (예: 한국 시간대에서 '2025-03-01T00:00:00Z' -> 2025-03-01 09:00)
+    월 경계도 같은 현지 시각으로 다루므로, 어느 경로로 읽어도 같은 날짜에 표시됩니다.
+    """
+    if 'dateTime' in time_info:
+        moment = datetime.datetime.fromisoformat(time_info['dateTime'].replace('Z', '+00:00'))
+        return moment.astimezone().replace(tzinfo=None), False
+    return _to_datetime(datetime.date.fromisoformat(time_info['date'])), True
+
+class Event:
+    """
+    캘린더 이벤트 하나를 나타내는 레코드입니다. (__slots__로 딕셔너리보다 메모리를 적게 씀)
+    start/end는 datetime이며 end는 포함하지 않습니다. calendar는 이벤트가 속한 캘린더 ID입니다.
+    transparent는 '한가함'으로 표시된 일정(바쁜 시간에 넣지 않음)인지 여부입니다.
+    """
+    __slots__ = ("id", "start", "end", "all_day", "summary", "calendar", "transparent")
+
+    def __init__(self, id, start, end, all_day, summary, calendar, transparent=False):
+        self.id = id
+        self.start = start
+        self.end = max(end, start) # 끝이 시작보다 앞선 잘못된 데이터 방지
+        self.all_day = all_day
+        self.summary = summary
+        self.calendar = calendar
+        self.transparent = transparent
+
+    @classmethod
+    def from_api(cls, event, calendar_id=None):
+        """Google Calendar API의 이벤트 딕셔너리로 Event를 만듭니다."""
+        start, all_day = parse_event_time(event['start'])
+        end = parse_event_time(event['end'])[0] if 'end' in event else start
+        if all_day and end == start:
+            end = start + _ONE_DAY
+        return cls(event['id'], start, end, all_day, event.get('summary', '제목 없음'),
+                   calendar_id or event.get('calendarId', 'primary'), event.get('transparency') == 'transparent')
+
+    @property
+    def first_day(self):
+        """이벤트가 걸친 첫날"""
+        return self.start.date()
+
+    @property
+    def last_day(self):
+        """이벤트가 걸친 마지막 날 (끝 시각이 자정이면 그 전날까지)"""
+        if self.end <= self.start:
+            return self.start.date()
+        return (self.end - datetime.timedelta(microseconds=1)).date()
+
+    def __repr__(self):
+        return f"Event({self.id!r}, {self.start:%Y-%m-%d %H:%M}~{self.end:%Y-%m-%d %H:%M}, {self.summary!r})"
+
+class EventIndex:
+    """
+    시작 시각으로 정렬한 배열에 이분 탐색(bisect)을 사용하는 이벤트 기간 인덱스입니다.
+    이벤트는 길이(분)에 따라 2의 거듭제곱 단위 등급으로 나누어 보관합니다.
+    [a, b)와 겹치는 이벤트는 각 등급에서 시작 시각이 [a - 등급 최대 길이, b)인 이벤트 중에만 있으므로,
+    등급 수(약 20개)만큼의 이분 탐색과 결과 수에 비례하는 시간, 즉 O(log n + k)로 찾을 수 있습니다.
+    """
+    def __init__(self, events=()):
+        self._levels = {} # {등급: (시작 키 array, 이벤트 리스트)} - 시작 시각 순
+        self._count = 0
+        self.error = None # 일부 일정만 담긴 결과이면 빠진 부분의 오류 메시지 (캐시에 저장하지 않음)
+        for level, group in self._group_by_level(events).items():
+            group.sort(key=lambda event: event.start)
+            self._levels[level] = (array('q', (_minutes(event.start) for event in group)), group)
+            self._count += len(group)
+
+    @staticmethod
+    def _level(event):
+        # 길이가 2^(등급-1)분 초과 2^등급분 이하인 이벤트의 등급 (길이 0인 이벤트는 1분으로 취급)
+        return max(1, _minutes(event.end) - _minutes(event.start) - 1).bit_length()
+
+    @classmethod
+    def _group_by_level(cls, events):
+        groups = {}
+        for event in events:
+            groups.setdefault(cls._level(event), []).append(event)
+        return groups
+
+    def add(self, event):
+        """이벤트 하나를 정렬 순서를 유지하며 추가합니다."""
+        level = self._level(event)
+        starts, events = self._levels.setdefault(level, (array('q'), []))
+        key = _minutes(event.start)
+        position = bisect.bisect_right(starts, key)
+        starts.insert(position, key)
+        events.insert(position, event)
+        self._count += 1
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        """모든 이벤트를 시작 시각 순으로 내보냅니다."""
+        return heapq.merge(*(events for _, events in self._levels.values()), key=lambda event: event.start)
+
+    def overlapping(self, start, end):
+        """[start, end) 기간과 겹치는 이벤트를 시작 시각 순 리스트로 반환합니다. (date 또는 datetime)"""
+        start_key, end_key = _minutes(start), _minutes(end)
+        found = []
+        for level, (starts, events) in self._levels.items():
+            low = bisect.bisect_left(starts, start_key - (1 << level))
+            high = bisect.bisect_left(starts, end_key)
+            for i in range(low, high):
+                event = events[i]
+                # 길이 0인 이벤트는 시작 시각이 기간 안에 있을 때 겹치는 것으로 봄
+                if _minutes(event.end) > start_key or (event.end == event.start and starts[i] >= start_key):
+                    found.append(event)
+        found.sort(key=lambda event: event.start)
+        return found
+
+    def on_date(self, day):
+        """해당 날짜(date)에 걸친 이벤트를 시작 시각 순으로 반환합니다. (여러 날 이벤트와 자정을 넘는 이벤트 포함)"""
+        return self.overlapping(day, day + _ONE_DAY)
+
+    def count_by_date(self, first_day, last_day):
+        """first_day부터 last_day까지 날짜별 이벤트 수 {date: 개수}를 반환합니다. (이벤트가 없는 날짜는 제외)"""
+        counts = {}
+        for event in self.overlapping(first_day, last_day + _ONE_DAY):
+            day = max(event.first_day, first_day)
+            last = min(event.last_day, last_day)
+            while day <= last:
+                counts[day] = counts.get(day, 0) + 1
+                day += _ONE_DAY
+        return counts
@@ -0,0 +1,603 @@
+# modules/ics_importer.py
+# 다른 캘린더에서 내보낸 iCalendar(.ics) 파일을 가져와 Google 캘린더 일정과 함께 보여줍니다.
+# 파일은 한 줄씩 읽으며 VEVENT 하나를 다 읽을 때마다 처리하므로, 수십 MB 파일도 한꺼번에 메모리에 올리지 않습니다.
+# 반복 일정(RRULE)은 발생 일정을 미리 만들지 않고, 조회하는 기간의 발생만 계산합니다.
+# 계산 결과는 (반복 규칙, 기간)을 키로 기억해 두므로 같은 달을 다시 볼 때는 다시 계산하지 않습니다.
+# 시각은 event_model과 같이 이 컴퓨터의 현지 시각으로 다룹니다. UTC('Z')와 TZID가 있는 시각은 현지 시각으로 바꾸고,
+# 시간대가 없는(floating) 시각과 날짜는 적힌 그대로 사용합니다.
+# 반복 일정은 DTSTART의 시간대에서 계산한 뒤 현지 시각으로 바꿉니다. (서머타임이 있는 시간대에서도 같은 시각에 반복)
+import datetime
+import functools
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import zoneinfo
+from calendar import monthrange
+from collections import OrderedDict, namedtuple
+from core import metrics
+from modules import search_index
+from modules.event_model import Event, EventIndex
+
+ICS_IMPORTS_FILE = 'ics_imports.json' # 가져온 ICS 파일 목록
+ICS_CALENDAR_COLOR = '#8e24aa' # 가져온 캘린더의 일정 색
+EXPANSION_CACHE_SIZE = 1024 # 기억해 둘 (반복 규칙, 기간) 계산 결과 수
+MAX_RULE_PERIODS = 100000 # COUNT를 셀 때 훑어볼 최대 주기 수 (발생이 없는 잘못된 규칙에서 멈추기 위함)
+
+_WEEKDAYS = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+_FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+_RULE_PARTS = {"FREQ", "INTERVAL", "COUNT", "UNTIL", "BYDAY", "BYMONTHDAY", "BYMONTH", "BYSETPOS", "WKST"}
+_EVENT_PROPERTIES = {"UID", "SUMMARY", "DTSTART", "DTEND", "DURATION", "RRULE", "EXDATE", "RDATE", "RECURRENCE-ID",
+                     "STATUS"}
+_DURATION = re.compile(r"([-+])?P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$")
+_BYDAY = re.compile(r"([-+]?\d*)(MO|TU|WE|TH|FR|SA|SU)$")
+_ONE_DAY = datetime.timedelta(days=1)
+_UTC = datetime.timezone.utc
+
+logger = logging.getLogger(__name__)
+
+# 반복 일정의 발생 시각을 정하는 값 (해시 가능하므로 계산 결과 캐시의 키로 사용)
+# start/exdates/rdates는 zone(DTSTART의 시간대, None이면 현지 시각) 기준의 시각입니다.
+Recurrence = namedtuple("Recurrence", "start duration rule exdates rdates zone", defaults=(None,))
+RecurringEvent = namedtuple("RecurringEvent", "recurrence uid summary all_day")
+
+_expansions = OrderedDict() # {(Recurrence, 기간 시작, 기간 끝): 발생 시작 시각 tuple}
+_expansion_lock = threading.Lock()
+_imports = None # [{"id", "path", "summary"}] - 처음 사용할 때 ICS_IMPORTS_FILE에서 읽음
+_calendars = {} # {캘린더 ID: ((파일 수정 시각, 크기), IcsCalendar)}
+_missing = set() # 찾을 수 없다고 이미 알린 파일
+_lock = threading.RLock()
+
+def _unfolded_lines(lines):
+    """RFC 5545의 접힌 줄(공백이나 탭으로 시작하는 다음 줄)을 이어 붙여 논리적인 줄을 하나씩 내보냅니다."""
+    current = None
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t"):
+            if current is not None:
+                current += line[1:]
+            continue
+        if current:
+            yield current
+        current = line
+    if current:
+        yield current
+
+def _parse_property(line):
+    """'이름;매개변수=값;...:값' 줄을 (이름, {매개변수}, 값)으로 나눕니다. (따옴표 안의 ':'와 ';'는 구분자로 보지 않음)"""
+    if '"' in line:
+        quoted = False
+        for index, char in enumerate(line):
+            if char == '"':
+                quoted = not quoted
+            elif char == ':' and not quoted:
+                break
+        else:
+            index = len(line)
+    else:
+        index = line.find(':')
+        if index < 0:
+            index = len(line)
+    head, value = line[:index], line[index + 1:]
+    name, *params = head.split(';') if '"' not in head else re.findall(r'(?:[^;"]|"[^"]*")+', head)
+    parsed = {}
+    for param in params:
+        key, _, param_value = param.partition('=')
+        parsed[key.upper()] = param_value.strip('"')
+    return name.upper(), parsed, value
+
+def _unescape(text):
+    return (text.replace("\\n", "\n").replace("\\N", "\n").replace("\\,", ",").replace("\\;", ";")
+            .replace("\\\\", "\\"))
+
+@functools.lru_cache(maxsize=None)
+def _zone(name):
+    """TZID 이름의 시간대. 이 컴퓨터의 시간대 데이터에 없으면 경고를 한 번 남기고 None을 반환합니다."""
+    try:
+        return zoneinfo.ZoneInfo(name)
+    except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+        logger.warning("지원하지 않는 시간대(TZID=%s)의 시각은 이 컴퓨터의 현지 시각으로 봅니다.", name)
+        return None
+
+def _time_zone(params, value):
+    """값의 시간대: 'Z'이면 UTC, 지원하는 TZID이면 그 시간대, 날짜이거나 시간대가 없으면 None"""
+    value = value.strip()
+    if params.get("VALUE", "").upper() == "DATE" or len(value) == 8:
+        return None
+    if value.endswith("Z"):
+        return _UTC
+    return _zone(params["TZID"]) if "TZID" in params else None
+
+def _to_zone(moment, zone):
+    """현지 시각을 zone 시간대의 시각으로 (모두 시간대 정보 없는 datetime)"""
+    return moment if zone is None else moment.astimezone(zone).replace(tzinfo=None)
+
+def _from_zone(moment, zone):
+    """zone 시간대의 시각을 현지 시각으로 (모두 시간대 정보 없는 datetime)"""
+    return moment if zone is None else moment.replace(tzinfo=zone).astimezone().replace(tzinfo=None)
+
+def _parse_time(params, value, frame=None):
+    """
+    DTSTART/DTEND 등의 값을 (datetime, 날짜만 있는지)로 변환합니다.
+    'Z'(UTC)와 TZID가 있는 시각은 frame 시간대(None이면 이 컴퓨터의 현지 시각)의 시각으로 바꾸고,
+    날짜와 시간대가 없는 시각은 적힌 그대로 사용합니다.
+    """
+    value = value.strip()
+    if params.get("VALUE", "").upper() == "DATE" or len(value) == 8:
+        return datetime.datetime(int(value[0:4]), int(value[4:6]), int(value[6:8])), True
+    if len(value) < 15 or value[8] != "T":
+        raise ValueError(f"잘못된 날짜/시각 값: {value}")
+    moment = datetime.datetime(int(value[0:4]), int(value[4:6]), int(value[6:8]),
+                               int(value[9:11]), int(value[11:13]), int(value[13:15]))
+    zone = _UTC if value.endswith("Z") else _zone(params["TZID"]) if "TZID" in params else None
+    if zone is not None and zone is not frame:
+        moment = moment.replace(tzinfo=zone).astimezone(frame).replace(tzinfo=None)
+    return moment, False
+
+def _parse_times(params, value, frame=None):
+    """EXDATE/RDATE처럼 쉼표로 여러 값을 적는 속성의 datetime 리스트 (기간(PERIOD) 값은 시작 시각만 사용)"""
+    return [_parse_time(params, item.split("/")[0], frame)[0] for item in value.split(",") if item.strip()]
+
+def _parse_duration(value):
+    match = _DURATION.match(value.strip())
+    if not match:
+        raise ValueError(f"잘못된 기간 값: {value}")
+    sign, weeks, days, hours, minutes, seconds = match.groups()
+    duration = datetime.timedelta(weeks=int(weeks or 0), days=int(days or 0), hours=int(hours or 0),
+                                  minutes=int(minutes or 0), seconds=int(seconds or 0))
+    return -duration if sign == "-" else duration
+
+class Rule:
+    """RRULE 값을 해석한 결과 (parse_rule 참고)"""
+    __slots__ = ("freq", "interval", "count", "until", "byday", "bymonthday", "bymonth", "bysetpos", "wkst")
+
+@functools.lru_cache(maxsize=EXPANSION_CACHE_SIZE)
+def parse_rule(text, zone=None):
+    """
+    RRULE 값('FREQ=WEEKLY;BYDAY=MO,WE;UNTIL=...')을 Rule로 변환합니다.
+    UNTIL은 DTSTART와 비교할 수 있도록 zone(DTSTART의 시간대, None이면 현지 시각)의 시각으로 바꿉니다.
+    FREQ는 DAILY/WEEKLY/MONTHLY/YEARLY, 규칙 부분은 INTERVAL, COUNT, UNTIL, BYDAY, BYMONTHDAY, BYMONTH, BYSETPOS, WKST를
+    지원하며, 그 밖의 부분(BYHOUR, BYWEEKNO 등)이 있으면 ValueError를 발생시킵니다.
+    """
+    parts = dict(part.upper().split("=", 1) for part in text.strip().split(";") if "=" in part)
+    unsupported = set(parts) - _RULE_PARTS
+    if unsupported or parts.get("FREQ") not in _FREQUENCIES:
+        raise ValueError(f"지원하지 않는 반복 규칙: {text}")
+    rule = Rule()
+    rule.freq = parts["FREQ"]
+    rule.interval = max(1, int(parts.get("INTERVAL", 1)))
+    rule.count = int(parts["COUNT"]) if "COUNT" in parts else None
+    rule.until = None
+    if "UNTIL" in parts:
+        until, date_only = _parse_time({}, parts["UNTIL"], zone)
+        rule.until = until.replace(hour=23, minute=59, second=59) if date_only else until # 날짜만 있으면 그날 끝까지
+    rule.byday = []
+    for item in filter(None, parts.get("BYDAY", "").split(",")):
+        match = _BYDAY.match(item)
+        if not match:
+            raise ValueError(f"잘못된 BYDAY 값: {item}")
+        rule.byday.append((int(match.group(1) or 0), _WEEKDAYS[match.group(2)]))
+    rule.bymonthday = [int(day) for day in filter(None, parts.get("BYMONTHDAY", "").split(","))]
+    rule.bymonth = [int(month) for month in filter(None, parts.get("BYMONTH", "").split(","))]
+    rule.bysetpos = [int(position) for position in filter(None, parts.get("BYSETPOS", "").split(","))]
+    rule.wkst = _WEEKDAYS.get(parts.get("WKST", "MO"), 0)
+    if rule.freq == "YEARLY" and not rule.bymonth and any(n for n, _ in rule.byday):
+        raise ValueError(f"지원하지 않는 반복 규칙 (연 단위 n번째 요일): {text}")
+    return rule
+
+def _month_days(rule, year, month, default_day):
+    """year년 month월에서 규칙(BYMONTHDAY, BYDAY)에 맞는 날(일) 리스트 (작은 순)"""
+    last = monthrange(year, month)[1]
+    days = None
+    if rule.bymonthday:
+        days = {day if day > 0 else last + day + 1 for day in rule.bymonthday}
+        days = {day for day in days if 1 <= day <= last}
+    if rule.byday:
+        first_weekday = datetime.date(year, month, 1).weekday()
+        matched = set()
+        for n, weekday in rule.byday:
+            candidates = range(1 + (weekday - first_weekday) % 7, last + 1, 7)
+            if n == 0:
+                matched.update(candidates)
+            elif -len(candidates) <= n <= len(candidates):
+                matched.add(candidates[n - 1 if n > 0 else n]) # n번째(음수면 뒤에서 n번째) 요일
+        days = matched if days is None else days & matched
+    if days is None: # BYMONTHDAY, BYDAY가 없으면 시작일과 같은 날 (그날이 없는 달은 건너뜀)
+        days = {default_day} if default_day <= last else set()
+    return sorted(days)
+
+def _matches_day(rule, day):
+    """DAILY 규칙의 날짜 필터 (BYMONTH, BYMONTHDAY, BYDAY)"""
+    if rule.bymonth and day.month not in rule.bymonth:
+        return False
+    if rule.bymonthday:
+        last = monthrange(day.year, day.month)[1]
+        if not any(day.day == (d if d > 0 else last + d + 1) for d in rule.bymonthday):
+            return False
+    return not rule.byday or any(day.weekday() == weekday for _, weekday in rule.byday)
+
+def _week_start(rule, day):
+    return day - datetime.timedelta(days=(day.weekday() - rule.wkst) % 7)
+
+def _period_index(rule, start, day):
+    """day가 속한 주기(일/주/월/연)의 번호 (start가 속한 주기가 0, 그 앞이면 0)"""
+    first = start.date()
+    if rule.freq == "DAILY":
+        periods = (day - first).days
+    elif rule.freq == "WEEKLY":
+        periods = (_week_start(rule, day) - _week_start(rule, first)).days // 7
+    elif rule.freq == "MONTHLY":
+        periods = (day.year - first.year) * 12 + day.month - first.month
+    else:
+        periods = day.year - first.year
+    return max(0, periods // rule.interval)
+
+def _period(rule, start, k):
+    """k번째 주기의 (첫날, 발생 시작 시각 후보 리스트(시각 순, BYSETPOS 적용))"""
+    first = start.date()
+    if rule.freq == "DAILY":
+        begin = first + datetime.timedelta(days=k * rule.interval)
+        days = [begin] if _matches_day(rule, begin) else []
+    elif rule.freq == "WEEKLY":
+        begin = _week_start(rule, first) + datetime.timedelta(weeks=k * rule.interval)
+        weekdays = {weekday for _, weekday in rule.byday} or {first.weekday()}
+        days = sorted(begin + datetime.timedelta(days=(weekday - rule.wkst) % 7) for weekday in weekdays)
+        if rule.bymonth:
+            days = [day for day in days if day.month in rule.bymonth]
+    elif rule.freq == "MONTHLY":
+        year, month = divmod(first.year * 12 + first.month - 1 + k * rule.interval, 12)
+        begin = datetime.date(year, month + 1, 1)
+        days = [] if rule.bymonth and month + 1 not in rule.bymonth else \
+            [begin.replace(day=day) for day in _month_days(rule, year, month + 1, first.day)]
+    else:
+        year = first.year + k * rule.interval
+        begin = datetime.date(year, 1, 1)
+        months = rule.bymonth or (range(1, 13) if rule.bymonthday or rule.byday else (first.month,))
+        days = [datetime.date(year, month, day) for month in sorted(months)
+                for day in _month_days(rule, year, month, first.day)]
+    times = [datetime.datetime.combine(day, start.time()) for day in days]
+    if rule.bysetpos:
+        times = sorted({times[p - 1 if p > 0 else p] for p in rule.bysetpos if -len(times) <= p <= len(times) and p})
+    return begin, times
+
+@functools.lru_cache(maxsize=EXPANSION_CACHE_SIZE)
+def _count_end(rule_text, start, zone=None):
+    """COUNT가 있는 규칙의 마지막 발생 시각 (시작 시각도 한 번으로 셈). 규칙마다 한 번만 계산"""
+    rule = parse_rule(rule_text, zone)
+    left = rule.count - 1
+    last = start
+    if not rule.bysetpos and (rule.freq == "WEEKLY" and not rule.bymonth or
+                              rule.freq == "DAILY" and not (rule.bymonth or rule.bymonthday or rule.byday)):
+        # 주기마다 발생 수가 같은 규칙: 첫 주기(시작 시각 앞의 후보가 있을 수 있음)만 세고 마지막 발생이 있는 주기로 바로 감
+        moments = [moment for moment in _period(rule, start, 0)[1] if moment > start]
+        if left <= len(moments):
+            return moments[left - 1] if left > 0 else start
+        left -= len(moments)
+        per_period = len(_period(rule, start, 1)[1])
+        k = (left - 1) // per_period + 1
+        return _period(rule, start, k)[1][left - (k - 1) * per_period - 1]
+    for k in range(MAX_RULE_PERIODS):
+        if left <= 0:
+            break
+        for moment in _period(rule, start, k)[1]:
+            if moment > start and (rule.until is None or moment <= rule.until):
+                last = moment
+                left -= 1
+                if left <= 0:
+                    break
+    return last
+
+def _as_datetime(value):
+    if isinstance(value, datetime.datetime):
+        return value.replace(tzinfo=None)
+    return datetime.datetime(value.year, value.month, value.day)
+
+def _expand(recurrence, start, end):
+    rule = parse_rule(recurrence.rule, recurrence.zone)
+    first, duration = recurrence.start, recurrence.duration
+    until = rule.until
+    if rule.count is not None:
+        count_end = _count_end(recurrence.rule, first, recurrence.zone)
+        until = count_end if until is None else min(until, count_end)
+
+    def overlaps(moment):
+        # 길이 0인 일정은 시작 시각이 기간 안에 있을 때 겹치는 것으로 봄 (EventIndex와 같은 기준)
+        return moment < end and (moment + duration > start or (not duration and moment >= start))
+
+    found = {first} if overlaps(first) else set() # 시작 시각은 규칙과 맞지 않아도 첫 발생
+    if rule.freq == "DAILY" and not (rule.bymonth or rule.bymonthday or rule.byday or rule.bysetpos):
+        # 필터가 없는 매일 반복: 기간 안의 첫 발생으로 바로 건너뛰어 간격만큼 더해 감
+        step = datetime.timedelta(days=rule.interval)
+        moment = first + max(1, (start - duration - first) // step) * step
+        while moment < end and (until is None or moment <= until):
+            if overlaps(moment):
+                found.add(moment)
+            moment += step
+        found.update(moment for moment in recurrence.rdates if overlaps(moment))
+        return tuple(sorted(found - recurrence.exdates))
+    k = _period_index(rule, first, (start - duration).date())
+    while True:
+        begin, moments = _period(rule, first, k)
+        if begin >= end.date() + _ONE_DAY or (until is not None and begin > until.date()):
+            break
+        for moment in moments:
+            if moment > first and (until is None or moment <= until) and overlaps(moment):
+                found.add(moment)
+        k += 1
+    found.update(moment for moment in recurrence.rdates if overlaps(moment))
+    return tuple(sorted(found - recurrence.exdates))
+
+def expand(recurrence, start, end):
+    """
+    반복 일정 중 [start, end) 기간과 겹치는 발생의 시작 시각 tuple을 반환합니다. (date 또는 datetime)
+    기간과 결과는 모두 recurrence.zone 시간대의 시각입니다.
+    기간 앞쪽의 주기는 건너뛰고 기간에 걸친 주기만 계산하며, 결과는 (반복 규칙, 기간)을 키로 기억해 둡니다.
+    """
+    start, end = _as_datetime(start), _as_datetime(end)
+    key = (recurrence, start, end)
+    with _expansion_lock:
+        occurrences = _expansions.get(key)
+        if occurrences is not None:
+            _expansions.move_to_end(key)
+            metrics.incr("ics.expansion_hit")
+            return occurrences
+    metrics.incr("ics.expansion_miss")
+    occurrences = _expand(recurrence, start, end)
+    with _expansion_lock:
+        _expansions[key] = occurrences
+        while len(_expansions) > EXPANSION_CACHE_SIZE:
+            _expansions.popitem(last=False)
+    return occurrences
+
+class IcsCalendar:
+    """
+    ICS 파일 하나의 일정입니다.
+    한 번만 있는 일정(반복 일정의 변경된 발생 포함)은 EventIndex에, 반복 일정은 RecurringEvent로 보관합니다.
+    """
+    def __init__(self, calendar_id, summary, singles, recurring, skipped=0, unknown_zones=()):
+        self.id = calendar_id
+        self.summary = summary
+        self.singles = EventIndex(singles)
+        self.recurring = recurring
+        self.skipped = skipped # 지원하지 않는 반복 규칙이라 첫 발생만 보여주는 일정 수
+        self.unknown_zones = sorted(unknown_zones) # 지원하지 않아 현지 시각으로 본 TZID
+
+    def events_between(self, start, end):
+        """[start, end) 기간과 겹치는 일정(Event) 리스트 (반복 일정은 이 기간의 발생만 만듦)"""
+        events = self.singles.overlapping(start, end)
+        start, end = _as_datetime(start), _as_datetime(end)
+        windows = {None: (start, end)} # {시간대: 그 시간대로 바꾼 기간}
+        for master in self.recurring:
+            recurrence = master.recurrence
+            zone = recurrence.zone
+            window = windows.get(zone)
+            if window is None:
+                # 서머타임 경계에서 벗어나지 않도록 하루씩 넓혀 계산하고, 현지 시각으로 바꾼 뒤 다시 거름
+                window = windows[zone] = (_to_zone(start, zone) - _ONE_DAY, _to_zone(end, zone) + _ONE_DAY)
+            if recurrence.start >= window[1] and not recurrence.rdates:
+                continue # 기간 뒤에 시작하는 반복 일정
+            for moment in expand(recurrence, *window):
+                local = _from_zone(moment, zone)
+                if zone is not None and not (local < end and (local + recurrence.duration > start or
+                                                               (not recurrence.duration and local >= start))):
+                    continue
+                events.append(Event(f"{master.uid}_{moment.isoformat()}", local, local + recurrence.duration,
+                                    master.all_day, master.summary, self.id))
+        return events
+
+    def search_events(self):
+        """검색 색인에 넣을 일정: 한 번만 있는 일정과, 반복 일정마다 첫 발생 하나 (발생이 끝없이 이어질 수 있으므로)"""
+        events = list(self.singles)
+        for master in self.recurring:
+            recurrence = master.recurrence
+            start = _from_zone(recurrence.start, recurrence.zone)
+            events.append(Event(master.uid, start, start + recurrence.duration, master.all_day, master.summary,
+                                self.id))
+        return events
+
+def parse_ics(lines, calendar_id, summary=None):
+    """
+    ICS 내용을 한 줄씩(lines: 문자열을 내보내는 iterable, 예: 열린 파일) 읽어 IcsCalendar를 만듭니다.
+    summary가 없으면 X-WR-CALNAME을 캘린더 이름으로 사용합니다.
+    VEVENT 밖의 구성 요소(VTIMEZONE, VTODO 등)와 VEVENT 안의 VALARM은 건너뜁니다.
+    """
+    singles = []
+    masters = {} # {UID: (시작, 길이, 종일 여부, 제목, RRULE, EXDATE 집합, RDATE 집합, 시간대)}
+    overridden = {} # {UID: 따로 적힌(변경/취소된) 발생의 RECURRENCE-ID (매개변수, 값) 리스트}
+    skipped = 0
+    unknown_zones = set()
+    found_calendar = False
+    props = None # 읽고 있는 VEVENT의 속성 {이름: (매개변수, 값)}
+    nested = 0 # VEVENT 안의 VALARM 등 하위 구성 요소 깊이
+
+    for line in _unfolded_lines(lines):
+        name = line.partition(":")[0].partition(";")[0].upper()
+        if name == "BEGIN":
+            component = line[6:].strip().upper()
+            if component == "VCALENDAR":
+                found_calendar = True
+            elif component == "VEVENT" and props is None:
+                props = {}
+            elif props is not None:
+                nested += 1
+        elif name == "END":
+            if props is None:
+                continue
+            if nested:
+                nested -= 1
+            elif line[4:].strip().upper() == "VEVENT":
+                try:
+                    skipped += _add_event(props, calendar_id, singles, masters, overridden)
+                except (ValueError, KeyError) as e:
+                    logger.warning("ICS 일정 하나를 읽지 못했습니다 (%s): %s", props.get("UID", ("", "?"))[1], e)
+                props = None
+        elif props is None:
+            if name == "X-WR-CALNAME" and summary is None:
+                summary = _unescape(_parse_property(line)[2]).strip() or None
+        elif not nested and name in _EVENT_PROPERTIES: # DESCRIPTION 등 쓰지 않는 속성은 나누지 않고 건너뜀
+            name, params, value = _parse_property(line)
+            if "TZID" in params and _zone(params["TZID"]) is None:
+                unknown_zones.add(params["TZID"])
+            if name in ("EXDATE", "RDATE"):
+                props.setdefault(name, []).append((params, value))
+            else:
+                props[name] = (params, value)
+    if not found_calendar:
+        raise ValueError("iCalendar(BEGIN:VCALENDAR) 파일이 아닙니다.")
+
+    recurring = []
+    for uid, (start, duration, all_day, title, rule, exdates, rdates, zone) in masters.items():
+        exdates |= {_parse_time(params, value, zone)[0] for params, value in overridden.get(uid, ())}
+        recurring.append(RecurringEvent(Recurrence(start, duration, rule, frozenset(exdates), frozenset(rdates), zone),
+                                        uid, title, all_day))
+    recurring.sort(key=lambda master: master.recurrence.start)
+    return IcsCalendar(calendar_id, summary, singles, recurring, skipped, unknown_zones)
+
+def _add_event(props, calendar_id, singles, masters, overridden):
+    """읽은 VEVENT 하나를 한 번만 있는 일정 또는 반복 일정으로 분류합니다. 첫 발생만 보여주게 된 반복 일정이면 1을 반환"""
+    # 반복 일정은 DTSTART의 시간대에서 계산하고, 나머지는 현지 시각으로 읽음
+    zone = _time_zone(*props["DTSTART"]) if "RRULE" in props and "RECURRENCE-ID" not in props else None
+    start, all_day = _parse_time(*props["DTSTART"], zone)
+    if "DTEND" in props:
+        end = _parse_time(*props["DTEND"], zone)[0]
+    elif "DURATION" in props:
+        end = start + _parse_duration(props["DURATION"][1])
+    else:
+        end = start + _ONE_DAY if all_day else start
+    end = max(end, start)
+    uid = props.get("UID", ({}, ""))[1].strip() or f"ics-{len(singles) + len(masters)}"
+    title = _unescape(props.get("SUMMARY", ({}, ""))[1]).strip() or "제목 없음"
+    cancelled = props.get("STATUS", ({}, ""))[1].strip().upper() == "CANCELLED"
+
+    if "RECURRENCE-ID" in props: # 반복 일정 중 하나의 발생만 바뀌거나 취소된 경우
+        recurrence_id = _parse_time(*props["RECURRENCE-ID"])[0]
+        overridden.setdefault(uid, []).append(props["RECURRENCE-ID"]) # 반복 일정의 시간대로 바꾸는 것은 다 읽은 뒤
+        if not cancelled:
+            singles.append(Event(f"{uid}_{recurrence_id.isoformat()}", start, end, all_day, title, calendar_id))
+        return 0
+    if cancelled:
+        return 0
+    if "RRULE" in props:
+        rule = props["RRULE"][1]
+        try:
+            parse_rule(rule, zone)
+        except ValueError as e:
+            logger.warning("%s: 첫 발생만 표시합니다.", e)
+        else:
+            exdates = {moment for params, value in props.get("EXDATE", ())
+                       for moment in _parse_times(params, value, zone)}
+            rdates = {moment for params, value in props.get("RDATE", ()) for moment in _parse_times(params, value, zone)}
+            masters[uid] = (start, end - start, all_day, title, rule, exdates, rdates, zone)
+            return 0
+        start, end = _from_zone(start, zone), _from_zone(end, zone)
+        singles.append(Event(uid, start, end, all_day, title, calendar_id))
+        return 1
+    singles.append(Event(uid, start, end, all_day, title, calendar_id))
+    return 0
+
+def _calendar_id(path):
+    return "ics:" + hashlib.sha1(path.encode("utf-8")).hexdigest()[:12]
+
+def load_ics(path, calendar_id=None):
+    """ICS 파일을 읽어 IcsCalendar를 반환합니다. 캘린더 이름이 없으면 파일 이름을 사용합니다."""
+    path = os.path.abspath(path)
+    with metrics.span("ics.parse"), open(path, "r", encoding="utf-8-sig", errors="replace", newline="") as f:
+        calendar = parse_ics(f, calendar_id or _calendar_id(path))
+    if not calendar.summary:
+        calendar.summary = os.path.splitext(os.path.basename(path))[0]
+    return calendar
+
+def _load_imports():
+    global _imports
+    if _imports is None:
+        try:
+            with open(ICS_IMPORTS_FILE, "r", encoding="utf-8") as f:
+                _imports = json.load(f)
+        except FileNotFoundError:
+            _imports = []
+        except (OSError, ValueError) as e:
+            logger.warning("가져온 ICS 목록을 읽지 못했습니다: %s", e)
+            _imports = []
+    return _imports
+
+def _save_imports():
+    tmp_path = f"{ICS_IMPORTS_FILE}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(_imports, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, ICS_IMPORTS_FILE)
+
+def import_file(path):
+    """
+    ICS 파일을 가져옵니다. (같은 파일을 다시 가져오면 다시 읽음)
+    {"id", "summary", "events": 한 번만 있는 일정 수, "recurring": 반복 일정 수, "skipped": 첫 발생만 보여주는 반복 일정 수,
+    "unknown_zones": 현지 시각으로 본 TZID 리스트} 또는 {"error": "에러 메시지"}를 반환합니다.
+    """
+    path = os.path.abspath(path)
+    try:
+        stat = os.stat(path)
+        calendar = load_ics(path)
+    except OSError as e:
+        return {"error": f"ICS 파일을 읽지 못했습니다: {e}"}
+    except ValueError as e:
+        return {"error": str(e)}
+    with _lock:
+        imports = [entry for entry in _load_imports() if entry["id"] != calendar.id]
+        imports.append({"id": calendar.id, "path": path, "summary": calendar.summary})
+        _imports[:] = imports
+        _calendars[calendar.id] = ((stat.st_mtime, stat.st_size), calendar)
+        _missing.discard(path)
+        search_index.index_events(calendar.search_events(), calendar.id, replace=True)
+        try:
+            _save_imports()
+        except OSError as e:
+            return {"error": f"가져온 ICS 목록을 저장하지 못했습니다: {e}"}
+    return {"id": calendar.id, "summary": calendar.summary, "events": len(calendar.singles),
+            "recurring": len(calendar.recurring), "skipped": calendar.skipped, "unknown_zones": calendar.unknown_zones}
+
+def remove_imports(calendar_ids=None):
+    """가져온 ICS 캘린더를 목록에서 지웁니다. (calendar_ids가 없으면 전부, 원본 파일은 그대로 둠)"""
+    with _lock:
+        removed = [entry["id"] for entry in _load_imports() if calendar_ids is None or entry["id"] in calendar_ids]
+        _imports[:] = [entry for entry in _imports if entry["id"] not in removed]
+        for calendar_id in removed:
+            _calendars.pop(calendar_id, None)
+            search_index.remove_calendar(calendar_id)
+        _save_imports()
+
+def imported_calendars():
+    """가져온 캘린더 목록 [{"id", "summary", "color", "primary"}] (list_calendars와 같은 형식)"""
+    with _lock:
+        return [{"id": entry["id"], "summary": entry["summary"], "color": ICS_CALENDAR_COLOR, "primary": False}
+                for entry in _load_imports()]
+
+def _loaded_calendars():
+    """가져온 캘린더들의 IcsCalendar 리스트. 처음 사용할 때와 파일이 바뀌었을 때만 파일을 다시 읽습니다."""
+    with _lock: # 여러 스레드가 동시에 요청해도 파일은 한 번만 읽음
+        calendars = []
+        for entry in _load_imports():
+            path = entry["path"]
+            try:
+                stat = os.stat(path)
+                version = (stat.st_mtime, stat.st_size)
+                cached = _calendars.get(entry["id"])
+                if cached is None or cached[0] != version:
+                    cached = _calendars[entry["id"]] = (version, load_ics(path, entry["id"]))
+                    search_index.index_events(cached[1].search_events(), entry["id"], replace=True)
+                _missing.discard(path)
+            except (OSError, ValueError) as e:
+                if path not in _missing:
+                    _missing.add(path)
+                    logger.warning("가져온 ICS 파일을 읽지 못했습니다 (%s): %s", path, e)
+                continue
+            calendars.append(cached[1])
+        return calendars
+
+def events_between(start, end):
+    """가져온 모든 캘린더에서 [start, end) 기간과 겹치는 일정(Event) 리스트 (date 또는 datetime)"""
+    events = []
+    with metrics.span("ics.events_between"):
+        for calendar in _loaded_calendars():
+            events.extend(calendar.events_between(start, end))
+    return events
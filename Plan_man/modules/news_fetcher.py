@@ -1,6 +1,23 @@
 # modules/news_fetcher.py
+import datetime
+import email.utils
+import hashlib
+import heapq
+import json
+import logging
+import os
+import random
+import re
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit, parse_qsl, urlencode
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from core import metrics
+from core.http_session import get_session
+from modules import search_index
 
 CATEGORY_RSS = {
     "정치": "https://www.yna.co.kr/rss/politics.xml",
@@ -10,6 +27,248 @@ CATEGORY_RSS = {
     "세계": "https://www.yna.co.kr/rss/international.xml"
 }
 
+logger = logging.getLogger(__name__)
+
+MAX_FETCH_WORKERS = 5 # 동시에 가져올 피드의 최대 개수
+MAX_NEWS_ITEMS = 10 # 한 번에(한 페이지에) 보여줄 뉴스 개수
+FEED_MAX_ITEMS = 50 # 피드 하나에서 읽어 캐시할 최대 항목 수 (전체 뉴스 타임라인의 페이지 넘김용)
+
+# 웹사이트가 자동화된 요청을 차단하는 것을 피하기 위해 User-Agent 설정
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36 PlanManApp/1.0"
+
+FEED_CACHE_DIR = 'feed_cache' # 피드 캐시(ETag, 파싱 결과) 저장 폴더
+DEFAULT_FEED_TTL = 5 * 60 # 피드에 <ttl>이 없을 때의 신선도 유지 시간(초)
+FEED_CHUNK_SIZE = 8 * 1024 # 스트리밍 파싱 시 한 번에 읽을 바이트 수
+FEED_DRAIN_MAX_BYTES = 256 * 1024 # 일찍 멈춘 뒤 남은 본문이 이 이하이면 끝까지 읽어 연결을 재사용
+
+# 백그라운드 새로고침 스케줄러 (FeedScheduler)
+MIN_REFRESH_INTERVAL = 2 * 60 # 피드 하나를 다시 확인하는 최소 간격(초)
+MAX_REFRESH_INTERVAL = 2 * 60 * 60 # 최대 간격(초)
+UNCHANGED_BACKOFF = 1.5 # 새 항목이 없을 때마다 간격을 늘리는 배수
+REFRESH_JITTER = 0.2 # 간격을 최대 20% 늘려 흩뜨림 (여러 피드의 요청이 한꺼번에 몰리지 않도록)
+ERROR_RETRY_DELAY = 30 # 가져오기 실패 시 첫 재시도 대기(초), 실패할 때마다 두 배로 늘림
+ERROR_RETRY_MAX = 30 * 60 # 재시도 대기의 최댓값(초)
+SCHEDULER_WORKERS = 2 # 스케줄러가 동시에 가져오는 피드 수
+
+# 미리 가져온 뉴스 항목을 메모리에 보관 ({카테고리: 뉴스 항목 리스트})
+_news_cache = {}
+_pending_fetches = {} # {카테고리: 진행 중인 Future}
+_cache_lock = threading.Lock()
+_scheduler = None
+
+def _cache_path(url):
+    """URL에 해당하는 캐시 파일(JSON) 경로를 반환합니다."""
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return os.path.join(FEED_CACHE_DIR, f"{key}.json")
+
+def _load_cache_entry(url):
+    """디스크에 저장된 피드 캐시 항목을 읽습니다. 없거나 손상되었으면 None을 반환합니다."""
+    try:
+        with open(_cache_path(url), 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return entry if entry.get("url") == url else None
+
+def _write_atomic(path, data):
+    """임시 파일에 쓴 뒤 교체하여, 다른 스레드가 반쯤 쓰인 파일을 읽지 않도록 합니다."""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def _save_cache_entry(url, entry):
+    """피드 캐시 항목(ETag, Last-Modified, 파싱된 항목 등)을 디스크에 저장합니다."""
+    try:
+        os.makedirs(FEED_CACHE_DIR, exist_ok=True)
+        _write_atomic(_cache_path(url), json.dumps(entry, ensure_ascii=False).encode('utf-8'))
+    except OSError as e:
+        logger.warning("피드 캐시 저장 실패 (%s): %s", url, e) # 캐시 저장 실패는 치명적이지 않음
+
+def _is_fresh(entry, now=None):
+    """캐시 항목이 아직 신선도 유지 시간(TTL) 안에 있는지 확인합니다."""
+    now = time.time() if now is None else now
+    return now - entry.get("fetched_at", 0) < entry.get("ttl", DEFAULT_FEED_TTL)
+
+def _parse_published(text):
+    """RSS pubDate(RFC 822) 또는 Atom published/updated(ISO 8601) 문자열을 epoch 초로 변환합니다. 실패 시 None"""
+    text = (text or "").strip()
+    if not text:
+        return None
+    try:
+        if text[:4].isdigit():
+            value = datetime.datetime.fromisoformat(text.replace('Z', '+00:00'))
+        else:
+            value = email.utils.parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value.timestamp()
+
+def _local_name(element):
+    """네임스페이스를 제외한 태그 이름 (Atom의 '{http://www.w3.org/2005/Atom}entry' -> 'entry')"""
+    tag = element.tag
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ""
+
+def _extract_link(item):
+    """<link>텍스트</link> (연합뉴스 등 RSS) 또는 <link href="..."/> (Atom) 형식에서 링크를 추출합니다."""
+    fallback = ""
+    for child in item:
+        if _local_name(child) != "link":
+            continue
+        if child.text and child.text.strip():
+            return child.text.strip()
+        href = (child.get('href') or "").strip()
+        if href:
+            if child.get('rel', 'alternate') == 'alternate':
+                return href
+            fallback = fallback or href # rel="self" 등은 대체 링크가 없을 때만 사용
+    return fallback
+
+def parse_feed_stream(chunks, max_items=MAX_NEWS_ITEMS):
+    """
+    RSS/Atom 피드의 바이트 조각(chunks)을 순서대로 파서에 넣으면서 <item>/<entry>를 하나씩 처리합니다.
+    max_items개를 모으면 나머지 본문은 읽지 않고 즉시 멈춥니다.
+    인코딩은 XML 선언을 따르므로 별도의 디코딩/인코딩 추측이 필요 없습니다.
+    뉴스 항목은 {"title", "link", "published": 발행 시각(epoch 초) 또는 None} 딕셔너리입니다.
+    (뉴스 항목 리스트, 피드의 <ttl> 값(초) 또는 None, 읽은 바이트 수) 튜플을 반환합니다.
+    """
+    parser = etree.XMLPullParser(events=("end",), recover=True, resolve_entities=False, no_network=True)
+    news_list = []
+    ttl_seconds = None
+    consumed = 0
+    parse_seconds = 0.0 # 네트워크 대기 시간을 제외한 순수 파싱 시간
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        consumed += len(chunk)
+        started = time.perf_counter()
+        parser.feed(chunk)
+        for _, element in parser.read_events():
+            name = _local_name(element)
+            if name == "ttl": # RSS <ttl>은 분 단위
+                text = (element.text or "").strip()
+                if text.isdigit():
+                    ttl_seconds = int(text) * 60
+            elif name in ("item", "entry"):
+                title = ""
+                published = updated = None
+                for child in element:
+                    child_name = _local_name(child)
+                    if child_name == "title" and not title:
+                        title = "".join(child.itertext()).strip()
+                    elif child_name in ("pubDate", "published", "date") and published is None:
+                        published = _parse_published(child.text)
+                    elif child_name == "updated" and updated is None:
+                        updated = _parse_published(child.text)
+                news_list.append({"title": title or "제목 없음", "link": _extract_link(element),
+                                  "published": published if published is not None else updated})
+                # 처리한 항목은 메모리에서 해제
+                element.clear()
+                parent = element.getparent()
+                if parent is not None:
+                    while element.getprevious() is not None:
+                        del parent[0]
+                if len(news_list) >= max_items:
+                    break
+        parse_seconds += time.perf_counter() - started
+        if len(news_list) >= max_items:
+            break # 필요한 개수를 모았으므로 나머지 조각은 읽지 않음
+
+    metrics.observe("news.parse", parse_seconds * 1000)
+    return news_list, ttl_seconds, consumed
+
+_MAX_AGE = re.compile(r"max-age\s*=\s*(\d+)")
+
+def _server_ttl(res, feed_ttl):
+    """Cache-Control max-age와 피드의 <ttl> 중 긴 쪽을 신선도 유지 시간(초)으로 사용합니다. 둘 다 없으면 None"""
+    match = _MAX_AGE.search(res.headers.get("Cache-Control", ""))
+    hints = [value for value in (feed_ttl, int(match.group(1)) if match else None) if value is not None]
+    return max(hints) if hints else None
+
+def _release_connection(res, chunks):
+    """
+    일찍 멈춘 응답의 남은 본문이 FEED_DRAIN_MAX_BYTES 이하이면 끝까지 읽어 연결을 풀로 돌려줍니다.
+    읽다 만 응답을 닫으면 urllib3가 연결을 버리므로 다음 요청에서 TCP/TLS 연결을 다시 맺어야 합니다.
+    남은 본문이 더 크면 받지 않고 닫습니다. (연결 하나를 다시 맺는 쪽이 큰 본문을 받는 것보다 쌈)
+    chunks는 파싱에 사용하던 res.iter_content 제너레이터입니다. (끝까지 읽었으면 아무것도 하지 않음)
+    """
+    length = res.headers.get("Content-Length", "")
+    if length.isdigit() and int(length) - res.raw.tell() > FEED_DRAIN_MAX_BYTES:
+        metrics.incr("news.connection_dropped")
+        return
+    drained = 0
+    for chunk in chunks:
+        drained += len(chunk)
+        if drained > FEED_DRAIN_MAX_BYTES: # Content-Length 없이 큰 본문이면 포기
+            metrics.incr("news.connection_dropped")
+            return
+    metrics.incr("news.bytes_drained", drained)
+
+def _fetch_feed_entry(url, use_stale_on_error=True):
+    """
+    피드 캐시를 거쳐 URL의 피드 캐시 항목(딕셔너리)을 가져옵니다.
+    - TTL 안이면 네트워크 요청 없이 캐시된 항목을 반환
+    - 그렇지 않으면 If-None-Match / If-Modified-Since 조건부 요청을 보내고, 304 응답이면 캐시된 항목 재사용
+    - 네트워크 오류 시 use_stale_on_error이면 오래된 캐시 항목을 반환하고, 아니면 예외를 그대로 발생시킴
+    반환하는 항목의 "status"는 "fresh"(요청 없음), "not_modified"(304), "fetched"(새로 받음), "stale"(오류로 오래된 캐시) 중 하나입니다.
+    """
+    entry = _load_cache_entry(url)
+    if entry and _is_fresh(entry):
+        metrics.incr("news.cache_fresh_hit")
+        return dict(entry, status="fresh")
+
+    headers = {"User-Agent": USER_AGENT}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    try:
+        # stream=True: 본문을 한 번에 받지 않고 조각 단위로 읽으며 파싱
+        with metrics.span("news.fetch"), \
+                get_session().get(url, headers=headers, timeout=10, stream=True) as res: # 공유 세션으로 연결 재사용
+            if res.status_code == 304 and entry:
+                metrics.incr("news.not_modified")
+                # 변경 없음: 본문 다운로드와 파싱 없이 캐시 갱신 시각과 서버가 새로 알려준 유효 시간만 업데이트
+                server_ttl = _server_ttl(res, entry.get("feed_ttl"))
+                entry["ttl"] = server_ttl if server_ttl is not None else DEFAULT_FEED_TTL
+                entry["etag"] = res.headers.get("ETag") or entry.get("etag")
+                entry["last_modified"] = res.headers.get("Last-Modified") or entry.get("last_modified")
+                entry["fetched_at"] = time.time()
+                _save_cache_entry(url, entry)
+                return dict(entry, status="not_modified")
+            res.raise_for_status() # HTTP 오류 발생 시 예외 발생
+            # 필요한 개수의 항목을 모으면 나머지 본문은 받지 않음
+            chunks = res.iter_content(FEED_CHUNK_SIZE)
+            news_list, feed_ttl, consumed = parse_feed_stream(chunks, max_items=FEED_MAX_ITEMS)
+            metrics.incr("news.bytes_fetched", consumed)
+            _release_connection(res, chunks)
+    except requests.exceptions.RequestException:
+        if entry and use_stale_on_error: # 네트워크 오류 시 오래된 캐시라도 보여줌
+            return dict(entry, status="stale")
+        raise
+
+    server_ttl = _server_ttl(res, feed_ttl)
+    entry = {
+        "url": url,
+        "etag": res.headers.get("ETag"),
+        "last_modified": res.headers.get("Last-Modified"),
+        "fetched_at": time.time(),
+        "ttl": server_ttl if server_ttl is not None else DEFAULT_FEED_TTL,
+        "feed_ttl": feed_ttl, # 304 응답을 받았을 때 유효 시간을 다시 계산하기 위해 보관
+        "items": news_list,
+    }
+    _save_cache_entry(url, entry)
+    return dict(entry, status="fetched")
+
+def _fetch_feed_items(url):
+    """피드 캐시를 거쳐 URL의 뉴스 항목을 가져옵니다. (_fetch_feed_entry 참고)"""
+    return _fetch_feed_entry(url)["items"]
+
 def get_news_items_by_category(category):
     """
     지정된 카테고리의 뉴스 항목(제목, 링크)을 가져옵니다.
@@ -19,51 +278,295 @@ def get_news_items_by_category(category):
     if not url:
         return [{"title": f"❌ '{category}' 카테고리에 대한 RSS가 없습니다.", "link": ""}]
 
-    # 웹사이트가 자동화된 요청을 차단하는 것을 피하기 위해 User-Agent 설정
-    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36 PlanManApp/1.0"}
     try:
-        res = requests.get(url, headers=headers, timeout=10) # 타임아웃 시간 증가
-        res.raise_for_status() # HTTP 오류 발생 시 예외 발생
-
-        # 인코딩 문제 해결을 위해 utf-8로 먼저 디코딩 시도, 실패 시 apparent_encoding 사용
-        try:
-            content = res.content.decode('utf-8')
-        except UnicodeDecodeError:
-            content = res.content.decode(res.apparent_encoding, 'ignore') # 디코딩 오류 발생 시 해당 문자 무시
-
-        soup = BeautifulSoup(content, "xml") # RSS는 XML 형식이므로 "xml" 파서 사용
-        items = soup.find_all("item")
-        if not items: # 일부 RSS 피드는 'item' 대신 'entry'를 사용할 수 있음
-            items = soup.find_all("entry")
-
-        news_list = []
-        for item in items[:10]: # 최대 10개 항목으로 제한
-            title_tag = item.find("title")
-            link_tag = item.find("link")
-
-            title = title_tag.text.strip() if title_tag else "제목 없음"
-            
-            link = ""
-            if link_tag:
-                if link_tag.text: # 연합뉴스 스타일
-                    link = link_tag.text.strip()
-                elif link_tag.get('href'): # 전자신문 등 다른 스타일 (link 태그의 href 속성)
-                    link = link_tag.get('href').strip()
-            
-            news_list.append({"title": title, "link": link})
-
+        news_list = _fetch_feed_items(url)
         return news_list if news_list else [{"title": "✅ 해당 카테고리에 표시할 뉴스가 없습니다.", "link": ""}]
 
     except requests.exceptions.RequestException as e: # 네트워크 관련 예외 처리
         return [{"title": f"❌ 뉴스 로드 실패 (네트워크 오류): {str(e)}", "link": ""}]
     except Exception as e: # 그 외 모든 예외 처리
-        print(f"피드 {url} 처리 중 오류 발생: {e}") # 디버깅을 위해 상세 오류 로깅
+        logger.exception("피드 %s 처리 중 오류 발생", url) # 디버깅을 위해 상세 오류 로깅
         return [{"title": f"❌ 뉴스 처리 중 오류 발생: {str(e)}", "link": ""}]
 
+def is_error_result(items):
+    """get_news_items_by_category 결과가 오류/안내 메시지만 담긴 결과인지 확인합니다. (이런 결과는 캐시하지 않음)"""
+    return not items or all("❌" in item['title'] for item in items)
+
+def fetch_all_categories(max_workers=MAX_FETCH_WORKERS):
+    """
+    CATEGORY_RSS의 모든 피드를 스레드 풀에서 병렬로 가져옵니다.
+    {카테고리: 뉴스 항목 리스트} 딕셔너리를 반환하며, 전체 대기 시간은 가장 느린 피드 하나의 시간과 같습니다.
+    """
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(get_news_items_by_category, category): category
+                   for category in CATEGORY_RSS}
+        for future in as_completed(futures):
+            category = futures[future]
+            results[category] = future.result() # get_news_items_by_category는 예외를 내부에서 처리함
+            _remember_items(category, results[category]) # 도착하는 대로 전체 뉴스 타임라인에 반영
+    return results
+
+def _remember_items(category, items):
+    """가져온 뉴스 항목을 메모리 캐시, 전체 뉴스 타임라인, 검색 색인에 저장합니다. (오류 결과는 저장하지 않음)"""
+    if is_error_result(items):
+        return
+    with _cache_lock:
+        _news_cache[category] = items
+        _timeline.update(category, items)
+    search_index.index_news(category, items)
+
+def _store_prefetch_result(category, future):
+    with _cache_lock:
+        if _pending_fetches.get(category) is future:
+            del _pending_fetches[category]
+        if future.cancelled(): # 스케줄러를 멈추면서 취소된 요청
+            return
+    _remember_items(category, future.result())
+
+def get_cached_news_items(category):
+    """
+    메모리에 있는 뉴스 항목을 반환합니다.
+    미리 가져오는 중이면 그 결과를 기다리고, 캐시에 없으면 직접 가져와 캐시에 저장합니다.
+    """
+    with _cache_lock:
+        if category in _news_cache:
+            return _news_cache[category]
+        pending = _pending_fetches.get(category)
+
+    if pending is not None:
+        items = pending.result()
+    else:
+        items = get_news_items_by_category(category)
+    _remember_items(category, items)
+    return items
+
+_TRACKING_PARAMS = re.compile(r"^(utm_\w+|fbclid|gclid|ref|from|input)$", re.I)
+_SPACES = re.compile(r"\s+")
+
+def _normalize_link(link):
+    """
+    같은 기사의 서로 다른 링크를 같은 문자열로 만듭니다.
+    (http/https, www./m. 접두사, 끝의 '/', #조각, 추적용 쿼리 매개변수(utm_* 등)와 매개변수 순서 차이를 무시)
+    """
+    parts = urlsplit(link.strip())
+    host = parts.netloc.lower()
+    for prefix in ("www.", "m."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not _TRACKING_PARAMS.match(k))
+    return f"{host}{parts.path.rstrip('/')}?{urlencode(query)}"
+
+def _title_hash(title):
+    """공백과 대소문자 차이를 무시한 제목의 해시 (같은 기사가 다른 링크로 여러 피드에 실린 경우를 찾음)"""
+    return hashlib.sha1(_SPACES.sub(" ", title).strip().lower().encode('utf-8')).digest()
+
+def _timeline_key(item):
+    # 최신 기사가 먼저, 발행 시각을 모르는 기사는 맨 뒤
+    published = item.get("published")
+    return (published is None, -(published or 0))
+
+class NewsTimeline:
+    """
+    모든 카테고리의 피드를 발행 시각 순(최신 먼저)으로 합친 전체 뉴스 목록입니다.
+    - 피드별 항목 리스트를 발행 시각 순으로 정렬해 두고, 요청한 페이지까지만 heapq.merge로 k개 리스트를 병합합니다.
+    - 정규화한 링크나 제목 해시가 이미 나온 기사와 같으면 중복으로 보고 건너뜁니다. (먼저 나온 하나만 남김)
+    - 피드가 도착할 때마다(update) 그 카테고리의 리스트만 바꾸고 병합을 처음부터 다시 진행하므로,
+      모든 피드를 기다리지 않고 도착한 피드부터 보여줄 수 있습니다.
+    항목은 뉴스 항목에 "category"를 더한 딕셔너리입니다.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._feeds = {} # {카테고리: 발행 시각 순으로 정렬한 항목 리스트}
+        self._merged = [] # 지금까지 병합한 항목 (중복 제거 후)
+        self._seen = set() # 병합한 항목의 링크/제목 키
+        self._merge = None # 진행 중인 병합 이터레이터 (None이면 처음부터 다시 병합)
+        self.version = 0 # 피드가 바뀔 때마다 증가 (화면에서 다시 그릴지 판단하는 데 사용)
+
+    def update(self, category, items):
+        """카테고리의 항목을 새로 받은 리스트로 바꿉니다. (링크가 없는 안내 항목은 제외)"""
+        entries = sorted((dict(item, category=category) for item in items if item.get("link")), key=_timeline_key)
+        with self._lock:
+            self._feeds[category] = entries
+            self._merged, self._seen, self._merge = [], set(), None
+            self.version += 1
+
+    def page(self, page=0, page_size=MAX_NEWS_ITEMS):
+        """page번째(0부터) 페이지를 {"items", "has_more", "version", "feeds": 병합한 피드 수} 딕셔너리로 반환합니다."""
+        start = page * page_size
+        with self._lock:
+            self._fill(start + page_size + 1) # 다음 페이지가 있는지 알기 위해 하나 더 병합
+            return {"items": self._merged[start:start + page_size],
+                    "has_more": len(self._merged) > start + page_size,
+                    "version": self.version, "feeds": len(self._feeds)}
+
+    def _fill(self, count):
+        if self._merge is None:
+            self._merge = heapq.merge(*self._feeds.values(), key=_timeline_key)
+        while len(self._merged) < count:
+            item = next(self._merge, None)
+            if item is None:
+                break
+            keys = [_normalize_link(item["link"])]
+            if item["title"] != "제목 없음":
+                keys.append(_title_hash(item["title"]))
+            if any(key in self._seen for key in keys):
+                metrics.incr("news.timeline_duplicate")
+                continue
+            self._seen.update(keys)
+            self._merged.append(item)
+
+_timeline = NewsTimeline()
+
+def get_timeline_page(page=0, page_size=MAX_NEWS_ITEMS):
+    """
+    지금까지 도착한 모든 카테고리의 뉴스를 발행 시각 순으로 합친 목록의 page번째(0부터) 페이지를 반환합니다.
+    네트워크 요청 없이 메모리에 있는 피드만 사용합니다. (NewsTimeline.page 참고)
+    """
+    return _timeline.page(page, page_size)
+
+def timeline_version():
+    """전체 뉴스 타임라인이 바뀔 때마다 달라지는 번호"""
+    return _timeline.version
+
+class FeedScheduler:
+    """
+    CATEGORY_RSS의 모든 피드를 백그라운드에서 주기적으로 다시 가져와 메모리 캐시를 최신 상태로 유지합니다.
+    - 피드마다 다음 확인 시각을 따로 정하며, 간격은 그 피드에 실제로 새 항목이 올라오는 빈도에 맞춥니다.
+      새 항목이 보이면 항목 발행 시각 간격(없으면 지난 변경 이후 시간)의 절반으로 줄이고,
+      새 항목이 없으면 UNCHANGED_BACKOFF배씩 늘립니다.
+    - 간격은 서버가 알려준 신선도 유지 시간(<ttl>, Cache-Control max-age)보다 짧아지지 않습니다.
+    - 가져오기에 실패하면 흩뜨린 지수 백오프로 재시도합니다.
+    - 동시에 가져오는 피드 수는 max_workers개로 제한합니다.
+    """
+    def __init__(self, max_workers=SCHEDULER_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="news-refresh")
+        self._condition = threading.Condition()
+        self._queue = [] # (다음 확인 시각, 카테고리) 힙
+        self._states = {} # {카테고리: {"due", "interval", "failures", "links", "last_changed"}}
+        self._stopped = False
+        self._thread = None
+
+    def start(self):
+        """모든 피드를 바로 한 번 가져오도록 예약하고 스케줄러 스레드를 시작합니다."""
+        now = time.time()
+        with self._condition:
+            for category in CATEGORY_RSS:
+                self._states[category] = {"due": now, "interval": MIN_REFRESH_INTERVAL, "failures": 0,
+                                          "links": None, "last_changed": None}
+                heapq.heappush(self._queue, (now, category))
+        self._thread = threading.Thread(target=self._run, name="news-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def schedule(self):
+        """{카테고리: (다음 확인까지 남은 시간(초), 현재 간격(초), 연속 실패 수)}"""
+        now = time.time()
+        with self._condition:
+            return {category: (max(0.0, state["due"] - now), state["interval"], state["failures"])
+                    for category, state in self._states.items()}
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._stopped and (not self._queue or self._queue[0][0] > time.time()):
+                    self._condition.wait(self._queue[0][0] - time.time() if self._queue else None)
+                if self._stopped:
+                    return
+                _, category = heapq.heappop(self._queue)
+                # stop()은 같은 잠금 안에서 _stopped를 표시한 뒤 실행기를 닫으므로, 여기서 제출하면 닫힌 실행기에 넣지 않음
+                future = self._executor.submit(self._refresh, category)
+            with _cache_lock:
+                # 화면에서 같은 카테고리를 요청하면 진행 중인 이 요청의 결과를 기다림 (get_cached_news_items)
+                _pending_fetches.setdefault(category, future)
+            future.add_done_callback(lambda f, c=category: _store_prefetch_result(c, f))
+
+    def _refresh(self, category):
+        """피드 하나를 가져오고 다음 확인 시각을 예약합니다. 뉴스 항목 리스트(또는 오류 항목)를 반환합니다."""
+        url = CATEGORY_RSS.get(category)
+        try:
+            entry = _fetch_feed_entry(url, use_stale_on_error=False)
+        except Exception as e:
+            logger.warning("피드 새로고침 실패 (%s): %s", category, e)
+            entry = None
+            items = [{"title": f"❌ 뉴스 로드 실패: {e}", "link": ""}]
+        else:
+            items = entry["items"] or [{"title": "✅ 해당 카테고리에 표시할 뉴스가 없습니다.", "link": ""}]
+
+        now = time.time()
+        with self._condition:
+            state = self._states[category]
+            if entry is None:
+                state["failures"] += 1
+                delay = min(ERROR_RETRY_MAX, ERROR_RETRY_DELAY * 2 ** (state["failures"] - 1))
+                delay *= random.uniform(0.5, 1.0)
+            else:
+                state["failures"] = 0
+                delay = self._next_interval(state, entry, now)
+            state["due"] = now + delay
+            if not self._stopped:
+                heapq.heappush(self._queue, (state["due"], category))
+                self._condition.notify()
+        metrics.incr("news.scheduled_refresh")
+        logger.debug("피드 %s: 다음 확인까지 %.0f초", category, delay)
+        return items
+
+    @staticmethod
+    def _next_interval(state, entry, now):
+        """피드의 변경 여부와 항목 발행 시각으로 다음 확인까지의 시간(초)을 정합니다."""
+        links = [item["link"] for item in entry["items"]]
+        first = state["links"] is None
+        changed = not first and entry["status"] == "fetched" and not set(links) <= set(state["links"])
+        state["links"] = links
+
+        if entry["status"] == "fresh":
+            interval = state["interval"] # 요청 없이 캐시를 사용함: 판단할 정보가 없으므로 그대로 유지
+        elif first or changed:
+            published = sorted((item["published"] for item in entry["items"] if item.get("published")), reverse=True)
+            gaps = [newer - older for newer, older in zip(published, published[1:]) if newer > older]
+            if gaps:
+                interval = statistics.median(gaps) / 2 # 새 항목이 올라오는 평균 간격의 절반마다 확인
+            elif changed and state["last_changed"] is not None:
+                interval = (now - state["last_changed"]) / 2
+            else:
+                interval = state["interval"]
+            if changed:
+                state["last_changed"] = now
+        else:
+            interval = state["interval"] * UNCHANGED_BACKOFF
+
+        floor = max(MIN_REFRESH_INTERVAL, entry.get("ttl") or 0)
+        state["interval"] = min(MAX_REFRESH_INTERVAL, max(floor, interval))
+        return state["interval"] * random.uniform(1.0, 1.0 + REFRESH_JITTER)
+
+def start_feed_scheduler(max_workers=SCHEDULER_WORKERS):
+    """FeedScheduler를 시작합니다. (이미 실행 중이면 무시) 첫 새로고침은 바로 시작되므로 미리 가져오기를 겸합니다."""
+    global _scheduler
+    with _cache_lock:
+        if _scheduler is not None:
+            return _scheduler
+        _scheduler = FeedScheduler(max_workers)
+    _scheduler.start()
+    return _scheduler
+
+def stop_feed_scheduler():
+    global _scheduler
+    with _cache_lock:
+        scheduler, _scheduler = _scheduler, None
+    if scheduler is not None:
+        scheduler.stop()
+
 if __name__ == '__main__':
-    # 테스트용 함수 호출
+    # 테스트용 함수 호출: 모든 카테고리를 병렬로 가져옴
+    all_news = fetch_all_categories()
     for cat in CATEGORY_RSS.keys():
         print(f"\n--- {cat} 뉴스 ---")
-        news = get_news_items_by_category(cat)
+        news = all_news[cat]
         for n in news:
             print(f"  {n['title']} ({n['link']})")
\ No newline at end of file
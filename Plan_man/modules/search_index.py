@@ -0,0 +1,233 @@
+# modules/search_index.py
+# 일정 제목과 뉴스 제목을 메모리 역색인(inverted index)으로 검색합니다.
+# 한국어는 조사가 붙거나 띄어 쓰지 않는 경우가 많아 단어가 아닌 글자 단위 n-gram(1글자, 2글자)으로 색인하므로
+# '회의'로 '주간회의를', '간회'로 '주간회의'를 찾는 부분 일치 검색이 됩니다.
+# 일정은 calendar_manager가 동기화/조회할 때, 뉴스는 news_fetcher가 피드를 가져올 때 바로 색인에 반영합니다.
+import datetime
+import heapq
+import re
+import threading
+import time
+import unicodedata
+
+SEARCH_LIMIT = 50 # 검색 결과 최대 개수
+
+_WORD = re.compile(r"\w+")
+_SPACES = re.compile(r"\s+")
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ" # 한글 자모 초성 순서
+_HANGUL_FIRST = 0xAC00 # '가'
+_SYLLABLES_PER_CHOSEONG = 21 * 28 # 초성 하나에 해당하는 완성형 음절 수 (중성 21 x 종성 28)
+
+def normalize(text):
+    """검색용으로 정규화한 문자열 (NFC 결합, 대소문자 무시, 연속 공백은 하나로)"""
+    return _SPACES.sub(" ", unicodedata.normalize("NFC", text).casefold()).strip()
+
+def _grams(word):
+    """단어의 1글자, 2글자 n-gram 집합"""
+    grams = set(word)
+    grams.update(word[i:i + 2] for i in range(len(word) - 1))
+    return grams
+
+def _choseong_range(jamo):
+    """초성(ㄱ~ㅎ)으로 시작하는 완성형 음절의 정규식 문자 범위 ('ㅎ' -> '[하-힣]'). 초성이 아니면 None"""
+    index = _CHOSEONG.find(jamo)
+    if index < 0:
+        return None
+    first = _HANGUL_FIRST + index * _SYLLABLES_PER_CHOSEONG
+    return f"[{chr(first)}-{chr(first + _SYLLABLES_PER_CHOSEONG - 1)}]"
+
+class SearchIndex:
+    """
+    문서(제목 문자열)를 n-gram 역색인에 보관하는 검색 색인입니다. (스레드 안전)
+    - 문서는 key로 구분하며, 같은 key로 다시 추가하면 바뀐 문서만 색인을 고칩니다. (전체를 다시 만들지 않음)
+    - group으로 묶은 문서는 replace_group으로 한 번에 바꿀 수 있습니다. (예: 카테고리 하나의 뉴스 목록)
+    - 검색어의 각 단어에 대해 2글자 n-gram(1글자 단어는 1글자) 색인의 교집합으로 후보를 좁힌 뒤,
+      정규화한 제목에서 실제로 일치하는지 확인하여 결과를 rank가 작은 순으로 반환합니다.
+    """
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._postings = {} # {n-gram: {문서 번호, ...}}
+        self._docs = {} # {문서 번호: (key, 정규화한 제목, rank, payload, group)}
+        self._ids = {} # {key: 문서 번호}
+        self._ranks = {} # {문서 번호: rank} (검색 결과 정렬용)
+        self._groups = {} # {group: {key, ...}}
+        self._next_id = 0
+
+    def __len__(self):
+        return len(self._docs)
+
+    def add(self, key, text, payload=None, rank=0.0, group=None):
+        """문서를 추가하거나 바꿉니다. 제목이 그대로이면 색인은 건드리지 않고 payload와 rank만 바꿉니다."""
+        normalized = normalize(text)
+        with self._lock:
+            doc_id = self._ids.get(key)
+            if doc_id is not None:
+                old = self._docs[doc_id]
+                self._docs[doc_id] = (key, normalized, rank, payload, group)
+                self._ranks[doc_id] = rank
+                if old[4] != group:
+                    self._groups.get(old[4], set()).discard(key)
+                    self._join(key, group)
+                if old[1] == normalized:
+                    return
+                self._unindex(doc_id, old[1])
+            else:
+                doc_id = self._next_id
+                self._next_id += 1
+                self._ids[key] = doc_id
+                self._docs[doc_id] = (key, normalized, rank, payload, group)
+                self._ranks[doc_id] = rank
+                self._join(key, group)
+            for word in _WORD.findall(normalized):
+                for gram in _grams(word):
+                    self._postings.setdefault(gram, set()).add(doc_id)
+
+    def _join(self, key, group):
+        if group is not None:
+            self._groups.setdefault(group, set()).add(key)
+
+    def remove(self, key):
+        with self._lock:
+            doc_id = self._ids.pop(key, None)
+            if doc_id is not None:
+                _, normalized, _, _, group = self._docs.pop(doc_id)
+                del self._ranks[doc_id]
+                self._unindex(doc_id, normalized)
+                self._groups.get(group, set()).discard(key)
+
+    def _unindex(self, doc_id, normalized):
+        for word in _WORD.findall(normalized):
+            for gram in _grams(word):
+                postings = self._postings.get(gram)
+                if postings is not None:
+                    postings.discard(doc_id)
+                    if not postings:
+                        del self._postings[gram]
+
+    def replace_group(self, group, docs):
+        """group의 문서를 docs((key, 제목, payload, rank) 튜플들)로 바꿉니다. 새 목록에 없는 문서는 지웁니다."""
+        with self._lock:
+            old_keys = set(self._groups.get(group, ()))
+            new_keys = set()
+            for key, text, payload, rank in docs:
+                self.add(key, text, payload, rank, group)
+                new_keys.add(key)
+            for key in old_keys - new_keys:
+                self.remove(key)
+
+    def remove_group(self, group):
+        with self._lock:
+            for key in list(self._groups.get(group, ())):
+                self.remove(key)
+            self._groups.pop(group, None)
+
+    def search(self, query, limit=SEARCH_LIMIT, prefix=False):
+        """
+        검색어의 모든 단어가 제목에 들어 있는 문서를 [(key, payload), ...]로 반환합니다.
+        prefix이면 단어의 시작 부분만 일치하는 것으로 봅니다. (예: '회의'는 '회의실'과 일치, '주간회의'와는 불일치)
+        검색어가 초성으로 끝나면 입력 중인 글자로 보고 그 초성으로 시작하는 음절과 일치시킵니다. (예: '회ㅇ' -> '회의')
+        """
+        words = _WORD.findall(normalize(query))
+        if not words:
+            return []
+        patterns = []
+        lookups = [] # 후보를 찾는 데 쓸 단어 (끝의 초성은 제외)
+        for i, word in enumerate(words):
+            tail = _choseong_range(word[-1]) if i == len(words) - 1 else None
+            if tail is not None:
+                word = word[:-1]
+            if prefix or tail is not None:
+                patterns.append(re.compile((r"(?<!\w)" if prefix else "") + re.escape(word) + (tail or "")).search)
+            elif len(word) > 2: # 두 글자 이하는 n-gram 색인만으로 정확히 일치하므로 확인이 필요 없음
+                patterns.append(lambda text, word=word: word in text) # 2글자 n-gram이 모두 있어도 이어져 있지 않을 수 있음
+            if word:
+                lookups.append(word)
+        if not lookups:
+            return [] # 초성 하나만으로는 검색하지 않음
+
+        with self._lock:
+            candidates = None
+            # 문서 수가 적은 n-gram부터 교집합을 구하여 후보를 빨리 좁힘
+            grams = set()
+            for word in lookups:
+                if len(word) == 1:
+                    grams.add(word)
+                else:
+                    grams.update(word[i:i + 2] for i in range(len(word) - 1))
+            for gram in sorted(grams, key=lambda g: len(self._postings.get(g, ()))):
+                postings = self._postings.get(gram)
+                if not postings:
+                    return []
+                candidates = set(postings) if candidates is None else candidates & postings
+                if not candidates:
+                    return []
+
+            rank = self._ranks.__getitem__
+            if not patterns:
+                doc_ids = heapq.nsmallest(limit, candidates, key=rank)
+            else:
+                def matches(doc_id):
+                    text = self._docs[doc_id][1]
+                    return all(match(text) for match in patterns)
+                # 대부분의 후보는 실제로 일치하므로 rank가 작은 후보 몇 개만 먼저 확인해 보고,
+                # 부족할 때만 모든 후보를 확인함
+                doc_ids = [doc_id for doc_id in heapq.nsmallest(limit * 2, candidates, key=rank) if matches(doc_id)]
+                if len(doc_ids) < limit and len(candidates) > limit * 2:
+                    doc_ids = heapq.nsmallest(limit, filter(matches, candidates), key=rank)
+            return [(self._docs[doc_id][0], self._docs[doc_id][3]) for doc_id in doc_ids[:limit]]
+
+_index = SearchIndex()
+
+# 일정과 뉴스 모두 지금과 가까운 것이 먼저 나오도록 현재 시각과의 차이(초)를 rank로 사용
+def _event_rank(event):
+    return abs((event.start - datetime.datetime.now()).total_seconds())
+
+def _news_rank(item, now):
+    published = item.get("published")
+    return now - published if published else float("inf")
+
+def index_events(events, calendar_id=None, replace=False):
+    """
+    Event 레코드들을 색인합니다. (이미 있는 일정은 바뀐 경우에만 다시 색인)
+    replace이면 calendar_id 캘린더의 일정 전체를 events로 바꿉니다. (전체 동기화 후)
+    """
+    docs = [(("event", event.calendar, event.id), event.summary, event, _event_rank(event)) for event in events]
+    if replace:
+        _index.replace_group(("event", calendar_id), docs)
+        return
+    for key, text, event, rank in docs:
+        _index.add(key, text, event, rank, group=("event", event.calendar))
+
+def remove_events(calendar_id, event_ids):
+    """삭제된 일정을 색인에서 지웁니다."""
+    for event_id in event_ids:
+        _index.remove(("event", calendar_id, event_id))
+
+def remove_calendar(calendar_id):
+    """더 이상 구독하지 않는 캘린더의 일정을 색인에서 지웁니다."""
+    _index.remove_group(("event", calendar_id))
+
+def index_news(category, items):
+    """카테고리의 뉴스 목록을 색인합니다. 이전에 색인한 이 카테고리의 뉴스 중 새 목록에 없는 것은 지웁니다."""
+    now = time.time()
+    docs = [(("news", category, item["link"]), item["title"], dict(item, category=category), _news_rank(item, now))
+            for item in items if item.get("link")]
+    _index.replace_group(("news", category), docs)
+
+def search(query, limit=SEARCH_LIMIT, prefix=False):
+    """
+    일정과 뉴스를 함께 검색합니다. 결과는 {"kind": "event" 또는 "news", "item": Event 또는 뉴스 항목} 리스트이며,
+    색인할 때의 시각에 가까운 순(일정은 오늘에 가까운 순, 뉴스는 최신 순)입니다. 여러 카테고리에 실린 같은 기사는 한 번만 나옵니다.
+    """
+    results = []
+    links = set()
+    for key, payload in _index.search(query, limit * 2, prefix): # 중복 기사를 빼도 limit개가 남도록 넉넉히
+        if key[0] == "news":
+            if key[2] in links:
+                continue
+            links.add(key[2])
+        results.append({"kind": key[0], "item": payload})
+    return results[:limit]
+
+def document_count():
+    return len(_index)
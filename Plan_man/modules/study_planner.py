@@ -0,0 +1,231 @@
+# modules/study_planner.py
+# 시험 공부 계획: 캘린더의 바쁜 시간을 피해 하루하루의 빈 시간에 과목별 공부 시간을 배치합니다.
+# 시간 구간은 1970-01-01 0시부터의 분(정수)으로 다루며, 병합/차감은 정렬된 구간을 한 번 훑는 방식(sweep)으로 계산합니다.
+# 일정 하나가 바뀌면 그 일정이 걸친 날짜만 빈 시간을 다시 계산하고, 계획도 그 날짜부터 다시 세웁니다.
+# (그 뒤의 날짜는 남은 공부량이 이전 계획과 같아지는 순간부터 이전 결과를 그대로 사용)
+import datetime
+import json
+import logging
+import math
+import os
+from collections import Counter
+
+STUDY_GOALS_FILE = 'study_goals.json' # 과목별 시험 날짜와 필요한 공부 시간 저장 파일
+STUDY_DAY_START = 9 * 60 # 하루 중 공부할 수 있는 시간대 시작 (분, 09:00)
+STUDY_DAY_END = 22 * 60 # 끝 (분, 22:00)
+DAILY_MAX_MINUTES = 6 * 60 # 하루 최대 공부 시간(분)
+MIN_SESSION_MINUTES = 30 # 이보다 짧은 빈 시간에는 공부를 배치하지 않음
+MAX_SESSION_MINUTES = 2 * 60 # 한 번에 이어서 공부하는 최대 시간(분), 넘으면 나누어 배치
+BREAK_MINUTES = 10 # 공부 블록 사이의 쉬는 시간(분)
+SESSION_STEP_MINUTES = 10 # 하루 배정 시간은 이 단위로 올림 (17분 같은 자투리 블록 방지)
+
+logger = logging.getLogger(__name__)
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+def to_minutes(value):
+    """date 또는 datetime(시간대 정보 없는 현지 시각)을 1970-01-01 0시부터의 분으로 변환합니다."""
+    if not isinstance(value, datetime.datetime):
+        value = datetime.datetime(value.year, value.month, value.day)
+    delta = value - _EPOCH
+    return delta.days * 1440 + delta.seconds // 60
+
+def to_datetime(minutes):
+    """분 단위 정수 시각을 datetime으로 변환합니다."""
+    return _EPOCH + datetime.timedelta(minutes=minutes)
+
+def merge_intervals(intervals):
+    """(시작, 끝) 구간들을 시작 순으로 정렬하여 겹치거나 맞닿은 구간을 합칩니다."""
+    merged = []
+    for start, end in sorted(intervals):
+        if end <= start:
+            continue
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+def subtract_intervals(base, busy):
+    """정렬/병합된 base 구간들에서 정렬/병합된 busy 구간들을 뺀 나머지 구간 리스트를 반환합니다."""
+    free = []
+    i = 0
+    for start, end in base:
+        while i < len(busy) and busy[i][1] <= start: # 이 구간보다 앞에서 끝나는 바쁜 시간은 건너뜀
+            i += 1
+        cursor = start
+        j = i
+        while j < len(busy) and busy[j][0] < end:
+            if busy[j][0] > cursor:
+                free.append((cursor, busy[j][0]))
+            cursor = max(cursor, busy[j][1])
+            j += 1
+        if cursor < end:
+            free.append((cursor, end))
+    return free
+
+class FreeTime:
+    """
+    날짜별 빈 시간(공부 시간대에서 바쁜 시간을 뺀 구간)을 보관합니다.
+    바쁜 시간은 날짜 경계에서 잘라 날짜별로 보관하므로, 바쁜 시간이 바뀌면 그 구간이 걸친 날짜만 다시 계산합니다.
+    """
+    def __init__(self, day_start=STUDY_DAY_START, day_end=STUDY_DAY_END):
+        self.day_start = day_start
+        self.day_end = day_end
+        self._busy = set() # 현재 바쁜 시간 {(시작 분, 끝 분)}
+        # {date: Counter{(시작 분, 끝 분): 개수}} - 그날 안으로 자른 구간
+        # (서로 다른 바쁜 시간이 같은 조각으로 잘릴 수 있으므로 개수를 세어, 마지막 하나가 없어질 때만 지움)
+        self._busy_by_day = {}
+        self._free = {} # {date: [(시작 분, 끝 분)]} - 계산해 둔 빈 시간
+        self.changed_days = set() # 마지막 확인 이후 빈 시간이 바뀐 날짜
+
+    @staticmethod
+    def _days(start, end):
+        """[start, end) 분 구간이 걸친 날짜와 그날 안으로 자른 구간"""
+        day = start // 1440
+        while day * 1440 < end:
+            yield (_EPOCH + datetime.timedelta(days=day)).date(), (max(start, day * 1440), min(end, day * 1440 + 1440))
+            day += 1
+
+    def set_busy(self, intervals):
+        """
+        바쁜 시간 전체를 intervals((시작, 끝) datetime 쌍들)로 바꿉니다.
+        이전과 비교하여 추가되거나 없어진 구간이 걸친 날짜만 다시 계산 대상으로 표시합니다.
+        """
+        busy = {(to_minutes(start), to_minutes(end)) for start, end in intervals}
+        for interval in self._busy - busy:
+            for day, piece in self._days(*interval):
+                pieces = self._busy_by_day[day]
+                pieces[piece] -= 1
+                if pieces[piece] <= 0:
+                    del pieces[piece]
+                self._mark_changed(day)
+        for interval in busy - self._busy:
+            for day, piece in self._days(*interval):
+                self._busy_by_day.setdefault(day, Counter())[piece] += 1
+                self._mark_changed(day)
+        self._busy = busy
+
+    def _mark_changed(self, day):
+        self._free.pop(day, None)
+        self.changed_days.add(day)
+
+    def slots(self, day):
+        """그날의 빈 시간 [(시작 분, 끝 분), ...] (시작 순)"""
+        free = self._free.get(day)
+        if free is None:
+            midnight = to_minutes(day)
+            window = [(midnight + self.day_start, midnight + self.day_end)]
+            free = subtract_intervals(window, merge_intervals(self._busy_by_day.get(day, ())))
+            self._free[day] = free
+        return free
+
+class StudyPlanner:
+    """
+    과목별 시험 날짜와 필요한 공부 시간(goals)으로 날짜별 공부 블록을 배치합니다.
+    - 하루에 배정하는 시간은 과목마다 '남은 시간 / 시험까지 남은 날 수'(올림)이며, 시험이 빠른 과목부터 채웁니다.
+      하루 최대 공부 시간과 그날의 빈 시간을 넘지 않으며, 시험 당일부터는 그 과목을 배치하지 않습니다.
+    - 하루의 계획은 (그날의 빈 시간, 그날 아침의 과목별 남은 시간)으로만 정해지므로 날짜별로 기억해 두고,
+      바쁜 시간이 바뀐 날짜나 남은 시간이 달라진 날짜만 다시 계산합니다.
+    goals는 {"subject", "exam_date": date, "hours"} 딕셔너리 리스트입니다.
+    """
+    def __init__(self, goals, start_day, free_time=None, daily_max=DAILY_MAX_MINUTES):
+        self.goals = sorted(goals, key=lambda goal: goal["exam_date"])
+        self.start_day = start_day
+        self.free_time = free_time or FreeTime()
+        self.daily_max = daily_max
+        self._days = {} # {date: (아침의 남은 시간 tuple, 공부 블록 리스트, 저녁의 남은 시간 tuple)}
+        self.recomputed_days = 0 # 마지막 plan()에서 다시 계산한 날짜 수
+
+    @property
+    def end_day(self):
+        """계획하는 마지막 날 (가장 늦은 시험의 전날)"""
+        return max(goal["exam_date"] for goal in self.goals) - datetime.timedelta(days=1)
+
+    def set_busy(self, intervals):
+        self.free_time.set_busy(intervals)
+
+    def plan(self):
+        """
+        {"sessions": [(과목, 시작 datetime, 끝 datetime), ...], "shortfall": {과목: 배치하지 못한 분}}를 반환합니다.
+        """
+        changed = self.free_time.changed_days
+        self.free_time.changed_days = set()
+        remaining = tuple(round(goal["hours"] * 60) for goal in self.goals)
+        sessions = []
+        self.recomputed_days = 0
+        day = self.start_day
+        while self.goals and day <= self.end_day:
+            cached = self._days.get(day)
+            if cached is None or day in changed or cached[0] != remaining:
+                cached = (remaining, *self._plan_day(day, remaining))
+                self._days[day] = cached
+                self.recomputed_days += 1
+            sessions.extend(cached[1])
+            remaining = cached[2]
+            day += datetime.timedelta(days=1)
+        shortfall = {goal["subject"]: left for goal, left in zip(self.goals, remaining) if left > 0}
+        return {"sessions": [(subject, to_datetime(start), to_datetime(end)) for subject, start, end in sessions],
+                "shortfall": shortfall}
+
+    def _plan_day(self, day, remaining):
+        """하루의 공부 블록 [(과목, 시작 분, 끝 분), ...]과 그날 저녁의 과목별 남은 시간을 계산합니다."""
+        slots = [slot for slot in self.free_time.slots(day) if slot[1] - slot[0] >= MIN_SESSION_MINUTES]
+        capacity = min(self.daily_max, sum(end - start for start, end in slots))
+        quotas = []
+        for goal, left in zip(self.goals, remaining):
+            days_left = (goal["exam_date"] - day).days
+            if left <= 0 or days_left <= 0 or capacity <= 0:
+                quotas.append(0)
+                continue
+            daily = math.ceil(left / days_left / SESSION_STEP_MINUTES) * SESSION_STEP_MINUTES
+            # 남은 시간이 MIN_SESSION_MINUTES보다 적어도 최소 길이의 블록 하나로 배치
+            quota = min(capacity, max(min(left, daily), MIN_SESSION_MINUTES))
+            if quota < MIN_SESSION_MINUTES:
+                quota = 0
+            quotas.append(quota)
+            capacity -= quota
+
+        blocks = []
+        slot_index, cursor = 0, slots[0][0] if slots else 0
+        left_after = list(remaining)
+        for index, quota in enumerate(quotas):
+            while quota >= MIN_SESSION_MINUTES and slot_index < len(slots):
+                slot_end = slots[slot_index][1]
+                if slot_end - cursor < MIN_SESSION_MINUTES: # 남은 빈 시간이 너무 짧으면 다음 빈 시간으로
+                    slot_index += 1
+                    if slot_index < len(slots):
+                        cursor = slots[slot_index][0]
+                    continue
+                length = min(quota, MAX_SESSION_MINUTES, slot_end - cursor)
+                rest = quota - length
+                if 0 < rest < MIN_SESSION_MINUTES: # 자투리 블록이 남지 않도록 이번 블록을 줄여 최소 길이만큼 남김
+                    if length - (MIN_SESSION_MINUTES - rest) >= MIN_SESSION_MINUTES:
+                        length -= MIN_SESSION_MINUTES - rest
+                blocks.append((self.goals[index]["subject"], cursor, cursor + length))
+                quota -= length
+                left_after[index] = max(0, left_after[index] - length)
+                cursor += length + BREAK_MINUTES
+        return blocks, tuple(left_after)
+
+def load_goals():
+    """저장된 공부 목표를 [{"subject", "exam_date": date, "hours"}, ...]로 읽습니다. 없거나 손상되었으면 빈 리스트"""
+    try:
+        with open(STUDY_GOALS_FILE, 'r', encoding='utf-8') as f:
+            goals = json.load(f)
+        return [{"subject": goal["subject"], "exam_date": datetime.date.fromisoformat(goal["exam_date"]),
+                 "hours": float(goal["hours"])} for goal in goals]
+    except FileNotFoundError:
+        return []
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning("공부 목표 파일을 읽지 못했습니다: %s", e)
+        return []
+
+def save_goals(goals):
+    data = [{"subject": goal["subject"], "exam_date": goal["exam_date"].isoformat(), "hours": goal["hours"]}
+            for goal in goals]
+    tmp_path = f"{STUDY_GOALS_FILE}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, STUDY_GOALS_FILE)
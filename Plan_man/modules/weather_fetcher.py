@@ -0,0 +1,364 @@
+# modules/weather_fetcher.py
+# 지역별 날씨 예보를 가져와 메모리와 디스크(WEATHER_CACHE_DIR)에 캐시합니다.
+# 예보 제공자는 WEATHER_PROVIDER(환경 변수 PLANMAN_WEATHER_PROVIDER)로 고를 수 있으며,
+# 가져온 예보는 제공자가 새 예보를 내는 시각(update_interval 경계, 서버가 Expires/max-age를 주면 그 시각)까지 신선한 것으로 봅니다.
+# 같은 지역을 여러 곳에서 동시에 요청하면 요청은 한 번만 보내고 모두 그 결과를 받습니다.
+# 예보는 시간별 배열(기온, 강수량, 날씨 상태 번호)로 보관하여 시간마다 딕셔너리를 만들지 않습니다.
+import datetime
+import email.utils
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from array import array
+from collections import Counter
+from concurrent.futures import Future
+import requests
+from core import metrics
+from core.http_session import get_session
+
+WEATHER_CACHE_DIR = 'weather_cache' # 예보 캐시 저장 폴더
+WEATHER_PROVIDER = os.environ.get("PLANMAN_WEATHER_PROVIDER", "open-meteo")
+WEATHER_TIMEOUT = 10 # 예보 요청 제한 시간(초)
+FORECAST_DAYS = 7 # 가져올 예보 기간(일)
+HOUR = 60 * 60
+
+# 지역 이름: (위도, 경도)
+LOCATIONS = {
+    "서울": (37.5665, 126.9780),
+    "인천": (37.4563, 126.7052),
+    "대전": (36.3504, 127.3845),
+    "대구": (35.8714, 128.6014),
+    "광주": (35.1595, 126.8526),
+    "부산": (35.1796, 129.0756),
+    "울산": (35.5384, 129.3114),
+    "제주": (33.4996, 126.5312),
+}
+DEFAULT_LOCATION = "서울"
+
+# 날씨 상태 번호: (이름, 아이콘) - 예보의 condition 배열에는 이 튜플의 번호를 저장
+CONDITIONS = (
+    ("맑음", "☀️"),
+    ("구름 조금", "🌤️"),
+    ("흐림", "☁️"),
+    ("안개", "🌫️"),
+    ("이슬비", "🌦️"),
+    ("비", "🌧️"),
+    ("눈", "🌨️"),
+    ("소나기", "🌦️"),
+    ("뇌우", "⛈️"),
+)
+CLEAR, PARTLY_CLOUDY, CLOUDY, FOG, DRIZZLE, RAIN, SNOW, SHOWERS, THUNDER = range(len(CONDITIONS))
+
+logger = logging.getLogger(__name__)
+
+_forecasts = {} # {캐시 키: Forecast} - 가장 최근에 가져온 예보
+_pending = {} # {캐시 키: 진행 중인 요청의 Future}
+_lock = threading.Lock()
+
+class Forecast:
+    """
+    한 지역의 시간별 예보입니다. i번째 값은 start + i시간(epoch 초) 시각의 예보입니다.
+    temperature(°C)와 precipitation(mm)은 array('f'), condition은 CONDITIONS 번호의 array('B')입니다.
+    """
+    __slots__ = ("provider", "latitude", "longitude", "start", "temperature", "precipitation", "condition",
+                 "fetched_at", "expires_at", "last_modified")
+
+    def __init__(self, provider, latitude, longitude, start, temperature, precipitation, condition,
+                 fetched_at=0.0, expires_at=0.0, last_modified=None):
+        self.provider = provider
+        self.latitude = latitude
+        self.longitude = longitude
+        self.start = int(start)
+        self.temperature = array('f', temperature)
+        self.precipitation = array('f', precipitation)
+        self.condition = array('B', condition)
+        self.fetched_at = fetched_at
+        self.expires_at = expires_at
+        self.last_modified = last_modified
+
+    def __len__(self):
+        return len(self.temperature)
+
+    def is_fresh(self, now=None):
+        return (time.time() if now is None else now) < self.expires_at
+
+    def hourly(self, start=None, hours=24):
+        """start(epoch 초, 기본: 지금) 시각이 속한 시간부터 hours시간의 (datetime, 기온, 강수량, 상태 번호) 리스트"""
+        first = max(0, int((time.time() if start is None else start) - self.start) // HOUR)
+        return [(datetime.datetime.fromtimestamp(self.start + i * HOUR), self.temperature[i],
+                 self.precipitation[i], self.condition[i])
+                for i in range(first, min(len(self), first + hours))]
+
+    def current(self):
+        """지금 시각의 (datetime, 기온, 강수량, 상태 번호). 예보 기간 밖이면 None"""
+        if time.time() < self.start:
+            return None
+        hours = self.hourly(hours=1)
+        return hours[0] if hours else None
+
+    def daily(self):
+        """
+        오늘부터 날짜별 (date, 최저 기온, 최고 기온, 강수량 합, 상태 번호) 리스트입니다. (날짜는 이 컴퓨터의 현지 날짜)
+        상태는 그날 9~18시에 가장 많이 나타난 상태입니다. (낮 시간 예보가 없으면 하루 전체)
+        """
+        today = datetime.date.today()
+        days = {}
+        for i in range(len(self)):
+            when = datetime.datetime.fromtimestamp(self.start + i * HOUR)
+            if when.date() >= today:
+                days.setdefault(when.date(), []).append((when.hour, i))
+        result = []
+        for day, hours in days.items():
+            temperatures = [self.temperature[i] for _, i in hours]
+            daytime = [self.condition[i] for hour, i in hours if 9 <= hour <= 18] or [self.condition[i] for _, i in hours]
+            result.append((day, min(temperatures), max(temperatures), sum(self.precipitation[i] for _, i in hours),
+                           Counter(daytime).most_common(1)[0][0]))
+        return result
+
+    def to_json(self):
+        return {"provider": self.provider, "latitude": self.latitude, "longitude": self.longitude,
+                "start": self.start, "fetched_at": self.fetched_at, "expires_at": self.expires_at,
+                "last_modified": self.last_modified,
+                # array('f')의 값은 float32라 그대로 쓰면 12.300000190734863처럼 길어지므로 소수 첫째 자리까지만 저장
+                "temperature": [round(value, 1) for value in self.temperature],
+                "precipitation": [round(value, 1) for value in self.precipitation],
+                "condition": self.condition.tolist()}
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(data["provider"], data["latitude"], data["longitude"], data["start"], data["temperature"],
+                   data["precipitation"], data["condition"], data["fetched_at"], data["expires_at"],
+                   data.get("last_modified"))
+
+def _wmo_condition(code):
+    """WMO 날씨 코드(Open-Meteo weather_code)를 날씨 상태 번호로 변환합니다."""
+    if not code:
+        return CLEAR
+    if code <= 2:
+        return PARTLY_CLOUDY
+    if code == 3:
+        return CLOUDY
+    if code in (45, 48):
+        return FOG
+    if 51 <= code <= 57:
+        return DRIZZLE
+    if 61 <= code <= 67:
+        return RAIN
+    if 71 <= code <= 77 or code in (85, 86):
+        return SNOW
+    if 80 <= code <= 82:
+        return SHOWERS
+    if code >= 95:
+        return THUNDER
+    return CLOUDY
+
+def _symbol_condition(symbol):
+    """MET Norway symbol_code('partlycloudy_day', 'lightrainshowers_night' 등)를 날씨 상태 번호로 변환합니다."""
+    symbol = (symbol or "").split("_")[0]
+    if "thunder" in symbol:
+        return THUNDER
+    if "snow" in symbol or "sleet" in symbol:
+        return SNOW
+    if "showers" in symbol:
+        return SHOWERS
+    if symbol == "lightrain":
+        return DRIZZLE
+    if "rain" in symbol:
+        return RAIN
+    if symbol == "fog":
+        return FOG
+    if symbol in ("fair", "partlycloudy"):
+        return PARTLY_CLOUDY
+    return CLEAR if symbol == "clearsky" else CLOUDY
+
+class OpenMeteoProvider:
+    """Open-Meteo 예보 API (키 필요 없음). 예보 모델이 한 시간마다 갱신됨"""
+    name = "open-meteo"
+    update_interval = HOUR
+
+    def __init__(self, url="https://api.open-meteo.com/v1/forecast"):
+        self.url = url
+
+    def params(self, latitude, longitude):
+        return {"latitude": latitude, "longitude": longitude, "hourly": "temperature_2m,precipitation,weather_code",
+                "timeformat": "unixtime", "timezone": "GMT", "forecast_days": FORECAST_DAYS}
+
+    def parse(self, data, latitude, longitude):
+        hourly = data["hourly"]
+        times = hourly["time"]
+        return Forecast(self.name, latitude, longitude, times[0] if times else 0,
+                        [value if value is not None else float("nan") for value in hourly["temperature_2m"]],
+                        [value or 0.0 for value in hourly["precipitation"]],
+                        [_wmo_condition(code) for code in hourly["weather_code"]])
+
+class MetNorwayProvider:
+    """
+    노르웨이 기상청(MET Norway) Locationforecast API (키 필요 없음, User-Agent에 연락처 필요).
+    Expires 헤더와 If-Modified-Since를 지원하며, 앞쪽 약 60시간만 시간별 예보이므로 그 구간만 사용함
+    """
+    name = "met-norway"
+    update_interval = HOUR
+    user_agent = "PlanManApp/1.0 (desktop planner)"
+
+    def __init__(self, url="https://api.met.no/weatherapi/locationforecast/2.0/compact"):
+        self.url = url
+
+    def params(self, latitude, longitude):
+        return {"lat": round(latitude, 4), "lon": round(longitude, 4)} # 소수 넷째 자리까지만 허용됨
+
+    def parse(self, data, latitude, longitude):
+        start, temperature, precipitation, condition = None, [], [], []
+        for step in data["properties"]["timeseries"]:
+            when = int(datetime.datetime.fromisoformat(step["time"].replace("Z", "+00:00")).timestamp())
+            next_hour = step["data"].get("next_1_hours")
+            if start is None:
+                start = when
+            elif when != start + len(temperature) * HOUR or next_hour is None:
+                break # 여기서부터는 6시간 간격 예보
+            temperature.append(step["data"]["instant"]["details"]["air_temperature"])
+            precipitation.append((next_hour or {}).get("details", {}).get("precipitation_amount", 0.0))
+            condition.append(_symbol_condition((next_hour or {}).get("summary", {}).get("symbol_code")))
+        return Forecast(self.name, latitude, longitude, start or 0, temperature, precipitation, condition)
+
+PROVIDERS = {provider.name: provider for provider in (OpenMeteoProvider(), MetNorwayProvider())}
+
+def get_provider():
+    provider = PROVIDERS.get(WEATHER_PROVIDER)
+    if provider is None:
+        logger.warning("알 수 없는 날씨 제공자 '%s', open-meteo를 사용합니다.", WEATHER_PROVIDER)
+        provider = PROVIDERS["open-meteo"]
+    return provider
+
+_MAX_AGE = re.compile(r"max-age\s*=\s*(\d+)")
+
+def _expires_at(provider, res, fetched_at):
+    """
+    예보를 다시 가져와야 하는 시각(epoch 초)입니다.
+    서버가 Cache-Control max-age나 Expires를 주면 그 시각, 아니면 제공자가 다음 예보를 내는 시각(update_interval 경계)
+    """
+    match = _MAX_AGE.search(res.headers.get("Cache-Control", ""))
+    if match:
+        return fetched_at + int(match.group(1))
+    expires = res.headers.get("Expires")
+    if expires:
+        try:
+            return email.utils.parsedate_to_datetime(expires).timestamp()
+        except (TypeError, ValueError):
+            pass
+    return (fetched_at // provider.update_interval + 1) * provider.update_interval
+
+def _cache_key(provider, latitude, longitude):
+    return f"{provider.name}:{latitude:.4f},{longitude:.4f}"
+
+def _cache_path(key):
+    return os.path.join(WEATHER_CACHE_DIR, f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json")
+
+def _load_cached(key):
+    """디스크에 저장된 예보를 읽습니다. 없거나 손상되었으면 None"""
+    try:
+        with open(_cache_path(key), 'r', encoding='utf-8') as f:
+            return Forecast.from_json(json.load(f))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning("날씨 캐시를 읽지 못했습니다 (%s): %s", key, e)
+        return None
+
+def _save_cached(key, forecast):
+    try:
+        os.makedirs(WEATHER_CACHE_DIR, exist_ok=True)
+        path = _cache_path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(forecast.to_json(), f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("날씨 캐시 저장 실패 (%s): %s", key, e) # 캐시 저장 실패는 치명적이지 않음
+
+def _fetch_forecast(provider, latitude, longitude, cached):
+    """
+    제공자에게 예보를 요청합니다. cached(오래된 예보)가 있으면 If-Modified-Since 조건부 요청을 보내고,
+    304 응답이면 cached의 유효 시각만 늘려 재사용합니다.
+    """
+    headers = {"User-Agent": getattr(provider, "user_agent", "PlanManApp/1.0")}
+    if cached is not None and cached.last_modified:
+        headers["If-Modified-Since"] = cached.last_modified
+    with metrics.span("weather.fetch"):
+        res = get_session().get(provider.url, params=provider.params(latitude, longitude), headers=headers,
+                                timeout=WEATHER_TIMEOUT)
+    fetched_at = time.time()
+    if res.status_code == 304 and cached is not None:
+        metrics.incr("weather.not_modified")
+        forecast = cached
+    else:
+        res.raise_for_status()
+        with metrics.span("weather.parse"):
+            forecast = provider.parse(res.json(), latitude, longitude)
+        forecast.last_modified = res.headers.get("Last-Modified")
+    forecast.fetched_at = fetched_at
+    forecast.expires_at = _expires_at(provider, res, fetched_at)
+    return forecast
+
+def _load_forecast(provider, latitude, longitude, key, cached):
+    """디스크 캐시가 신선하면 그것을, 아니면 새로 가져온 예보를 반환합니다. (get_forecast의 실제 작업)"""
+    if cached is None:
+        cached = _load_cached(key)
+        if cached is not None and cached.is_fresh():
+            metrics.incr("weather.disk_hit")
+            return cached
+    try:
+        forecast = _fetch_forecast(provider, latitude, longitude, cached)
+    except (requests.exceptions.RequestException, ValueError, KeyError, TypeError, IndexError) as e:
+        if cached is not None: # 네트워크 오류 시 오래된 예보라도 보여줌
+            logger.warning("날씨 예보 갱신 실패, 이전 예보를 사용합니다: %s", e)
+            return cached
+        return {"error": f"날씨 예보를 불러오지 못했습니다: {e}"}
+    _save_cached(key, forecast)
+    return forecast
+
+def get_forecast(location=DEFAULT_LOCATION):
+    """
+    지역(LOCATIONS의 이름)의 예보(Forecast)를 반환합니다. 실패 시 {"error": "에러 메시지"}를 반환합니다.
+    신선한 예보가 메모리나 디스크에 있으면 네트워크 요청을 하지 않으며,
+    같은 지역을 이미 가져오는 중이면 새로 요청하지 않고 그 결과를 기다립니다.
+    """
+    if location not in LOCATIONS:
+        return {"error": f"'{location}' 지역의 좌표가 없습니다."}
+    latitude, longitude = LOCATIONS[location]
+    provider = get_provider()
+    key = _cache_key(provider, latitude, longitude)
+    with _lock:
+        cached = _forecasts.get(key)
+        if cached is not None and cached.is_fresh():
+            metrics.incr("weather.memory_hit")
+            return cached
+        pending = _pending.get(key)
+        leader = pending is None
+        if leader:
+            pending = _pending[key] = Future()
+    if not leader:
+        metrics.incr("weather.coalesced")
+        return pending.result()
+
+    try:
+        result = _load_forecast(provider, latitude, longitude, key, cached)
+    except Exception as e:
+        logger.exception("날씨 예보 처리 중 오류 발생 (%s)", location)
+        result = {"error": f"날씨 예보 처리 중 오류 발생: {e}"}
+    with _lock:
+        if isinstance(result, Forecast):
+            _forecasts[key] = result
+        del _pending[key]
+    pending.set_result(result) # 기다리던 요청들도 같은 결과를 받음
+    return result
+
+def get_cached_forecast(location=DEFAULT_LOCATION):
+    """메모리에 있는 지역의 마지막 예보를 반환합니다. (신선하지 않을 수 있음, 네트워크/디스크 접근 없음, 없으면 None)"""
+    if location not in LOCATIONS:
+        return None
+    with _lock:
+        return _forecasts.get(_cache_key(get_provider(), *LOCATIONS[location]))
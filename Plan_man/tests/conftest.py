@@ -0,0 +1,6 @@
+# tests/conftest.py
+# 앱과 같이 Plan_man 폴더를 기준으로 모듈을 불러오도록 경로 추가 (from modules... / from core...)
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
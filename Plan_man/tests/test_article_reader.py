@@ -0,0 +1,73 @@
+# tests/test_article_reader.py
+import os
+import threading
+from modules import article_reader
+from modules.article_reader import ArticleCache, extract_article
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+def article(number, size=100):
+    return {"url": f"https://news.example.com/{number}", "title": f"기사 {number}", "text": "가" * size}
+
+def file_size(number):
+    return len(article_reader.json.dumps(article(number), ensure_ascii=False).encode('utf-8'))
+
+def test_extract_article_picks_body_and_skips_boilerplate():
+    with open(os.path.join(FIXTURES_DIR, 'article_sample.html'), 'rb') as f:
+        result = extract_article(f.read(), "https://news.example.com/library")
+    assert result["url"] == "https://news.example.com/library"
+    assert result["title"] == "시립도서관, 시험 기간 야간 개방 확대" # og:title 우선
+    paragraphs = result["text"].split("\n\n")
+    assert paragraphs[0].startswith("시립도서관이 다음 달 1일부터")
+    assert paragraphs[-1].startswith("야간 이용자는")
+    assert "짧은 문단" in paragraphs # 본문 요소 안의 문단은 짧아도 그대로 보여줌
+    assert not any(word in result["text"] for word in ("댓글", "관련 기사", "Copyright", "tracker", "회원가입"))
+
+def test_extract_article_with_br_paragraphs_and_fallback():
+    page = ("<html><body><div id='content'>첫 문단은 br 태그로 나뉜 본문의 앞부분입니다."
+            "<br>둘째 문단도 충분히 길어서 본문 점수에 들어가야 합니다.<br>셋째 문단 역시 본문으로 읽혀야 합니다.</div>"
+            "</body></html>")
+    assert extract_article(page)["text"].split("\n\n") == [
+        "첫 문단은 br 태그로 나뉜 본문의 앞부분입니다.", "둘째 문단도 충분히 길어서 본문 점수에 들어가야 합니다.",
+        "셋째 문단 역시 본문으로 읽혀야 합니다."]
+    empty = ("<html><head><meta property='og:description' content='요약만 있는 기사'></head>"
+             "<body><p>짧음</p></body></html>")
+    assert extract_article(empty) == {"url": "", "title": "제목 없음", "text": "요약만 있는 기사"}
+
+def test_cache_evicts_least_recently_used_by_mtime(tmp_path):
+    directory = str(tmp_path / "articles")
+    cache = ArticleCache(directory, max_bytes=10 ** 6)
+    for number in range(3):
+        cache.put(article(number))
+    # 사용 순서는 파일 수정 시각: 1번이 가장 오래, 0번이 가장 최근
+    for number, mtime in ((1, 1000), (2, 2000), (0, 3000)):
+        os.utime(os.path.join(directory, f"{ArticleCache.key(article(number)['url'])}.json"), (mtime, mtime))
+
+    restarted = ArticleCache(directory, max_bytes=file_size(0) * 3) # 다시 시작해도 순서를 파일에서 읽음
+    restarted.put(article(3))
+    assert article(1)["url"] not in restarted
+    assert all(article(number)["url"] in restarted for number in (0, 2, 3))
+    assert len(os.listdir(directory)) == 3
+
+def test_cache_get_marks_article_as_recently_used(tmp_path):
+    cache = ArticleCache(str(tmp_path), max_bytes=file_size(0) * 2)
+    cache.put(article(0))
+    cache.put(article(1))
+    assert cache.get(article(0)["url"]) == article(0)
+    cache.put(article(2)) # 가장 오래 사용하지 않은 1번을 지움
+    assert cache.get(article(1)["url"]) is None
+    assert cache.get(article(0)["url"]) == article(0)
+    assert cache.get("https://news.example.com/none") is None
+
+def test_shutdown_cancels_queued_prefetches(monkeypatch, tmp_path):
+    monkeypatch.setattr(article_reader, "_cache", ArticleCache(str(tmp_path)))
+    release = threading.Event()
+    monkeypatch.setattr(article_reader, "fetch_article", lambda url: release.wait(5) and {"url": url})
+    urls = [f"https://news.example.com/{number}" for number in range(5)]
+    article_reader.prefetch_articles(urls)
+    with article_reader._pending_lock:
+        futures = list(article_reader._pending.values())
+    article_reader.shutdown()
+    release.set()
+    assert article_reader._executor is None
+    assert sum(future.cancelled() for future in futures) == len(urls) - article_reader.ARTICLE_PREFETCH_WORKERS
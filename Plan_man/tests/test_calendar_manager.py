@@ -0,0 +1,166 @@
+# tests/test_calendar_manager.py
+import datetime
+import threading
+import time
+import pytest
+from modules import calendar_manager, search_index
+from modules.event_model import EventIndex
+
+class FakeEvents:
+    """events().list(...).execute()만 흉내내는 가짜 리소스 (요청 파라미터를 기록)"""
+    def __init__(self, items):
+        self.items = items
+        self.requests = []
+
+    def list(self, **params):
+        self.requests.append(params)
+        return self
+
+    def execute(self):
+        return {"items": self.items, "nextSyncToken": f"t{len(self.requests)}"}
+
+class FakeService:
+    def __init__(self, items=()):
+        self.resource = FakeEvents(list(items))
+
+    def events(self):
+        return self.resource
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """임시 SQLite 저장소와 가짜 캘린더 서비스를 사용하도록 calendar_manager를 바꿈"""
+    monkeypatch.setattr(calendar_manager, "EVENT_DB_FILE", str(tmp_path / "events.db"))
+    monkeypatch.setattr(calendar_manager, "_db", None)
+    monkeypatch.setattr(search_index, "_index", search_index.SearchIndex())
+    service = FakeService([{"id": "a", "status": "confirmed", "summary": "회의",
+                            "start": {"dateTime": "2030-01-01T09:00:00Z"}, "end": {"dateTime": "2030-01-01T10:00:00Z"}}])
+    monkeypatch.setattr(calendar_manager, "get_calendar_service", lambda: service)
+    yield service
+    calendar_manager._db.close()
+
+def test_full_sync_is_bounded_to_the_sync_window(store):
+    today = datetime.date.today()
+    assert calendar_manager.sync_events()["full"]
+    params = store.resource.requests[0]
+    assert params["singleEvents"]
+    assert params["timeMin"] == calendar_manager._rfc3339(calendar_manager._to_utc_datetime(
+        today - datetime.timedelta(days=calendar_manager.SYNC_PAST_DAYS)))
+    assert params["timeMax"] == calendar_manager._rfc3339(calendar_manager._to_utc_datetime(
+        today + datetime.timedelta(days=calendar_manager.SYNC_FUTURE_DAYS)))
+
+    # 증분 동기화는 syncToken만 사용 (API가 timeMin/timeMax와 함께 쓰는 것을 허용하지 않음)
+    assert not calendar_manager.sync_events()["full"]
+    assert "timeMin" not in store.resource.requests[1]
+    assert store.resource.requests[1]["syncToken"] == "t1"
+
+def test_store_serves_only_months_inside_the_window(store):
+    calendar_manager.sync_events()
+    today = datetime.date.today()
+    assert calendar_manager.is_synced()
+    assert calendar_manager.is_synced('primary', today, today + datetime.timedelta(days=31))
+    far_future = today + datetime.timedelta(days=calendar_manager.SYNC_FUTURE_DAYS + 1)
+    assert not calendar_manager.is_synced('primary', far_future, far_future + datetime.timedelta(days=31))
+    past = today - datetime.timedelta(days=calendar_manager.SYNC_PAST_DAYS + 1)
+    assert not calendar_manager.is_synced('primary', past, today)
+
+def test_window_close_to_its_end_triggers_a_new_full_sync(store):
+    calendar_manager.sync_events()
+    today = datetime.date.today()
+    # 시간이 흘러 남은 미래 기간이 절반보다 짧아진 상황
+    near_end = today + datetime.timedelta(days=calendar_manager.SYNC_FUTURE_DAYS // 2 - 1)
+    with calendar_manager._db:
+        calendar_manager._db.execute("UPDATE sync_state SET window_end = ?", (near_end.isoformat(),))
+    assert not calendar_manager.is_synced('primary', near_end, near_end + datetime.timedelta(days=31))
+
+    assert calendar_manager.sync_events()["full"]
+    assert "syncToken" not in store.resource.requests[1]
+    assert calendar_manager.is_synced('primary', near_end, near_end + datetime.timedelta(days=31))
+
+@pytest.fixture
+def fetched_months(monkeypatch):
+    """get_events_for_month를 가짜로 바꾸고, 가져온 (연도, 월)을 순서대로 기록"""
+    months = []
+    def fake_get_events_for_month(year, month):
+        months.append((year, month))
+        return EventIndex()
+    monkeypatch.setattr(calendar_manager, "get_events_for_month", fake_get_events_for_month)
+    return months
+
+def test_month_cache_expires_after_ttl(fetched_months):
+    cache = calendar_manager.MonthCache(ttl=60)
+    events = cache.fetch(2025, 3)
+    assert cache.fetch(2025, 3) is events
+    assert fetched_months == [(2025, 3)]
+
+    stored_at, _ = cache._entries[(2025, 3)]
+    cache._entries[(2025, 3)] = (stored_at - 60, events) # 60초가 지난 상황
+    assert cache.get(2025, 3) is None
+    cache.fetch(2025, 3)
+    assert fetched_months == [(2025, 3), (2025, 3)]
+
+def test_month_cache_evicts_least_recently_used_month():
+    cache = calendar_manager.MonthCache(max_size=2)
+    january, february, march = EventIndex(), EventIndex(), EventIndex()
+    cache.put(2025, 1, january)
+    cache.put(2025, 2, february)
+    assert cache.get(2025, 1) is january # 1월을 최근에 사용한 월로 만듦
+    cache.put(2025, 3, march)
+    assert cache.get(2025, 2) is None
+    assert cache.get(2025, 1) is january
+    assert cache.get(2025, 3) is march
+
+def test_month_cache_does_not_store_errors(monkeypatch):
+    monkeypatch.setattr(calendar_manager, "get_events_for_month", lambda year, month: {"error": "오프라인"})
+    cache = calendar_manager.MonthCache()
+    assert cache.fetch(2025, 4) == {"error": "오프라인"}
+    assert cache.get(2025, 4) is None
+
+@pytest.fixture
+def gated_months(monkeypatch):
+    """get_events_for_month가 gate가 열릴 때까지 기다리게 함 (작업 스레드가 바쁜 상황을 만들기 위해)"""
+    gate = threading.Event()
+    months = []
+    def slow_get_events_for_month(year, month):
+        months.append((year, month))
+        gate.wait(5)
+        return EventIndex()
+    monkeypatch.setattr(calendar_manager, "get_events_for_month", slow_get_events_for_month)
+    yield gate, months
+    gate.set()
+
+def test_prefetcher_shares_one_request_per_month(gated_months):
+    gate, months = gated_months
+    prefetcher = calendar_manager.MonthPrefetcher(calendar_manager.MonthCache(), max_workers=2)
+    try:
+        first = prefetcher.request(2025, 5)
+        assert prefetcher.request(2025, 5) is first
+        gate.set()
+        events = first.result(5)
+        assert months == [(2025, 5)]
+        # 끝난 뒤에는 캐시에서 바로 완료된 Future를 돌려줌
+        assert prefetcher.request(2025, 5).result(0) is events
+        assert months == [(2025, 5)]
+    finally:
+        prefetcher.shutdown()
+
+def test_prefetcher_cancels_months_no_longer_adjacent(gated_months):
+    gate, months = gated_months
+    prefetcher = calendar_manager.MonthPrefetcher(calendar_manager.MonthCache(), max_workers=1)
+    try:
+        current = prefetcher.show(2025, 1)
+        deadline = time.time() + 5
+        while not months and time.time() < deadline: # 1월은 실행 중, 2월과 작년 12월은 대기 중
+            time.sleep(0.01)
+        waiting = dict(prefetcher._in_flight)
+        june = prefetcher.show(2025, 6) # 빠르게 6월로 이동
+        assert waiting[(2025, 2)].cancelled()
+        assert waiting[(2024, 12)].cancelled()
+        assert not current.cancelled() # 이미 시작한 요청은 끝까지 실행됨
+        gate.set()
+        june.result(5)
+        for key in ((2025, 5), (2025, 7)):
+            prefetcher.request(*key).result(5)
+        assert sorted(months) == [(2025, 1), (2025, 5), (2025, 6), (2025, 7)]
+        assert months[1] == (2025, 6) # 보여 줄 월을 인접 월보다 먼저 가져옴
+    finally:
+        prefetcher.shutdown()
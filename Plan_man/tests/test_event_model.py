@@ -0,0 +1,63 @@
+# tests/test_event_model.py
+import datetime
+import random
+import pytest
+from modules.event_model import Event, EventIndex, parse_event_time
+
+BASE = datetime.datetime(2025, 3, 1)
+
+def make(event_id, start, minutes, all_day=False):
+    return Event(event_id, start, start + datetime.timedelta(minutes=minutes), all_day, event_id, "primary")
+
+def brute_force(events, start, end):
+    """EventIndex.overlapping과 같은 기준의 단순 구현 (길이 0인 이벤트는 시작 시각이 기간 안일 때 겹침)"""
+    return sorted((e.id for e in events
+                   if e.start < end and (e.end > start or (e.end == e.start and e.start >= start))))
+
+@pytest.mark.parametrize("minutes", [0, 1, 2, 3, 4, 5, 63, 64, 65, 127, 128, 129, 1439, 1440, 1441, 2880])
+def test_overlapping_at_level_boundaries(minutes):
+    # 등급 경계(2의 거듭제곱 분) 길이의 이벤트가 기간 끝/시작에 딱 붙어 있는 경우
+    event = make("e", BASE, minutes)
+    index = EventIndex([event])
+    end = event.end
+    assert [e.id for e in index.overlapping(BASE, BASE + datetime.timedelta(minutes=1))] == ["e"]
+    if minutes:
+        assert index.overlapping(end, end + datetime.timedelta(hours=1)) == [] # 끝 시각은 포함하지 않음
+        last_minute = end - datetime.timedelta(minutes=1)
+        assert [e.id for e in index.overlapping(last_minute, end)] == ["e"]
+    assert index.overlapping(BASE - datetime.timedelta(hours=1), BASE) == [] # 기간 끝(=시작 시각)은 포함하지 않음
+
+def test_overlapping_matches_brute_force():
+    rng = random.Random(7)
+    events = [make(f"e{i}", BASE + datetime.timedelta(minutes=rng.randrange(60 * 24 * 60)),
+                   rng.choice([0, 1, 30, 64, 65, 90, 600, 1440, 1441, 4320, 20000]))
+              for i in range(2000)]
+    index = EventIndex(events[:1000])
+    for event in events[1000:]: # add로 넣은 이벤트도 같은 결과
+        index.add(event)
+    assert len(index) == 2000
+    for _ in range(300):
+        start = BASE + datetime.timedelta(minutes=rng.randrange(-2000, 60 * 24 * 62))
+        end = start + datetime.timedelta(minutes=rng.choice([1, 60, 1440, 10080, 44640]))
+        assert sorted(e.id for e in index.overlapping(start, end)) == brute_force(events, start, end)
+
+def test_on_date_and_count_by_date_span_multiple_days():
+    all_day = Event("trip", datetime.datetime(2025, 3, 3), datetime.datetime(2025, 3, 6), True, "여행", "primary")
+    overnight = make("night", datetime.datetime(2025, 3, 6, 23), 120)
+    index = EventIndex([all_day, overnight])
+    assert [e.id for e in index.on_date(datetime.date(2025, 3, 5))] == ["trip"]
+    assert [e.id for e in index.on_date(datetime.date(2025, 3, 7))] == ["night"]
+    counts = index.count_by_date(datetime.date(2025, 3, 1), datetime.date(2025, 3, 31))
+    assert counts == {datetime.date(2025, 3, 3): 1, datetime.date(2025, 3, 4): 1, datetime.date(2025, 3, 5): 1,
+                      datetime.date(2025, 3, 6): 1, datetime.date(2025, 3, 7): 1}
+
+def test_iteration_is_sorted_across_levels():
+    events = [make("long", BASE, 5000), make("short", BASE + datetime.timedelta(hours=1), 10),
+              make("zero", BASE - datetime.timedelta(hours=1), 0)]
+    assert [e.id for e in EventIndex(events)] == ["zero", "long", "short"]
+
+def test_parse_event_time():
+    assert parse_event_time({"date": "2025-03-01"}) == (datetime.datetime(2025, 3, 1), True)
+    moment, all_day = parse_event_time({"dateTime": "2025-03-01T00:00:00Z"})
+    expected = datetime.datetime(2025, 3, 1, tzinfo=datetime.timezone.utc).astimezone().replace(tzinfo=None)
+    assert (moment, all_day) == (expected, False) # 이 컴퓨터의 현지 시각
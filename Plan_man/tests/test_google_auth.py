@@ -0,0 +1,106 @@
+# tests/test_google_auth.py
+import datetime
+import json
+import os
+import threading
+import time
+import pytest
+from core import google_auth
+
+class CountingLock:
+    """_refresh_lock 대신 사용: 잠금을 얻으려고 한 횟수를 기록"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.attempts = 0
+
+    def __enter__(self):
+        self.attempts += 1
+        self.lock.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.lock.release()
+
+def make_credentials(token="old-token", expires_in=3600):
+    creds = google_auth._ManagedCredentials(token=token, refresh_token="refresh-token", client_id="id",
+                                            client_secret="secret", token_uri="https://oauth2.example/token")
+    # expiry는 시간대 없는 UTC 시각
+    creds.expiry = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None) + datetime.timedelta(seconds=expires_in)
+    return creds
+
+@pytest.fixture
+def token_file(tmp_path, monkeypatch):
+    path = tmp_path / "token.json"
+    monkeypatch.setattr(google_auth, "TOKEN_FILE", str(path))
+    monkeypatch.setattr(google_auth, "_saved_token_json", None)
+    return path
+
+@pytest.fixture
+def fake_refresh(monkeypatch):
+    """실제 토큰 서버 대신 새 토큰을 발급하는 Credentials.refresh (호출 횟수를 기록)"""
+    calls = []
+    def refresh(self, request):
+        calls.append(self)
+        self.token = f"token-{len(calls)}"
+        self.expiry = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None) + datetime.timedelta(hours=1)
+    monkeypatch.setattr(google_auth.Credentials, "refresh", refresh)
+    return calls
+
+def test_save_token_writes_only_when_the_token_changes(token_file):
+    creds = make_credentials()
+    google_auth._save_token(creds)
+    assert json.loads(token_file.read_text())["token"] == "old-token"
+    assert token_file.stat().st_mode & 0o777 == 0o600
+
+    token_file.unlink()
+    google_auth._save_token(creds) # 바뀐 것이 없으므로 다시 쓰지 않음
+    assert not token_file.exists()
+
+    creds.token = "new-token"
+    google_auth._save_token(creds)
+    assert json.loads(token_file.read_text())["token"] == "new-token"
+    assert not os.path.exists(f"{token_file}.tmp")
+
+def test_concurrent_refresh_runs_once(token_file, fake_refresh, monkeypatch):
+    lock = CountingLock()
+    monkeypatch.setattr(google_auth, "_refresh_lock", lock)
+    creds = make_credentials(expires_in=-60)
+    original_refresh = google_auth.Credentials.refresh
+    def slow_refresh(self, request):
+        # 두 번째 스레드가 잠금을 기다리기 시작할 때까지 새로고침을 끝내지 않음
+        deadline = time.time() + 5
+        while lock.attempts < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        original_refresh(self, request)
+    monkeypatch.setattr(google_auth.Credentials, "refresh", slow_refresh)
+
+    threads = [threading.Thread(target=creds.refresh, args=(None,)) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(fake_refresh) == 1
+    assert creds.token == "token-1"
+    assert json.loads(token_file.read_text())["token"] == "token-1"
+
+def test_refresh_again_after_expiry(token_file, fake_refresh):
+    creds = make_credentials(expires_in=-60)
+    creds.refresh(None)
+    creds.expiry = datetime.datetime(2000, 1, 1) # 새로 받은 토큰도 만료됨
+    creds.refresh(None)
+    assert len(fake_refresh) == 2
+    assert json.loads(token_file.read_text())["token"] == "token-2"
+
+def test_background_refresh_waits_at_least_the_minimum(monkeypatch):
+    waits = []
+    class StopAfterFirstWait:
+        def wait(self, timeout):
+            waits.append(timeout)
+            return True
+    monkeypatch.setattr(google_auth, "_refresh_stop", StopAfterFirstWait())
+    # 토큰 수명(60초)이 REFRESH_AHEAD보다 짧아 남은 시간이 음수가 되는 경우
+    google_auth._background_refresh_loop(make_credentials(expires_in=60))
+    google_auth._background_refresh_loop(make_credentials(expires_in=3600))
+    assert waits[0] == google_auth.REFRESH_MIN_WAIT
+    assert waits[1] == pytest.approx(3600 - google_auth.REFRESH_AHEAD, abs=5)
@@ -0,0 +1,119 @@
+# tests/test_ics_importer.py
+import datetime
+import time
+import pytest
+from modules import calendar_manager
+from modules.event_model import Event
+from modules.ics_importer import parse_ics, parse_rule
+
+@pytest.fixture
+def local_zone(monkeypatch):
+    """이 컴퓨터의 시간대를 바꿔 현지 시각으로 바꾸는 결과를 고정"""
+    def set_zone(name):
+        monkeypatch.setenv("TZ", name)
+        time.tzset()
+    yield set_zone
+    monkeypatch.undo()
+    time.tzset()
+
+def calendar(*events):
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "X-WR-CALNAME:테스트"]
+    for event in events:
+        lines += ["BEGIN:VEVENT", *event, "END:VEVENT"]
+    lines.append("END:VCALENDAR")
+    return parse_ics([line + "\r\n" for line in lines], "ics-test")
+
+def starts(cal, start, end):
+    return sorted(event.start for event in cal.events_between(start, end))
+
+def test_count_limits_occurrences_across_windows():
+    cal = calendar(["UID:a", "SUMMARY:회의", "DTSTART:20250106T090000", "DTEND:20250106T100000",
+                    "RRULE:FREQ=WEEKLY;BYDAY=MO,WE;COUNT=5"])
+    expected = [datetime.datetime(2025, 1, day, 9) for day in (6, 8, 13, 15, 20)]
+    assert starts(cal, datetime.datetime(2025, 1, 1), datetime.datetime(2025, 3, 1)) == expected
+    # 기간 앞쪽을 건너뛰어도 COUNT는 첫 발생부터 셈
+    assert starts(cal, datetime.datetime(2025, 1, 15), datetime.datetime(2025, 3, 1)) == expected[3:]
+
+def test_until_is_inclusive():
+    cal = calendar(["UID:a", "DTSTART:20250101T090000", "DTEND:20250101T093000",
+                    "RRULE:FREQ=DAILY;INTERVAL=3;UNTIL=20250110T090000"])
+    assert starts(cal, datetime.datetime(2025, 1, 1), datetime.datetime(2025, 2, 1)) == \
+        [datetime.datetime(2025, 1, day, 9) for day in (1, 4, 7, 10)]
+
+def test_until_date_only_covers_whole_day():
+    rule = parse_rule("FREQ=DAILY;UNTIL=20250110")
+    assert rule.until == datetime.datetime(2025, 1, 10, 23, 59, 59)
+
+def test_nth_weekday_and_last_weekday_of_month():
+    cal = calendar(["UID:second-tue", "DTSTART:20250114T190000", "RRULE:FREQ=MONTHLY;BYDAY=2TU"],
+                   ["UID:last-fri", "DTSTART:20250131T180000", "RRULE:FREQ=MONTHLY;BYDAY=FR;BYSETPOS=-1"])
+    found = sorted((event.start, event.id.split("_")[0]) for event in
+                   cal.events_between(datetime.datetime(2025, 1, 1), datetime.datetime(2025, 4, 1)))
+    assert found == [(datetime.datetime(2025, 1, 14, 19), "second-tue"), (datetime.datetime(2025, 1, 31, 18), "last-fri"),
+                     (datetime.datetime(2025, 2, 11, 19), "second-tue"), (datetime.datetime(2025, 2, 28, 18), "last-fri"),
+                     (datetime.datetime(2025, 3, 11, 19), "second-tue"), (datetime.datetime(2025, 3, 28, 18), "last-fri")]
+
+def test_month_day_31_skips_short_months():
+    cal = calendar(["UID:a", "DTSTART;VALUE=DATE:20250131", "RRULE:FREQ=MONTHLY;BYMONTHDAY=31"])
+    assert starts(cal, datetime.date(2025, 1, 1), datetime.date(2025, 8, 1)) == \
+        [datetime.datetime(2025, month, 31) for month in (1, 3, 5, 7)]
+    assert all(event.all_day for event in cal.events_between(datetime.date(2025, 1, 1), datetime.date(2025, 8, 1)))
+
+def test_exdate_and_overridden_occurrence():
+    cal = calendar(["UID:a", "SUMMARY:스터디", "DTSTART:20250106T090000", "DTEND:20250106T100000",
+                    "RRULE:FREQ=DAILY;COUNT=5", "EXDATE:20250107T090000"],
+                   ["UID:a", "SUMMARY:스터디 (변경)", "RECURRENCE-ID:20250108T090000",
+                    "DTSTART:20250108T140000", "DTEND:20250108T150000"])
+    events = sorted(cal.events_between(datetime.datetime(2025, 1, 1), datetime.datetime(2025, 2, 1)),
+                    key=lambda event: event.start)
+    assert [(event.start, event.summary) for event in events] == [
+        (datetime.datetime(2025, 1, 6, 9), "스터디"), (datetime.datetime(2025, 1, 8, 14), "스터디 (변경)"),
+        (datetime.datetime(2025, 1, 9, 9), "스터디"), (datetime.datetime(2025, 1, 10, 9), "스터디")]
+
+def test_unsupported_rule_keeps_first_occurrence():
+    cal = calendar(["UID:a", "DTSTART:20250106T090000", "RRULE:FREQ=DAILY;BYHOUR=9,17"])
+    assert cal.skipped == 1
+    assert starts(cal, datetime.datetime(2025, 1, 1), datetime.datetime(2025, 2, 1)) == [datetime.datetime(2025, 1, 6, 9)]
+
+def test_tzid_until_in_utc_keeps_last_occurrence(local_zone):
+    local_zone("Asia/Seoul")
+    # 뉴욕 09:00 = UTC 14:00 = 서울 23:00, UNTIL은 마지막 발생과 같은 UTC 시각
+    cal = calendar(["UID:a", "DTSTART;TZID=America/New_York:20250101T090000", "DTEND;TZID=America/New_York:20250101T100000",
+                    "RRULE:FREQ=DAILY;UNTIL=20250110T140000Z"])
+    found = starts(cal, datetime.datetime(2025, 1, 1), datetime.datetime(2025, 2, 1))
+    assert found == [datetime.datetime(2025, 1, day, 23) for day in range(1, 11)]
+
+def test_tzid_rule_follows_its_own_daylight_saving(local_zone):
+    local_zone("Asia/Seoul")
+    cal = calendar(["UID:a", "DTSTART;TZID=America/New_York:20250303T090000", "RRULE:FREQ=WEEKLY;COUNT=3"])
+    # 뉴욕이 3월 9일에 서머타임을 시작하므로 서울 시각으로는 한 시간 앞당겨짐
+    assert starts(cal, datetime.datetime(2025, 3, 1), datetime.datetime(2025, 4, 1)) == [
+        datetime.datetime(2025, 3, 3, 23), datetime.datetime(2025, 3, 10, 22), datetime.datetime(2025, 3, 17, 22)]
+
+def test_unknown_tzid_is_reported(local_zone):
+    local_zone("UTC")
+    cal = calendar(["UID:a", "DTSTART;TZID=Mars/Olympus:20250101T090000"])
+    assert cal.unknown_zones == ["Mars/Olympus"]
+    assert starts(cal, datetime.datetime(2025, 1, 1), datetime.datetime(2025, 1, 2)) == [datetime.datetime(2025, 1, 1, 9)]
+
+def test_not_a_calendar():
+    with pytest.raises(ValueError):
+        parse_ics(["BEGIN:VEVENT\r\n", "END:VEVENT\r\n"], "ics-test")
+
+def test_month_with_only_imported_events_is_not_cached(monkeypatch):
+    imported = Event("ics-1", datetime.datetime(2024, 5, 3, 9), datetime.datetime(2024, 5, 3, 10),
+                     False, "가져온 일정", "ics-test")
+    calls = []
+    def google_fails(*args):
+        calls.append(args)
+        return {"error": "오프라인"}
+    monkeypatch.setattr(calendar_manager, "_get_google_events_for_month", google_fails)
+    monkeypatch.setattr(calendar_manager.ics_importer, "events_between", lambda start, end: [imported])
+
+    cache = calendar_manager.MonthCache()
+    events = cache.fetch(2024, 5)
+    assert list(events) == [imported]
+    assert events.error == "오프라인"
+    assert cache.get(2024, 5) is None
+    cache.fetch(2024, 5)
+    assert len(calls) == 2 # Google 캘린더를 다시 읽음
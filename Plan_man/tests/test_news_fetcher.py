@@ -0,0 +1,219 @@
+# tests/test_news_fetcher.py
+import io
+import os
+import re
+import pytest
+import requests
+import urllib3
+from modules import news_fetcher
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks', 'fixtures')
+FIXTURES = {"rss": "rss_sample.xml", "atom": "atom_sample.xml"}
+
+def load_feed(kind, item_count):
+    """예시 피드의 <item>/<entry>를 반복하거나 잘라 원하는 항목 수의 피드(bytes)를 만듭니다."""
+    with open(os.path.join(FIXTURES_DIR, FIXTURES[kind]), 'rb') as f:
+        data = f.read()
+    tag = b"item" if kind == "rss" else b"entry"
+    blocks = re.findall(rb"\s*<%s>.*?</%s>" % (tag, tag), data, re.S)
+    head = data[:data.index(blocks[0])]
+    tail = data[data.index(blocks[-1]) + len(blocks[-1]):]
+    return head + b"".join(blocks[i % len(blocks)] for i in range(item_count)) + tail
+
+def chunked(data, size=1024):
+    return (data[i:i + size] for i in range(0, len(data), size))
+
+class FakeSession:
+    """get()이 준비된 본문을 스트리밍으로 읽는 응답을 돌려주는 세션"""
+    def __init__(self, body, headers=None):
+        self.body = body
+        self.headers = headers if headers is not None else {"Content-Length": str(len(body))}
+        self.responses = []
+
+    def get(self, url, headers=None, timeout=None, stream=False):
+        res = requests.Response()
+        res.status_code = 200
+        res.url = url
+        res.headers = requests.structures.CaseInsensitiveDict(self.headers)
+        res.raw = urllib3.HTTPResponse(body=io.BytesIO(self.body), headers=self.headers, status=200,
+                                       preload_content=False)
+        self.responses.append(res)
+        return res
+
+@pytest.fixture
+def fake_session(monkeypatch, tmp_path):
+    monkeypatch.setattr(news_fetcher, "FEED_CACHE_DIR", str(tmp_path / "feed_cache"))
+    def install(body, headers=None):
+        session = FakeSession(body, headers)
+        monkeypatch.setattr(news_fetcher, "get_session", lambda: session)
+        return session
+    return install
+
+@pytest.mark.parametrize("kind", ["rss", "atom"])
+def test_parse_sample_with_fewer_items_than_limit(kind):
+    data = load_feed(kind, 15)
+    items, _, consumed = news_fetcher.parse_feed_stream(chunked(data), max_items=20)
+    assert len(items) == 15
+    assert consumed == len(data)
+    assert all(item["title"] != "제목 없음" and item["link"].startswith("http") for item in items)
+
+@pytest.mark.parametrize("kind", ["rss", "atom"])
+def test_parse_stops_early_with_more_items_than_limit(kind):
+    data = load_feed(kind, 2000)
+    items, _, consumed = news_fetcher.parse_feed_stream(chunked(data), max_items=5)
+    assert len(items) == 5
+    assert consumed < len(data) // 10 # 나머지 본문은 읽지 않음
+    assert [item["link"] for item in items] == \
+        [item["link"] for item in news_fetcher.parse_feed_stream([load_feed(kind, 5)], max_items=5)[0]]
+
+@pytest.mark.parametrize("kind", ["rss", "atom"])
+def test_fetch_short_feed_reads_whole_body(fake_session, kind):
+    # 파서가 끝까지 읽은 응답에서 연결을 돌려줄 때 StreamConsumedError가 나지 않아야 함
+    session = fake_session(load_feed(kind, 3))
+    items = news_fetcher._fetch_feed_items("https://example.com/short.xml")
+    assert len(items) == 3
+    assert session.responses[0].raw.tell() == len(session.body)
+
+@pytest.mark.parametrize("kind", ["rss", "atom"])
+def test_fetch_long_feed_drains_small_remainder(fake_session, kind):
+    session = fake_session(load_feed(kind, 300))
+    assert len(news_fetcher._fetch_feed_items("https://example.com/long.xml")) < 300
+    assert len(session.body) <= news_fetcher.FEED_DRAIN_MAX_BYTES
+    assert session.responses[0].raw.tell() == len(session.body) # 연결을 재사용할 수 있도록 끝까지 읽음
+
+def test_fetch_long_feed_drops_large_remainder(fake_session, monkeypatch):
+    monkeypatch.setattr(news_fetcher, "FEED_DRAIN_MAX_BYTES", 16 * 1024)
+    session = fake_session(load_feed("rss", 2000))
+    news_fetcher._fetch_feed_items("https://example.com/huge.xml")
+    assert session.responses[0].raw.tell() < len(session.body) // 2 # 큰 나머지는 받지 않음
+
+def test_fetch_long_feed_without_content_length_stops_draining(fake_session, monkeypatch):
+    monkeypatch.setattr(news_fetcher, "FEED_DRAIN_MAX_BYTES", 16 * 1024)
+    session = fake_session(load_feed("atom", 2000), headers={})
+    news_fetcher._fetch_feed_items("https://example.com/chunked.xml")
+    assert session.responses[0].raw.tell() < len(session.body) // 2
+
+def test_cache_stores_only_metadata(fake_session, tmp_path):
+    fake_session(load_feed("rss", 3))
+    news_fetcher._fetch_feed_items("https://example.com/cached.xml")
+    assert [name[-5:] for name in os.listdir(tmp_path / "feed_cache")] == [".json"]
+
+def scheduler_state(interval=news_fetcher.MIN_REFRESH_INTERVAL, links=None, last_changed=None):
+    return {"due": 0, "interval": interval, "failures": 0, "links": links, "last_changed": last_changed}
+
+def feed_entry(status, links, published=None, ttl=None):
+    published = published or [None] * len(links)
+    return {"status": status, "ttl": ttl,
+            "items": [{"title": link, "link": link, "published": when} for link, when in zip(links, published)]}
+
+@pytest.fixture
+def no_jitter(monkeypatch):
+    monkeypatch.setattr(news_fetcher.random, "uniform", lambda low, high: low)
+
+def test_next_interval_follows_publication_rate(no_jitter):
+    state = scheduler_state()
+    now = 1_000_000
+    entry = feed_entry("fetched", ["a", "b", "c", "d"], [now - 60 * 60 * k for k in range(4)]) # 1시간마다 새 항목
+    assert news_fetcher.FeedScheduler._next_interval(state, entry, now) == 30 * 60
+    assert state["links"] == ["a", "b", "c", "d"]
+
+def test_next_interval_backs_off_when_unchanged(no_jitter):
+    state = scheduler_state(interval=600, links=["a", "b"])
+    for status in ("fetched", "not_modified"):
+        before = state["interval"]
+        news_fetcher.FeedScheduler._next_interval(state, feed_entry(status, ["a", "b"]), 0)
+        assert state["interval"] == before * news_fetcher.UNCHANGED_BACKOFF
+    for _ in range(50):
+        news_fetcher.FeedScheduler._next_interval(state, feed_entry("not_modified", ["a", "b"]), 0)
+    assert state["interval"] == news_fetcher.MAX_REFRESH_INTERVAL
+
+def test_next_interval_keeps_interval_for_fresh_cache(no_jitter):
+    state = scheduler_state(interval=900, links=["a"])
+    assert news_fetcher.FeedScheduler._next_interval(state, feed_entry("fresh", ["a"]), 0) == 900
+
+def test_next_interval_shrinks_on_change_without_dates(no_jitter):
+    state = scheduler_state(interval=3600, links=["a"], last_changed=10_000)
+    news_fetcher.FeedScheduler._next_interval(state, feed_entry("fetched", ["b", "a"]), 10_000 + 1200)
+    assert state["interval"] == 600
+    assert state["last_changed"] == 10_000 + 1200
+
+def test_next_interval_respects_server_ttl_and_minimum(no_jitter):
+    now = 1_000_000
+    busy_feed = [now - 10 * k for k in range(5)] # 10초마다 새 항목
+    state = scheduler_state()
+    news_fetcher.FeedScheduler._next_interval(state, feed_entry("fetched", list("abcde"), busy_feed), now)
+    assert state["interval"] == news_fetcher.MIN_REFRESH_INTERVAL
+    state = scheduler_state()
+    news_fetcher.FeedScheduler._next_interval(state, feed_entry("fetched", list("abcde"), busy_feed, ttl=1800), now)
+    assert state["interval"] == 1800
+
+def test_next_interval_adds_jitter():
+    state = scheduler_state(interval=1000, links=["a"])
+    delay = news_fetcher.FeedScheduler._next_interval(state, feed_entry("fresh", ["a"]), 0)
+    assert 1000 <= delay <= 1000 * (1 + news_fetcher.REFRESH_JITTER)
+
+def test_scheduler_never_submits_after_stop(monkeypatch):
+    monkeypatch.setattr(news_fetcher, "_fetch_feed_entry",
+                        lambda url, use_stale_on_error=True: feed_entry("fetched", [url]))
+    errors = []
+    monkeypatch.setattr(news_fetcher.threading, "excepthook", errors.append)
+    scheduler = news_fetcher.FeedScheduler(max_workers=1)
+    submit = scheduler._executor.submit
+    stopper = None
+
+    def submit_racing_stop(*args):
+        # 제출 직전에 다른 스레드가 stop()을 부르는 경우: stop()이 끝나기 전에 제출해야 함
+        nonlocal stopper
+        if stopper is None:
+            stopper = news_fetcher.threading.Thread(target=scheduler.stop)
+            stopper.start()
+            stopper.join(0.2)
+        return submit(*args)
+
+    monkeypatch.setattr(scheduler._executor, "submit", submit_racing_stop)
+    scheduler.start()
+    scheduler._thread.join(5)
+    stopper.join(5)
+    assert not scheduler._thread.is_alive()
+    assert errors == []
+
+def news(title, link, published):
+    return {"title": title, "link": link, "published": published}
+
+def test_timeline_merges_feeds_newest_first():
+    timeline = news_fetcher.NewsTimeline()
+    timeline.update("정치", [news("a", "https://a.kr/1", 100), news("c", "https://a.kr/3", 300)])
+    timeline.update("경제", [news("b", "https://b.kr/2", 200), news("?", "https://b.kr/x", None),
+                             news("d", "https://b.kr/4", 400)])
+    first = timeline.page(0, page_size=3)
+    assert [item["title"] for item in first["items"]] == ["d", "c", "b"]
+    assert first["has_more"] and first["feeds"] == 2
+    second = timeline.page(1, page_size=3)
+    assert [item["title"] for item in second["items"]] == ["a", "?"] # 발행 시각을 모르는 기사는 맨 뒤
+    assert not second["has_more"]
+    assert [item["category"] for item in first["items"]] == ["경제", "정치", "경제"]
+
+def test_timeline_update_replaces_category_and_bumps_version():
+    timeline = news_fetcher.NewsTimeline()
+    timeline.update("정치", [news("old", "https://a.kr/1", 100)])
+    version = timeline.page()["version"]
+    timeline.update("정치", [news("new", "https://a.kr/2", 50), news("안내", "", None)]) # 링크 없는 안내 항목은 제외
+    page = timeline.page()
+    assert [item["title"] for item in page["items"]] == ["new"]
+    assert page["version"] > version
+
+def test_timeline_drops_duplicates_by_link_and_title():
+    timeline = news_fetcher.NewsTimeline()
+    timeline.update("정치", [news("같은 기사", "https://www.yna.co.kr/view/1?utm_source=rss&b=2&a=1", 300),
+                             news("다른 기사", "https://yna.co.kr/view/2", 200)])
+    timeline.update("세계", [news("링크만 같은 기사", "http://m.yna.co.kr/view/1/?a=1&b=2#top", 250),
+                             news("  같은   기사 ", "https://other.kr/copy", 100),
+                             news("제목 없음", "https://other.kr/untitled", 90)])
+    titles = [item["title"] for item in timeline.page(0, page_size=10)["items"]]
+    assert titles == ["같은 기사", "다른 기사", "제목 없음"] # 먼저(최신) 나온 하나만 남김
+
+def test_normalize_link_and_title_hash():
+    assert news_fetcher._normalize_link("https://www.a.kr/x/?b=2&a=1&fbclid=z#frag") == \
+        news_fetcher._normalize_link("http://a.kr/x?a=1&b=2")
+    assert news_fetcher._normalize_link("https://a.kr/x?id=1") != news_fetcher._normalize_link("https://a.kr/x?id=2")
+    assert news_fetcher._title_hash(" Breaking  News") == news_fetcher._title_hash("breaking news")
@@ -0,0 +1,70 @@
+# tests/test_search_index.py
+from modules.search_index import SearchIndex, normalize
+
+def keys(results):
+    return sorted(key for key, _ in results)
+
+def test_partial_match_inside_words():
+    index = SearchIndex()
+    index.add("a", "주간회의를 준비")
+    index.add("b", "회의실 예약")
+    index.add("c", "점심 약속")
+    assert keys(index.search("회의")) == ["a", "b"]
+    assert keys(index.search("간회")) == ["a"]
+    assert keys(index.search("회의", prefix=True)) == ["b"]
+    assert keys(index.search("회의 준비")) == ["a"]
+    assert index.search("없는말") == []
+
+def test_three_letter_word_needs_contiguous_match():
+    index = SearchIndex()
+    index.add("a", "가나 나다") # '가나', '나다' n-gram은 모두 있지만 '가나다'는 없음
+    index.add("b", "가나다라")
+    assert keys(index.search("가나다")) == ["b"]
+
+def test_choseong_tail_matches_syllable_being_typed():
+    index = SearchIndex()
+    index.add("a", "회의")
+    index.add("b", "회사")
+    assert keys(index.search("회ㅇ")) == ["a"]
+    assert index.search("ㅎ") == [] # 초성 하나만으로는 검색하지 않음
+
+def test_re_adding_changes_title_and_rank():
+    index = SearchIndex()
+    index.add("a", "회의", rank=2)
+    index.add("b", "회의", rank=1)
+    assert [key for key, _ in index.search("회의")] == ["b", "a"]
+    index.add("a", "점심", rank=0)
+    assert keys(index.search("회의")) == ["b"]
+    assert keys(index.search("점심")) == ["a"]
+    assert len(index) == 2
+
+def test_remove_clears_postings():
+    index = SearchIndex()
+    index.add("a", "주간 회의")
+    index.remove("a")
+    index.remove("a") # 없는 문서를 지워도 오류 없음
+    assert index.search("회의") == []
+    assert len(index) == 0
+    assert index._postings == {}
+
+def test_replace_group_drops_missing_documents_only_in_that_group():
+    index = SearchIndex()
+    index.replace_group("news", [("n1", "경제 뉴스", None, 0), ("n2", "정치 뉴스", None, 0)])
+    index.add("e1", "뉴스 스터디", group="event")
+    index.replace_group("news", [("n2", "정치 뉴스 속보", None, 0), ("n3", "세계 뉴스", None, 0)])
+    assert keys(index.search("뉴스")) == ["e1", "n2", "n3"]
+    assert keys(index.search("속보")) == ["n2"]
+    index.remove_group("news")
+    assert keys(index.search("뉴스")) == ["e1"]
+
+def test_moving_document_between_groups():
+    index = SearchIndex()
+    index.add("a", "회의", group="g1")
+    index.add("a", "회의", group="g2")
+    index.remove_group("g1") # 이미 g2로 옮긴 문서는 남음
+    assert keys(index.search("회의")) == ["a"]
+    index.remove_group("g2")
+    assert index.search("회의") == []
+
+def test_normalize():
+    assert normalize("  Weekly\tMEETING  ") == "weekly meeting"
@@ -0,0 +1,61 @@
+# tests/test_study_planner.py
+import datetime
+from modules.study_planner import (FreeTime, StudyPlanner, MIN_SESSION_MINUTES, STUDY_DAY_END, STUDY_DAY_START,
+                                   merge_intervals, subtract_intervals, to_minutes)
+
+DAY = datetime.date(2026, 11, 2)
+
+def at(hour, minute=0, day=DAY):
+    return datetime.datetime(day.year, day.month, day.day, hour, minute)
+
+def test_merge_and_subtract_intervals():
+    assert merge_intervals([(5, 8), (1, 3), (3, 4), (7, 9), (10, 10)]) == [(1, 4), (5, 9)]
+    assert subtract_intervals([(0, 10), (20, 30)], [(2, 4), (8, 22), (25, 40)]) == [(0, 2), (4, 8), (22, 25)]
+    assert subtract_intervals([(0, 10)], []) == [(0, 10)]
+
+def test_free_time_subtracts_busy_within_study_hours():
+    free = FreeTime()
+    free.set_busy([(at(10), at(11)), (at(21), at(23))])
+    midnight = to_minutes(DAY)
+    assert free.slots(DAY) == [(midnight + STUDY_DAY_START, midnight + 600), (midnight + 660, midnight + 1260)]
+
+def test_free_time_keeps_shared_piece_until_last_interval_is_removed():
+    # 두 바쁜 시간이 모두 그날 전체를 덮으면 그날 안으로 자른 조각이 같음
+    whole_day = (at(0), at(0, day=DAY + datetime.timedelta(days=1)))
+    spanning = (at(20, day=DAY - datetime.timedelta(days=1)), at(1, day=DAY + datetime.timedelta(days=1)))
+    free = FreeTime()
+    free.set_busy([whole_day, spanning])
+    assert free.slots(DAY) == []
+    free.set_busy([spanning]) # 하나를 지워도 다른 하나가 여전히 덮고 있음
+    assert free.slots(DAY) == []
+    assert DAY in free.changed_days
+    free.set_busy([])
+    assert free.slots(DAY) != []
+
+def test_planner_never_books_busy_time_or_short_blocks():
+    goals = [{"subject": "수학", "exam_date": DAY + datetime.timedelta(days=7), "hours": 13.2},
+             {"subject": "영어", "exam_date": DAY + datetime.timedelta(days=4), "hours": 0.2}]
+    busy = [(at(10), at(10, 50)), (at(13), at(13, 15)), (at(9, 0, DAY + datetime.timedelta(days=1)),
+                                                          at(12, 0, DAY + datetime.timedelta(days=1)))]
+    planner = StudyPlanner(goals, DAY)
+    planner.set_busy(busy)
+    plan = planner.plan()
+    assert plan["sessions"]
+    for _, start, end in plan["sessions"]:
+        assert end - start >= datetime.timedelta(minutes=MIN_SESSION_MINUTES)
+        assert all(end <= busy_start or start >= busy_end for busy_start, busy_end in busy)
+        assert STUDY_DAY_START <= start.hour * 60 + start.minute and end.hour * 60 + end.minute <= STUDY_DAY_END
+    assert "영어" not in plan["shortfall"] # 최소 길이보다 적게 남은 과목도 블록 하나로 배치
+
+def test_planner_recomputes_only_from_changed_day():
+    goals = [{"subject": "물리", "exam_date": DAY + datetime.timedelta(days=10), "hours": 20}]
+    planner = StudyPlanner(goals, DAY)
+    planner.set_busy([])
+    first = planner.plan()
+    assert planner.recomputed_days == 10
+    assert planner.plan() == first
+    assert planner.recomputed_days == 0
+    late_day = DAY + datetime.timedelta(days=8)
+    planner.set_busy([(at(9, 0, late_day), at(22, 0, late_day))])
+    planner.plan()
+    assert planner.recomputed_days <= 2 # 바뀐 날과 그 뒤의 날만 다시 계산
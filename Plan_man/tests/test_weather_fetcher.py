@@ -0,0 +1,110 @@
+# tests/test_weather_fetcher.py
+import threading
+import time
+from concurrent.futures import Future
+import pytest
+from modules import weather_fetcher
+
+class FakeResponse:
+    def __init__(self, data, status_code=200, headers=None):
+        self.data = data
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def json(self):
+        return self.data
+
+    def raise_for_status(self):
+        pass
+
+class FakeSession:
+    """open-meteo 형식의 예보를 돌려주는 가짜 세션. release가 설정될 때까지 응답을 미룰 수 있음"""
+    def __init__(self, headers=None):
+        self.headers = headers or {}
+        self.requests = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.requests.append(headers)
+        self.release.wait(5)
+        start = int(time.time()) // 3600 * 3600
+        data = {"hourly": {"time": [start, start + 3600], "temperature_2m": [1.5, 2.5],
+                           "precipitation": [0.0, 0.4], "weather_code": [0, 61]}}
+        return FakeResponse(data, headers=self.headers)
+
+@pytest.fixture
+def session(tmp_path, monkeypatch):
+    fake = FakeSession(headers={"Cache-Control": "max-age=600", "Last-Modified": "Sat, 17 Oct 2026 09:00:00 GMT"})
+    monkeypatch.setattr(weather_fetcher, "WEATHER_CACHE_DIR", str(tmp_path / "weather_cache"))
+    monkeypatch.setattr(weather_fetcher, "WEATHER_PROVIDER", "open-meteo")
+    monkeypatch.setattr(weather_fetcher, "_forecasts", {})
+    monkeypatch.setattr(weather_fetcher, "_pending", {})
+    monkeypatch.setattr(weather_fetcher, "get_session", lambda: fake)
+    return fake
+
+def test_concurrent_requests_share_one_fetch(session, monkeypatch):
+    waiting = []
+    class CountingFuture(Future):
+        def result(self, timeout=None):
+            waiting.append(self)
+            return super().result(timeout)
+    monkeypatch.setattr(weather_fetcher, "Future", CountingFuture)
+
+    session.release.clear() # 첫 요청이 응답을 기다리는 동안 나머지 요청이 들어오게 함
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(weather_fetcher.get_forecast("서울")))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    deadline = time.time() + 5
+    while len(waiting) < 4 and time.time() < deadline:
+        time.sleep(0.01)
+    session.release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(session.requests) == 1
+    assert len(results) == 5
+    assert all(result is results[0] for result in results)
+    assert len(set(map(id, waiting))) == 1 # 기다린 요청들이 모두 같은 Future를 공유
+    assert weather_fetcher._pending == {}
+
+def test_fresh_forecast_is_served_from_memory_until_it_expires(session):
+    forecast = weather_fetcher.get_forecast("서울")
+    assert forecast.expires_at == pytest.approx(forecast.fetched_at + 600)
+    assert weather_fetcher.get_forecast("서울") is forecast
+    assert len(session.requests) == 1
+
+    forecast.expires_at = time.time() - 1 # 유효 시간이 지남
+    refreshed = weather_fetcher.get_forecast("서울")
+    assert len(session.requests) == 2
+    assert session.requests[1]["If-Modified-Since"] == "Sat, 17 Oct 2026 09:00:00 GMT"
+    assert refreshed.is_fresh()
+
+def test_disk_cache_is_used_only_while_fresh(session, monkeypatch):
+    weather_fetcher.get_forecast("부산")
+    monkeypatch.setattr(weather_fetcher, "_forecasts", {}) # 프로그램을 다시 시작한 상황
+    weather_fetcher.get_forecast("부산")
+    assert len(session.requests) == 1
+
+    key = weather_fetcher._cache_key(weather_fetcher.get_provider(), *weather_fetcher.LOCATIONS["부산"])
+    stale = weather_fetcher._load_cached(key)
+    stale.expires_at = time.time() - 1
+    weather_fetcher._save_cached(key, stale)
+    monkeypatch.setattr(weather_fetcher, "_forecasts", {})
+    weather_fetcher.get_forecast("부산")
+    assert len(session.requests) == 2
+
+def test_expires_at_prefers_server_headers():
+    provider = weather_fetcher.OpenMeteoProvider()
+    fetched_at = 10 * 3600 + 1200
+    assert weather_fetcher._expires_at(provider, FakeResponse({}, headers={"Cache-Control": "public, max-age=90"}),
+                                       fetched_at) == fetched_at + 90
+    expires = "Thu, 01 Jan 1970 12:00:00 GMT"
+    assert weather_fetcher._expires_at(provider, FakeResponse({}, headers={"Expires": expires}),
+                                       fetched_at) == 12 * 3600
+    # 헤더가 없으면 제공자가 다음 예보를 내는 시각 (update_interval 경계)
+    assert weather_fetcher._expires_at(provider, FakeResponse({}), fetched_at) == 11 * 3600
+    assert weather_fetcher._expires_at(provider, FakeResponse({}, headers={"Expires": "0"}),
+                                       fetched_at) == 11 * 3600
@@ -0,0 +1,90 @@
+# ui/background.py
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+POLL_INTERVAL_MS = 30 # 작업 결과 큐를 확인하는 간격(밀리초)
+MAX_WORKERS = 4
+
+logger = logging.getLogger(__name__)
+
+class BackgroundRunner:
+    """
+    네트워크 요청 같은 느린 작업을 작업 스레드에서 실행하고, 결과를 Tk 이벤트 루프로 돌려줍니다.
+    Tk 위젯은 메인 스레드에서만 다뤄야 하므로, 작업 스레드는 결과를 큐에 넣기만 하고
+    콜백은 root.after로 큐를 비우는 메인 스레드에서 호출됩니다.
+    같은 key로 새 작업을 제출하면 이전 작업의 결과는 오래된 결과로 간주하여 버립니다.
+    """
+    def __init__(self, root, max_workers=MAX_WORKERS):
+        self.root = root
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ui-worker")
+        self._results = queue.Queue()
+        self._latest = {} # {key: 가장 최근에 제출된 작업 번호}
+        self._counter = 0
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._polling = False
+
+    def submit(self, key, func, *args, on_done=None, on_error=None):
+        """
+        func(*args)를 작업 스레드에서 실행합니다.
+        완료되면 메인 스레드에서 on_done(결과)가, 예외가 발생하면 on_error(예외)가 호출됩니다.
+        그 사이에 같은 key로 다른 작업이 제출되었다면 콜백은 호출되지 않습니다.
+        """
+        with self._lock:
+            self._counter += 1
+            job_id = self._counter
+            self._latest[key] = job_id
+            self._pending += 1
+        self._executor.submit(self._run, key, job_id, func, args, on_done, on_error)
+        if not self._polling:
+            self._polling = True
+            self.root.after(POLL_INTERVAL_MS, self._drain)
+        return job_id
+
+    def cancel(self, key):
+        """key로 제출된 진행 중인 작업의 결과를 버리도록 표시합니다. (작업 자체는 끝까지 실행됨)"""
+        with self._lock:
+            self._latest.pop(key, None)
+
+    def is_latest(self, key, job_id):
+        """job_id가 key에 대해 가장 최근에 제출된 작업인지 확인합니다."""
+        with self._lock:
+            return self._latest.get(key) == job_id
+
+    def _run(self, key, job_id, func, args, on_done, on_error):
+        # 작업 스레드에서 실행: Tk 위젯을 건드리지 않고 결과만 큐에 넣음
+        try:
+            self._results.put((key, job_id, True, func(*args), on_done, on_error))
+        except Exception as e:
+            logger.exception("백그라운드 작업 실패 (%s)", key)
+            self._results.put((key, job_id, False, e, on_done, on_error))
+
+    def _drain(self):
+        # 메인 스레드에서 실행: 완료된 작업의 콜백 호출
+        while True:
+            try:
+                key, job_id, ok, value, on_done, on_error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._pending -= 1
+            if not self.is_latest(key, job_id):
+                continue # 사용자가 이미 다른 월/카테고리로 이동함: 오래된 결과는 버림
+            callback = on_done if ok else on_error
+            if callback:
+                try:
+                    callback(value)
+                except Exception:
+                    logger.exception("작업 완료 콜백 실행 중 오류 (%s)", key)
+
+        with self._lock:
+            has_pending = self._pending > 0
+        if has_pending:
+            self.root.after(POLL_INTERVAL_MS, self._drain)
+        else:
+            self._polling = False
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,12 +1,23 @@
 # ui/interface.py
 import tkinter as tk
-from tkinter import ttk, messagebox # messagebox 임포트 추가
-from tkcalendar import Calendar     # tkcalendar 임포트
-from datetime import date           # date 객체 사용을 위해 임포트
-from modules import news_fetcher    # 모듈 자체를 임포트하여 사용
-from modules import calendar_manager # 모듈 자체를 임포트하여 사용
+from tkinter import ttk, messagebox, filedialog # messagebox 임포트 추가
+from datetime import date, datetime # date 객체 사용을 위해 임포트
+from calendar import monthrange     # 해당 월의 마지막 날 계산
+# tkcalendar, news_fetcher(requests, lxml), calendar_manager(Google API 라이브러리)는 무거우므로
+# 첫 화면을 그린 뒤 백그라운드에서, 또는 해당 화면을 열 때 불러옵니다. (빠른 시작을 위해)
+from ui.background import BackgroundRunner # 네트워크 작업을 메인 스레드 밖에서 실행
+import logging
+import sys
 import webbrowser # 뉴스 링크 연결에 필요
-import traceback # 오류 상세 출력을 위해 추가
+from core import metrics # 구간별 소요 시간 측정
+
+logger = logging.getLogger(__name__)
+
+# 하루 일정 개수(1개, 2개, 3개 이상)에 따른 마커 태그와 색상
+EVENT_MARKER_TAGS = ('event_marker_1', 'event_marker_2', 'event_marker_3')
+EVENT_MARKER_COLORS = (('#f4a6a6', 'black'), ('#e05555', 'white'), ('#b00000', 'white'))
+TIMELINE_POLL_MS = 500 # 전체 뉴스 화면에서 아직 도착하지 않은 피드를 확인하는 간격(밀리초)
+MORE_NEWS_LABEL = "▼ 더 보기"
 
 class PlanManApp:
     def __init__(self, root):
@@ -15,8 +26,24 @@ class PlanManApp:
         self.setup_main_window()
         self.create_main_menu_buttons()
         self.current_view_frame = None
-        self.monthly_events_cache = {} # 월별 이벤트 캐시용
+        self.monthly_events_cache = None # 현재 표시 중인 월의 이벤트 (EventIndex)
+        self.month_cache = None # (연도, 월)별 이벤트 캐시 (TTL + LRU) - 캘린더 화면을 처음 열 때 생성
+        self.month_prefetcher = None # 인접 월 미리 가져오기 - 캘린더 화면을 처음 열 때 생성
         self.cal = None # Calendar 위젯을 저장할 변수 초기화
+        self.event_marker_ids = {} # 달력에 표시한 마커 ({date: (calevent id, (태그, 표시 문구))})
+        self.runner = BackgroundRunner(root) # 느린 작업은 작업 스레드에서 실행하고 결과만 Tk 루프로 받음
+        self.study_planner = None # 마지막으로 세운 공부 계획 (목표가 같으면 다시 세울 때 바뀐 날짜만 계산)
+        self.weather_location = None # 날씨 화면에서 마지막으로 고른 지역 (None이면 기본 지역)
+        self.first_paint_ms = None
+        self.root.after_idle(self.on_first_paint)
+
+    def on_first_paint(self):
+        """첫 화면이 그려진 뒤 호출됩니다. 시작 시간을 기록하고 무거운 모듈을 백그라운드에서 불러옵니다."""
+        self.root.update_idletasks()
+        self.first_paint_ms = metrics.since_start_ms()
+        metrics.observe("startup.first_paint", self.first_paint_ms)
+        logger.info("첫 화면 표시까지 %.0fms", self.first_paint_ms)
+        self.runner.submit('warm_up', warm_up_modules)
 
     def setup_main_window(self):
         window_width = 800
@@ -41,8 +68,9 @@ class PlanManApp:
         buttons_info = [
             ("📅 일정 관리", self.show_calendar_view_new),
             ("📰 오늘의 뉴스", self.show_news_view),
-            ("✍️ 시험 공부 계획", lambda: self.show_placeholder_view("시험 공부 계획")),
-            ("☀️ 날씨 보기", lambda: self.show_placeholder_view("날씨 보기")),
+            ("✍️ 시험 공부 계획", self.show_study_plan_view),
+            ("☀️ 날씨 보기", self.show_weather_view),
+            ("🔍 검색", self.show_search_view),
             ("🚪 종료", self.root.quit)
         ]
         for text, command in buttons_info:
@@ -57,63 +85,401 @@ class PlanManApp:
         self.current_view_frame = tk.Frame(self.content_frame)
         self.current_view_frame.pack(expand=True, fill=tk.BOTH)
 
-    def show_placeholder_view(self, feature_name):
-        self.clear_content_frame()
-        label = tk.Label(self.current_view_frame, text=f"{feature_name} 기능은 추후 연결 예정입니다.", font=("Arial", 16))
-        label.pack(pady=50, padx=20, expand=True, anchor=tk.CENTER)
-        
-    def show_news_view(self):
+    def show_news_view(self, article_item=None):
+        """뉴스 화면을 엽니다. article_item(뉴스 항목)이 있으면 그 기사를 읽기 창에 엽니다. (검색 결과에서 이동할 때)"""
+        from modules import news_fetcher # 보통은 warm_up_modules에서 이미 불러온 상태
+        from modules import article_reader
         self.clear_content_frame()
         news_view_container = tk.Frame(self.current_view_frame)
         news_view_container.pack(expand=True, fill=tk.BOTH)
         category_buttons_frame = tk.Frame(news_view_container)
         category_buttons_frame.pack(fill=tk.X, pady=(0, 5))
+        # 위: 뉴스 목록, 아래: 기사 읽기 창 (경계를 끌어 크기 조절)
+        news_panes = ttk.PanedWindow(news_view_container, orient=tk.VERTICAL)
+        news_panes.pack(expand=True, fill=tk.BOTH)
+        news_list_frame = tk.Frame(news_panes)
+        reader_frame = tk.Frame(news_panes)
+        news_panes.add(news_list_frame, weight=1)
+        news_panes.add(reader_frame, weight=2)
+
         self.news_listbox = tk.Listbox(
-            news_view_container, font=("Arial", 12), activestyle='dotbox',
+            news_list_frame, font=("Arial", 12), activestyle='dotbox',
             selectbackground="#a6a6a6", selectforeground="white"
         )
-        news_scrollbar = ttk.Scrollbar(news_view_container, orient=tk.VERTICAL, command=self.news_listbox.yview)
+        news_scrollbar = ttk.Scrollbar(news_list_frame, orient=tk.VERTICAL, command=self.news_listbox.yview)
         self.news_listbox.config(yscrollcommand=news_scrollbar.set)
         news_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.news_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.news_items_cache = []
 
+        reader_header = tk.Frame(reader_frame)
+        reader_header.pack(fill=tk.X, pady=(5, 0))
+        reader_title = tk.Label(reader_header, text="", font=("Arial", 13, "bold"), anchor="w", justify=tk.LEFT,
+                                wraplength=600)
+        reader_title.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        reader_browser_button = ttk.Button(reader_header, text="브라우저에서 열기", state=tk.DISABLED,
+                                           command=lambda: webbrowser.open(self.reader_url))
+        reader_browser_button.pack(side=tk.RIGHT)
+        reader_text = tk.Text(reader_frame, wrap=tk.WORD, font=("Arial", 11), padx=8, pady=8)
+        reader_scrollbar = ttk.Scrollbar(reader_frame, orient=tk.VERTICAL, command=reader_text.yview)
+        reader_text.config(yscrollcommand=reader_scrollbar.set)
+        reader_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        reader_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        reader_text.insert(tk.END, "뉴스를 더블클릭하면 여기에서 기사를 읽을 수 있습니다.")
+        reader_text.config(state=tk.DISABLED)
+        self.reader_url = None # 읽기 창에 표시 중인 기사 링크
+        self.news_source = None # 현재 보고 있는 카테고리 (None이면 전체 뉴스)
+        self.news_limit = news_fetcher.MAX_NEWS_ITEMS # 지금까지 펼친 항목 수 (더 보기를 누를 때마다 한 페이지씩 늘림)
+
         def load_news_for_category(category):
+            self.news_source = category
+            self.news_limit = news_fetcher.MAX_NEWS_ITEMS
+            self.news_listbox.delete(0, tk.END)
+            self.news_items_cache.clear()
+            self.news_listbox.insert(tk.END, f"'{category}' 뉴스를 불러오는 중...")
+            self.news_listbox.itemconfig(tk.END, {'fg': 'gray'})
+            # 미리 가져온 데이터가 있으면 바로 사용, 없으면 작업 스레드에서 가져옴
+            self.runner.submit('news', news_fetcher.get_cached_news_items, category,
+                               on_done=show_category_items, on_error=lambda e: show_news_items([]))
+
+        def show_category_items(items):
+            show_news_items(items[:self.news_limit], has_more=len(items) > self.news_limit)
+
+        def load_timeline():
+            self.news_source = None
+            self.news_limit = news_fetcher.MAX_NEWS_ITEMS
+            self.runner.cancel('news') # 진행 중인 카테고리 로드 결과는 버림
+            news_fetcher.start_feed_scheduler() # 아직 시작되지 않았다면 모든 피드 가져오기 시작 (이미 실행 중이면 무시)
+            show_timeline()
+
+        def show_timeline(shown_version=None):
+            # 메모리에 있는 피드만 합치므로 메인 스레드에서 바로 호출해도 빠름
+            if self.news_source is not None or not self.news_listbox.winfo_exists():
+                return # 그 사이 다른 카테고리나 화면으로 이동함
+            if shown_version is None or news_fetcher.timeline_version() != shown_version:
+                page = news_fetcher.get_timeline_page(0, self.news_limit)
+                shown_version = page["version"]
+                if page["items"]:
+                    show_news_items(page["items"], has_more=page["has_more"], with_category=True)
+                else:
+                    self.news_listbox.delete(0, tk.END)
+                    self.news_items_cache.clear()
+                    self.news_listbox.insert(tk.END, "전체 뉴스를 불러오는 중...")
+                    self.news_listbox.itemconfig(tk.END, {'fg': 'gray'})
+                if page["feeds"] >= len(news_fetcher.CATEGORY_RSS):
+                    return # 모든 피드가 도착함
+            # 아직 도착하지 않은 피드가 있으면 도착하는 대로 다시 그림
+            self.root.after(TIMELINE_POLL_MS, lambda: show_timeline(shown_version))
+
+        def show_article(item):
+            url = item['link']
+            self.reader_url = url
+            reader_browser_button.config(state=tk.NORMAL)
+            article = article_reader.get_cached_article(url) # 디스크 캐시 (미리 가져온 기사는 바로 표시)
+            if article is not None:
+                render_article(url, article)
+                return
+            render_article(url, {"title": item['title'], "text": "기사를 불러오는 중..."})
+            self.runner.submit('article', article_reader.get_article, url,
+                               on_done=lambda article: render_article(url, article, item['title']),
+                               on_error=lambda e: render_article(url, {"error": str(e)}, item['title']))
+
+        def render_article(url, article, fallback_title=""):
+            if not reader_text.winfo_exists() or url != self.reader_url:
+                return # 그 사이 다른 화면이나 다른 기사로 이동함
+            if "error" in article:
+                title, text = fallback_title, f"{article['error']}\n\n'브라우저에서 열기'로 원문을 볼 수 있습니다."
+            else:
+                title, text = article["title"], article["text"] or "본문을 찾지 못했습니다. '브라우저에서 열기'로 원문을 볼 수 있습니다."
+            reader_title.config(text=title)
+            reader_text.config(state=tk.NORMAL)
+            reader_text.delete("1.0", tk.END)
+            reader_text.insert(tk.END, text)
+            reader_text.config(state=tk.DISABLED)
+
+        def show_news_items(items, has_more=False, with_category=False):
+            if not self.news_listbox.winfo_exists(): # 그 사이 다른 화면으로 이동함
+                return
+            top = self.news_listbox.yview()[0] # 더 보기/새 피드 도착으로 다시 그려도 보던 위치 유지
             self.news_listbox.delete(0, tk.END)
             self.news_items_cache.clear()
-            items = news_fetcher.get_news_items_by_category(category)
             if items:
                 for i, item in enumerate(items):
-                    self.news_listbox.insert(tk.END, f"{i+1}. {item['title']}")
+                    prefix = f"[{item['category']}] " if with_category else ""
+                    self.news_listbox.insert(tk.END, f"{i+1}. {prefix}{item['title']}")
                     self.news_items_cache.append(item)
                     if "❌" in item['title'] or "✅" in item['title']:
                         self.news_listbox.itemconfig(tk.END, {'fg': 'gray'})
+                if has_more:
+                    self.news_listbox.insert(tk.END, MORE_NEWS_LABEL)
+                    self.news_listbox.itemconfig(tk.END, {'fg': 'blue'})
+                self.news_listbox.yview_moveto(top)
+                # 목록 위쪽 기사는 읽기 창에서 바로 열 수 있도록 미리 가져옴
+                article_reader.prefetch_articles([item['link'] for item in items if item.get('link')])
             else:
                 self.news_listbox.insert(tk.END, "뉴스를 불러오지 못했습니다.")
                 self.news_listbox.itemconfig(tk.END, {'fg': 'red'})
 
+        def show_more():
+            self.news_limit += news_fetcher.MAX_NEWS_ITEMS
+            if self.news_source is None:
+                show_timeline()
+            else: # 카테고리 항목은 이미 메모리에 있으므로 바로 반환됨
+                show_category_items(news_fetcher.get_cached_news_items(self.news_source))
+
         def open_article(event):
             selected_indices = self.news_listbox.curselection()
             if selected_indices:
                 actual_index = selected_indices[0]
-                if 0 <= actual_index < len(self.news_items_cache):
+                if actual_index == len(self.news_items_cache) and self.news_listbox.get(actual_index) == MORE_NEWS_LABEL:
+                    show_more()
+                elif 0 <= actual_index < len(self.news_items_cache):
                     item = self.news_items_cache[actual_index]
                     url = item.get('link')
                     if url and not ("❌" in item['title'] or "✅" in item['title']):
-                        webbrowser.open(url)
+                        show_article(item)
                     elif not url:
                         messagebox.showinfo("뉴스 정보", "이 항목에는 연결된 링크가 없습니다.")
         self.news_listbox.bind("<Double-Button-1>", open_article)
 
+        ttk.Button(category_buttons_frame, text="전체", command=load_timeline).pack(side=tk.LEFT, expand=True, fill=tk.X, padx=2)
         for i, category in enumerate(news_fetcher.CATEGORY_RSS.keys()):
             btn = ttk.Button(category_buttons_frame, text=category,
                              command=lambda c=category: load_news_for_category(c))
             btn.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=2)
             if i == 0:
                 load_news_for_category(category)
+        if article_item is not None and article_item.get('link'):
+            show_article(article_item)
 
-    def show_calendar_view_new(self):
-        print("--- show_calendar_view_new 함수 호출됨 ---")
+    def show_study_plan_view(self):
+        from modules import calendar_manager, study_planner # 보통은 warm_up_modules에서 이미 불러온 상태
+        self.clear_content_frame()
+        goals = study_planner.load_goals()
+
+        form_frame = tk.Frame(self.current_view_frame)
+        form_frame.pack(fill=tk.X, pady=(0, 5))
+        entries = {}
+        for label, key, width in (("과목", "subject", 14), ("시험 날짜(YYYY-MM-DD)", "exam_date", 12), ("필요 시간(h)", "hours", 6)):
+            tk.Label(form_frame, text=label).pack(side=tk.LEFT, padx=(5, 2))
+            entries[key] = ttk.Entry(form_frame, width=width)
+            entries[key].pack(side=tk.LEFT)
+        goals_listbox = tk.Listbox(self.current_view_frame, height=4, font=("Arial", 11))
+        goals_listbox.pack(fill=tk.X)
+        status_label = tk.Label(self.current_view_frame, anchor="w", justify=tk.LEFT)
+        status_label.pack(fill=tk.X, pady=5)
+        plan_listbox = tk.Listbox(self.current_view_frame, font=("Arial", 11), activestyle="none")
+        plan_scrollbar = ttk.Scrollbar(self.current_view_frame, orient=tk.VERTICAL, command=plan_listbox.yview)
+        plan_listbox.config(yscrollcommand=plan_scrollbar.set)
+        plan_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        plan_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        def show_goals():
+            goals_listbox.delete(0, tk.END)
+            for goal in goals:
+                goals_listbox.insert(tk.END, f"{goal['subject']} - 시험 {goal['exam_date']:%Y-%m-%d}, {goal['hours']:g}시간")
+
+        def add_goal():
+            try:
+                goal = {"subject": entries["subject"].get().strip(),
+                        "exam_date": date.fromisoformat(entries["exam_date"].get().strip()),
+                        "hours": float(entries["hours"].get())}
+            except ValueError:
+                messagebox.showerror("입력 오류", "시험 날짜는 YYYY-MM-DD, 필요 시간은 숫자로 입력하세요.")
+                return
+            if not goal["subject"] or goal["hours"] <= 0 or goal["exam_date"] <= date.today():
+                messagebox.showerror("입력 오류", "과목 이름, 0보다 큰 시간, 오늘 이후의 시험 날짜를 입력하세요.")
+                return
+            goals.append(goal)
+            study_planner.save_goals(goals)
+            show_goals()
+            for entry in entries.values():
+                entry.delete(0, tk.END)
+
+        def remove_goal():
+            for index in reversed(goals_listbox.curselection()):
+                del goals[index]
+            study_planner.save_goals(goals)
+            show_goals()
+
+        def make_plan():
+            if not goals:
+                status_label.config(text="과목과 시험 날짜를 추가하세요.", fg="gray")
+                return
+            today = date.today()
+            last_exam = max(goal["exam_date"] for goal in goals)
+            status_label.config(text="캘린더의 바쁜 시간을 불러오는 중...", fg="gray")
+            # 바쁜 시간은 저장소(동기화된 경우) 또는 freeBusy 배치 요청 한 번으로 가져옴
+            self.runner.submit('study', calendar_manager.get_busy_intervals, today, last_exam,
+                               on_done=lambda busy: show_plan(today, busy),
+                               on_error=lambda e: show_plan(today, {"error": str(e)}))
+
+        def show_plan(today, busy):
+            if not plan_listbox.winfo_exists(): # 그 사이 다른 화면으로 이동함
+                return
+            if isinstance(busy, dict): # 오류 결과 ({"error": ...})
+                status_label.config(text=busy["error"], fg="red")
+                return
+            planner = self.study_planner
+            if planner is None or planner.start_day != today or planner.goals != sorted(goals, key=lambda g: g["exam_date"]):
+                planner = self.study_planner = study_planner.StudyPlanner(goals, today)
+            with metrics.span("study.plan"):
+                planner.set_busy(busy) # 지난 계획과 비교하여 바쁜 시간이 바뀐 날짜만 다시 계산
+                plan = planner.plan()
+
+            plan_listbox.delete(0, tk.END)
+            current_day = None
+            for subject, start, end in plan["sessions"]:
+                if start.date() != current_day:
+                    current_day = start.date()
+                    plan_listbox.insert(tk.END, f"{current_day:%Y-%m-%d} ({'월화수목금토일'[current_day.weekday()]})")
+                    plan_listbox.itemconfig(tk.END, {'fg': '#4285f4'})
+                plan_listbox.insert(tk.END, f"    {start:%H:%M}~{end:%H:%M}  {subject}")
+            total = sum((end - start).total_seconds() for _, start, end in plan["sessions"]) / 3600
+            text = f"공부 블록 {len(plan['sessions'])}개, 총 {total:.1f}시간 (다시 계산한 날짜 {planner.recomputed_days}일)"
+            if plan["shortfall"]:
+                text += "\n빈 시간이 부족하여 배치하지 못한 시간: " + ", ".join(
+                    f"{subject} {minutes / 60:.1f}시간" for subject, minutes in plan["shortfall"].items())
+            status_label.config(text=text, fg="red" if plan["shortfall"] else "black")
+
+        ttk.Button(form_frame, text="추가", command=add_goal).pack(side=tk.LEFT, padx=5)
+        ttk.Button(form_frame, text="선택 삭제", command=remove_goal).pack(side=tk.LEFT)
+        ttk.Button(form_frame, text="계획 세우기", command=make_plan).pack(side=tk.RIGHT, padx=5)
+        show_goals()
+        make_plan()
+
+    def show_weather_view(self):
+        from modules import weather_fetcher
+        self.clear_content_frame()
+        location_var = tk.StringVar(value=self.weather_location or weather_fetcher.DEFAULT_LOCATION)
+
+        top_frame = tk.Frame(self.current_view_frame)
+        top_frame.pack(fill=tk.X, pady=(0, 5))
+        tk.Label(top_frame, text="지역").pack(side=tk.LEFT, padx=(5, 2))
+        location_box = ttk.Combobox(top_frame, textvariable=location_var, values=list(weather_fetcher.LOCATIONS),
+                                    state="readonly", width=8)
+        location_box.pack(side=tk.LEFT)
+        status_label = tk.Label(top_frame, fg="gray")
+        status_label.pack(side=tk.RIGHT, padx=5)
+        current_label = tk.Label(self.current_view_frame, font=("Arial", 20), pady=10)
+        current_label.pack(fill=tk.X)
+
+        lists_frame = tk.Frame(self.current_view_frame)
+        lists_frame.pack(expand=True, fill=tk.BOTH)
+        tk.Label(lists_frame, text="시간별 (24시간)", font=("Arial", 12, "bold")).grid(row=0, column=0, sticky="w")
+        tk.Label(lists_frame, text="날짜별", font=("Arial", 12, "bold")).grid(row=0, column=1, sticky="w", padx=(10, 0))
+        hourly_listbox = tk.Listbox(lists_frame, font=("Arial", 11), activestyle="none")
+        hourly_listbox.grid(row=1, column=0, sticky="nsew")
+        daily_listbox = tk.Listbox(lists_frame, font=("Arial", 11), activestyle="none")
+        daily_listbox.grid(row=1, column=1, sticky="nsew", padx=(10, 0))
+        lists_frame.columnconfigure(0, weight=1)
+        lists_frame.columnconfigure(1, weight=1)
+        lists_frame.rowconfigure(1, weight=1)
+
+        def render(location, forecast):
+            if not current_label.winfo_exists() or location != location_var.get(): # 다른 화면/지역으로 이동함
+                return
+            if isinstance(forecast, dict): # 오류 결과 ({"error": ...})
+                status_label.config(text=forecast["error"], fg="red")
+                return
+            names = weather_fetcher.CONDITIONS
+            now = forecast.current()
+            if now:
+                name, icon = names[now[3]]
+                current_label.config(text=f"{icon} {now[1]:.1f}°C  {name}")
+            hourly_listbox.delete(0, tk.END)
+            for when, temperature, precipitation, condition in forecast.hourly():
+                rain = f"  💧{precipitation:.1f}mm" if precipitation >= 0.1 else ""
+                hourly_listbox.insert(tk.END, f"{when:%d일 %H시}  {names[condition][1]} {temperature:.1f}°C{rain}")
+            daily_listbox.delete(0, tk.END)
+            for day, low, high, precipitation, condition in forecast.daily():
+                rain = f"  💧{precipitation:.1f}mm" if precipitation >= 0.1 else ""
+                daily_listbox.insert(tk.END, f"{day:%m-%d} ({'월화수목금토일'[day.weekday()]})  {names[condition][1]} "
+                                             f"{low:.0f}° / {high:.0f}°{rain}")
+            fetched = datetime.fromtimestamp(forecast.fetched_at)
+            status_label.config(text=f"{forecast.provider} 예보, {fetched:%H:%M} 기준", fg="gray")
+
+        def load(_event=None):
+            location = self.weather_location = location_var.get()
+            forecast = weather_fetcher.get_cached_forecast(location)
+            if forecast is not None:
+                render(location, forecast) # 지난 예보를 바로 표시 (신선하면 네트워크 요청 없음)
+                if forecast.is_fresh():
+                    return
+            else:
+                current_label.config(text="")
+                hourly_listbox.delete(0, tk.END)
+                daily_listbox.delete(0, tk.END)
+            status_label.config(text="예보를 불러오는 중...", fg="gray")
+            self.runner.submit('weather', weather_fetcher.get_forecast, location,
+                               on_done=lambda result: render(location, result),
+                               on_error=lambda e: render(location, {"error": str(e)}))
+
+        location_box.bind("<<ComboboxSelected>>", load)
+        load()
+
+    def show_search_view(self):
+        from modules import search_index # 가벼운 모듈 (색인은 일정/뉴스를 가져올 때마다 채워짐)
+        self.clear_content_frame()
+        search_container = tk.Frame(self.current_view_frame)
+        search_container.pack(expand=True, fill=tk.BOTH)
+        query_var = tk.StringVar()
+        query_entry = ttk.Entry(search_container, textvariable=query_var, font=("Arial", 13))
+        query_entry.pack(fill=tk.X, pady=(0, 5))
+        query_entry.focus_set()
+        status_label = tk.Label(search_container, anchor="w", fg="gray",
+                                text=f"일정과 뉴스 제목 {search_index.document_count()}개에서 검색합니다.")
+        status_label.pack(fill=tk.X)
+        results_listbox = tk.Listbox(search_container, font=("Arial", 12), activestyle='dotbox')
+        results_scrollbar = ttk.Scrollbar(search_container, orient=tk.VERTICAL, command=results_listbox.yview)
+        results_listbox.config(yscrollcommand=results_scrollbar.set)
+        results_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        results_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        results = []
+
+        def run_search(*_):
+            # 메모리 색인만 조회하므로 글자를 입력할 때마다 메인 스레드에서 바로 검색
+            results_listbox.delete(0, tk.END)
+            results.clear()
+            query = query_var.get()
+            if not query.strip():
+                return
+            with metrics.span("search.query"):
+                found = search_index.search(query)
+            for result in found:
+                item = result["item"]
+                if result["kind"] == "event":
+                    when = f"{item.start:%Y-%m-%d}" if item.all_day else f"{item.start:%Y-%m-%d %H:%M}"
+                    results_listbox.insert(tk.END, f"📅 {when}  {item.summary}")
+                else:
+                    results_listbox.insert(tk.END, f"📰 [{item['category']}] {item['title']}")
+                results.append(result)
+            if not found:
+                results_listbox.insert(tk.END, "검색 결과가 없습니다.")
+                results_listbox.itemconfig(tk.END, {'fg': 'gray'})
+
+        def open_result(event=None):
+            selected_indices = results_listbox.curselection()
+            if not selected_indices or selected_indices[0] >= len(results):
+                return
+            result = results[selected_indices[0]]
+            if result["kind"] == "event": # 일정이 있는 날짜의 달력으로 이동
+                self.show_calendar_view_new(result["item"].start.date())
+            else: # 뉴스 화면의 읽기 창에서 열기 (목록에서 열 때와 같은 기사 캐시 사용)
+                self.show_news_view(article_item=result["item"])
+
+        query_var.trace_add("write", run_search)
+        results_listbox.bind("<Double-Button-1>", open_result)
+        results_listbox.bind("<Return>", open_result)
+
+    def show_calendar_view_new(self, selected_date=None):
+        """캘린더 화면을 엽니다. selected_date(date)가 있으면 그 날짜를 선택한 달력으로 엽니다. (검색 결과에서 이동할 때)"""
+        logger.debug("캘린더 화면 표시")
+        from tkcalendar import Calendar
+        from modules import calendar_manager # 보통은 warm_up_modules에서 이미 불러온 상태
+        if self.month_prefetcher is None:
+            self.month_cache = calendar_manager.MonthCache()
+            self.month_prefetcher = calendar_manager.MonthPrefetcher(self.month_cache)
         self.clear_content_frame()
         
         calendar_ui_container = tk.Frame(self.current_view_frame)
@@ -126,14 +492,24 @@ class PlanManApp:
         right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=False)
         right_frame.pack_propagate(False)
 
-        today = date.today()
+        selected_date = selected_date or date.today()
         # self.cal을 여기서 생성하고 저장합니다.
         self.cal = Calendar(
-            left_frame, selectmode='day', year=today.year, month=today.month, day=today.day,
+            left_frame, selectmode='day', year=selected_date.year, month=selected_date.month, day=selected_date.day,
             date_pattern='yyyy-mm-dd', locale='ko_KR', showweeknumbers=False,
         )
         self.cal.pack(expand=True, fill=tk.BOTH, pady=(0,10))
+        # 일정 개수별 마커 색은 달력을 만들 때 한 번만 설정
+        for tag, (background, foreground) in zip(EVENT_MARKER_TAGS, EVENT_MARKER_COLORS):
+            self.cal.tag_config(tag, background=background, foreground=foreground)
+        self.event_marker_ids = {} # {date: (calevent id, (태그, 표시 문구))} - 새 달력이므로 초기화
         
+        # 내보낸 캘린더 파일(.ics) 가져오기: 파일 읽기는 작업 스레드에서
+        ics_buttons = tk.Frame(right_frame)
+        ics_buttons.pack(side=tk.BOTTOM, fill=tk.X, pady=(5, 0))
+        tk.Button(ics_buttons, text="📥 ICS 가져오기", command=self.import_ics_file).pack(side=tk.LEFT, padx=5)
+        tk.Button(ics_buttons, text="가져온 ICS 지우기", command=self.remove_ics_imports).pack(side=tk.LEFT)
+
         tk.Label(right_frame, text="선택한 날짜의 일정:", font=("Arial", 11, "bold")).pack(anchor="w", padx=5, pady=(0,5))
         self.event_details_listbox = tk.Listbox(right_frame, height=15, font=("Arial", 10), activestyle="none")
         event_details_scrollbar = ttk.Scrollbar(right_frame, orient=tk.VERTICAL, command=self.event_details_listbox.yview)
@@ -141,111 +517,186 @@ class PlanManApp:
         event_details_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.event_details_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5,0))
 
-        # 이벤트 바인딩 전에 on_date_or_month_changed 메소드가 정의되어 있어야 합니다.
-        self.cal.bind("<<CalendarSelected>>", self.on_date_or_month_changed)
-        self.cal.bind("<<CalendarMonthChanged>>", self.on_date_or_month_changed)
+        # 이벤트 바인딩 전에 on_date_selected / on_month_changed 메소드가 정의되어 있어야 합니다.
+        # 날짜 선택은 메모리 캐시만 조회하고, 월 변경 시에만 이벤트를 가져옴
+        self.cal.bind("<<CalendarSelected>>", self.on_date_selected)
+        self.cal.bind("<<CalendarMonthChanged>>", self.on_month_changed)
 
-        print(">>> 이제 self.load_events_for_displayed_month()를 호출합니다. <<<")
-        self.load_events_for_displayed_month()
-        print(">>> self.load_events_for_displayed_month() 호출 완료. <<<")
+        # 로컬 이벤트 저장소를 최신 상태로 유지하는 백그라운드 동기화 시작 (이미 실행 중이면 무시됨)
+        calendar_manager.start_background_sync()
 
-    # ★★★ 누락되었던 on_date_or_month_changed 메소드 정의 ★★★
-    def on_date_or_month_changed(self, event=None):
-        print(f"--- on_date_or_month_changed 함수 호출됨 --- (이벤트 정보: {event})")
         self.load_events_for_displayed_month()
-        self.update_event_details_for_selected_date()
-
-    def load_events_for_displayed_month(self):
-        print("--- load_events_for_displayed_month 함수 시작 ---")
 
-        if not hasattr(self, 'cal') or self.cal is None:
-            print("XXX 오류: self.cal (달력 위젯)이 초기화되지 않았습니다. load_events_for_displayed_month 함수를 종료합니다.")
+    def import_ics_file(self):
+        from modules import ics_importer
+        path = filedialog.askopenfilename(title="ICS 파일 선택",
+                                          filetypes=[("캘린더 파일", "*.ics"), ("모든 파일", "*.*")])
+        if not path:
             return
 
+        def on_done(result):
+            if "error" in result:
+                messagebox.showerror("ICS 가져오기 오류", result["error"])
+                return
+            message = f"'{result['summary']}'에서 일정 {result['events']}개, 반복 일정 {result['recurring']}개를 가져왔습니다."
+            if result["skipped"]:
+                message += f"\n지원하지 않는 반복 규칙 {result['skipped']}개는 첫 일정만 표시합니다."
+            if result["unknown_zones"]:
+                message += f"\n알 수 없는 시간대({', '.join(result['unknown_zones'])})의 일정은 이 컴퓨터의 시간대로 표시합니다."
+            messagebox.showinfo("ICS 가져오기", message)
+            self.reload_calendar_months()
+
+        self.show_event_details_message("ICS 파일을 읽는 중...")
+        self.runner.submit('ics_import', ics_importer.import_file, path, on_done=on_done,
+                           on_error=lambda e: on_done({"error": f"ICS 파일을 읽지 못했습니다: {e}"}))
+
+    def remove_ics_imports(self):
+        from modules import ics_importer
+        if not ics_importer.imported_calendars():
+            messagebox.showinfo("ICS 가져오기", "가져온 ICS 캘린더가 없습니다.")
+            return
+        if not messagebox.askyesno("ICS 가져오기", "가져온 ICS 캘린더를 모두 달력에서 지울까요? (원본 파일은 그대로 둡니다)"):
+            return
         try:
-            print(">>> self.cal.tag_delete('event_marker') 호출 시도...")
-            self.cal.tag_delete('event_marker')
-            print("<<< self.cal.tag_delete('event_marker') 호출 성공 (또는 태그가 이미 없었음).")
-        except ValueError as e_tag_delete:
-            if 'does not exists' in str(e_tag_delete).lower(): # 오류 메시지 소문자로 비교
-                print(f"정보: 'event_marker' 태그가 존재하지 않아 삭제할 수 없습니다. (정상적인 상황일 수 있음): {e_tag_delete}")
-            else:
-                print(f"경고: self.cal.tag_delete('event_marker') 실행 중 예상치 못한 ValueError 발생: {e_tag_delete}")
-                traceback.print_exc()
-        except Exception as e_generic_tag_delete:
-            print(f"XXX 오류: self.cal.tag_delete('event_marker') 실행 중 문제 발생: {e_generic_tag_delete}")
-            traceback.print_exc()
+            ics_importer.remove_imports()
+        except OSError as e:
+            messagebox.showerror("ICS 가져오기 오류", f"가져온 ICS 목록을 저장하지 못했습니다: {e}")
+        self.reload_calendar_months()
+
+    def reload_calendar_months(self):
+        """캐시된 월별 일정을 비우고 표시 중인 월을 다시 불러옵니다. (가져온 캘린더가 바뀌었을 때)"""
+        self.month_cache.invalidate()
+        if self.cal is not None and self.cal.winfo_exists():
+            self.load_events_for_displayed_month()
+
+    def on_date_selected(self, event=None):
+        # 같은 달 안에서 날짜를 클릭한 경우: 네트워크 요청 없이 monthly_events_cache만 조회
+        self.update_event_details_for_selected_date()
 
-        # 테스트용 print문은 이제 핵심 로그 확인 후 주석 처리하거나 삭제해도 됩니다.
-        # print("testteststsetsgjdfkgjsrhjlgksngjhsngkjlsgnsjghskdjgndlgkjsdgfhslfjksejfiusnfvsuogvnhfsuijgvhrgjkhi --- 이 로그가 보여야 합니다!")
+    def on_month_changed(self, event=None):
+        logger.debug("월 변경 이벤트: %s", event)
+        self.load_events_for_displayed_month()
+
+    def load_events_for_displayed_month(self):
+        if not hasattr(self, 'cal') or self.cal is None:
+            logger.error("self.cal (달력 위젯)이 초기화되지 않았습니다.")
+            return
 
         year = None
         month = None
         try:
-            print(">>> 현재 달력의 연도와 월 가져오기 시도...")
             displayed_month_year = self.cal.get_displayed_month()
             year = displayed_month_year[1]
             month = displayed_month_year[0]
-            print(f"<<< get_displayed_month() 사용 성공. 연도={year}, 월={month}")
         except AttributeError:
             try:
                 current_cal_date_str = self.cal.get_date()
                 current_cal_date_obj = date.fromisoformat(current_cal_date_str)
                 year = current_cal_date_obj.year
                 month = current_cal_date_obj.month
-                print(f"<<< get_displayed_month() 실패, get_date() 사용 성공. 연도={year}, 월={month}")
+                logger.debug("get_displayed_month() 실패, get_date() 사용: 연도=%s, 월=%s", year, month)
             except Exception as e_get_date:
-                print(f"XXX 오류: get_date()로 날짜 가져오기 실패: {e_get_date}")
+                logger.error("get_date()로 날짜 가져오기 실패: %s", e_get_date)
                 messagebox.showerror("달력 오류", f"날짜 정보를 가져오는 데 실패했습니다: {e_get_date}")
                 return
         except Exception as e_get_month_year:
-            print(f"XXX 오류: 달력에서 연도/월 정보 가져오기 중 예외 발생: {e_get_month_year}")
+            logger.exception("달력에서 연도/월 정보 가져오기 중 예외 발생")
             messagebox.showerror("달력 오류", f"달력 정보를 가져오는 데 실패했습니다: {e_get_month_year}")
             return
 
         if year is None or month is None:
-            print("XXX 연도 또는 월 정보를 가져오지 못했습니다. 함수를 종료합니다.")
+            logger.error("연도 또는 월 정보를 가져오지 못했습니다.")
             messagebox.showerror("달력 오류", "달력의 연도와 월 정보를 가져올 수 없습니다.")
             return
 
-        print(f"로딩 중: {year}년 {month}월 이벤트...")
-        self.monthly_events_cache = calendar_manager.get_events_for_month(year, month)
-        print(f"=== 데이터 수신 확인 ===\n{year}년 {month}월 이벤트 데이터: {self.monthly_events_cache}\n=======================")
-        if "error" in self.monthly_events_cache:
-            messagebox.showerror("캘린더 오류", self.monthly_events_cache["error"])
+        # 현재 월을 요청하면서 앞뒤 월도 미리 가져오고, 더 이상 필요 없는 월의 대기 중인 요청은 취소
+        month_future = self.month_prefetcher.show(year, month)
+        if month_future.done() and not month_future.cancelled():
+            logger.debug("캐시 사용: %s년 %s월 이벤트", year, month)
+            metrics.incr("calendar.month_cache_hit")
+            self.runner.cancel('calendar') # 이전 월의 진행 중인 결과가 덮어쓰지 않도록 함
+            self.apply_month_events(year, month, month_future.result())
             return
 
-        marked_event_count = 0
-        if self.monthly_events_cache:
-            for event_date_obj, summaries in self.monthly_events_cache.items():
-                if summaries: # summaries 리스트가 비어있지 않은 경우에만 마킹
-                    try:
-                        self.cal.calevent_create(event_date_obj, text='이벤트', tags=('event_marker',))
-                        marked_event_count += 1
-                    except Exception as e_create_event: # calevent_create 에서도 오류 발생 가능
-                        print(f"XXX 오류: self.cal.calevent_create 실행 중 문제 발생 (날짜: {event_date_obj}): {e_create_event}")
-                        traceback.print_exc()
-
-            print(f"=== 마킹 시도 확인 ===\n총 {marked_event_count}개의 날짜에 이벤트 마커 생성 시도함\n=======================")
-        else:
-            print(f"=== 마킹 시도 확인 ===\n표시할 이벤트 데이터가 없음 (monthly_events_cache가 비어있거나 오류 없음)\n=======================")
+        logger.debug("로딩 중: %s년 %s월 이벤트", year, month)
+        metrics.incr("calendar.month_cache_miss")
+        self.show_event_details_message("일정을 불러오는 중...")
+        # 같은 월에 대한 요청은 하나의 Future를 공유하므로, 작업 스레드는 그 결과만 기다림
+        self.runner.submit('calendar', month_future.result,
+                           on_done=lambda events: self.apply_month_events(year, month, events),
+                           on_error=lambda e: self.apply_month_events(year, month, {"error": str(e)}))
 
+    def show_event_details_message(self, message):
+        if hasattr(self, 'event_details_listbox') and self.event_details_listbox.winfo_exists():
+            self.event_details_listbox.delete(0, tk.END)
+            self.event_details_listbox.insert(tk.END, message)
+
+    def apply_month_events(self, year, month, events):
+        """작업 스레드에서 가져온 월별 이벤트를 달력에 표시합니다. (메인 스레드에서 호출됨)"""
+        if self.cal is None or not self.cal.winfo_exists():
+            return # 그 사이 다른 화면으로 이동함
         try:
-            self.cal.tag_config('event_marker', background='red', foreground='white')
-        except Exception as e_tag_config:
-            print(f"XXX 오류: self.cal.tag_config 실행 중 문제 발생: {e_tag_config}")
-            traceback.print_exc()
+            displayed_month, displayed_year = self.cal.get_displayed_month()
+            if (displayed_year, displayed_month) != (year, month):
+                return # 사용자가 이미 다른 월로 이동함
+        except AttributeError:
+            pass # get_displayed_month가 없는 버전에서는 작업 key로만 오래된 결과를 거름
+
+        if isinstance(events, dict): # 오류 결과 ({"error": ...})
+            self.monthly_events_cache = None
+            self.show_event_details_message("일정을 불러오지 못했습니다.")
+            messagebox.showerror("캘린더 오류", events["error"])
+            return
+        self.monthly_events_cache = events
+        logger.debug("%s년 %s월 이벤트 수신: %d개", year, month, len(events))
+
+        with metrics.span("ui.marker_redraw"):
+            self.update_event_markers(year, month)
 
         self.update_event_details_for_selected_date()
-        print("--- load_events_for_displayed_month 함수 종료 (정상적일 경우) ---")
+
+    def update_event_markers(self, year, month):
+        """
+        이전에 표시한 마커와 비교하여 바뀐 날짜의 마커만 추가/변경/삭제합니다.
+        날짜별 일정 개수는 마커 색의 진하기(EVENT_MARKER_TAGS)로 표시합니다.
+        """
+        first_day = date(year, month, 1)
+        last_day = date(year, month, monthrange(year, month)[1])
+        desired = {}  # {date: (태그, 표시 문구)}
+        # 여러 날에 걸친 이벤트는 걸친 모든 날짜에 표시
+        for event_date_obj, count in self.monthly_events_cache.count_by_date(first_day, last_day).items():
+            level = min(count, len(EVENT_MARKER_TAGS)) - 1
+            desired[event_date_obj] = (EVENT_MARKER_TAGS[level], f"일정 {count}개")
+
+        added = changed = removed = 0
+        # 이번 달 범위 안에서 더 이상 일정이 없는 날짜의 마커 삭제 (다른 달의 마커는 그대로 둠)
+        for event_date_obj in list(self.event_marker_ids):
+            if first_day <= event_date_obj <= last_day and event_date_obj not in desired:
+                ev_id, _ = self.event_marker_ids.pop(event_date_obj)
+                self.cal.calevent_remove(ev_id)
+                removed += 1
+
+        for event_date_obj, marker in desired.items():
+            current = self.event_marker_ids.get(event_date_obj)
+            try:
+                if current is None:
+                    tag, text = marker
+                    ev_id = self.cal.calevent_create(event_date_obj, text=text, tags=(tag,))
+                    self.event_marker_ids[event_date_obj] = (ev_id, marker)
+                    added += 1
+                elif current[1] != marker: # 일정 개수가 바뀐 날짜만 갱신
+                    tag, text = marker
+                    self.cal.calevent_configure(current[0], text=text, tags=(tag,))
+                    self.event_marker_ids[event_date_obj] = (current[0], marker)
+                    changed += 1
+            except Exception: # calevent_create 에서도 오류 발생 가능
+                logger.exception("이벤트 마커 갱신 중 문제 발생 (날짜: %s)", event_date_obj)
+        logger.debug("마커 갱신: 추가 %d개, 변경 %d개, 삭제 %d개", added, changed, removed)
 
     def update_event_details_for_selected_date(self):
-        print("--- update_event_details_for_selected_date 함수 시작 ---")
         if not hasattr(self, 'event_details_listbox') or not self.event_details_listbox.winfo_exists():
-             print("정보: event_details_listbox가 없거나 파괴되었습니다.")
-             return
+            return
         if not hasattr(self, 'cal') or self.cal is None:
-            print("정보: self.cal이 초기화되지 않아 선택된 날짜를 가져올 수 없습니다.")
             self.event_details_listbox.delete(0, tk.END)
             self.event_details_listbox.insert(tk.END, "달력을 먼저 로드하세요.")
             return
@@ -258,26 +709,67 @@ class PlanManApp:
                 self.event_details_listbox.insert(tk.END, "날짜를 선택하세요.")
                 return
         except Exception as e_selection_get:
-            print(f"정보: 날짜 선택 정보를 가져오는 중 오류 (무시 가능): {e_selection_get}")
+            logger.debug("날짜 선택 정보를 가져오는 중 오류 (무시 가능): %s", e_selection_get)
             self.event_details_listbox.insert(tk.END, "날짜를 선택하세요.")
             return
 
-        print(f"선택된 날짜: {selected_date_obj}")
-        if selected_date_obj in self.monthly_events_cache:
-            events_today = self.monthly_events_cache[selected_date_obj]
+        if self.monthly_events_cache is not None:
+            events_today = self.monthly_events_cache.on_date(selected_date_obj)
             if events_today:
-                for summary in events_today:
-                    self.event_details_listbox.insert(tk.END, f"- {summary}")
+                from modules import calendar_manager
+                colors = calendar_manager.calendar_colors()
+                for event in events_today:
+                    time_text = "" if event.all_day or event.start.date() != selected_date_obj else f"{event.start:%H:%M} "
+                    self.event_details_listbox.insert(tk.END, f"- {time_text}{event.summary}")
+                    # 일정이 속한 캘린더의 색으로 표시
+                    self.event_details_listbox.itemconfig(
+                        tk.END, foreground=colors.get(event.calendar, calendar_manager.DEFAULT_CALENDAR_COLOR))
             else:
                 self.event_details_listbox.insert(tk.END, "선택한 날짜에 일정이 없습니다.")
         else:
             self.event_details_listbox.insert(tk.END, "선택한 날짜에 일정이 없습니다. (캐시 미포함)")
-        print("--- update_event_details_for_selected_date 함수 종료 ---")
 
-def launch_gui():
+def warm_up_modules():
+    """
+    무거운 모듈을 작업 스레드에서 불러오고, 뉴스 피드 새로고침 스케줄러를 시작합니다.
+    스케줄러가 모든 카테고리를 바로 가져온 뒤 계속 최신 상태로 유지하므로 뉴스 화면은 항상 메모리 캐시에서 바로 열립니다.
+    저장소에 있는 일정도 검색 색인에 넣어 둡니다.
+    """
+    with metrics.span("startup.warm_up_imports"):
+        import tkcalendar # noqa: F401 (캘린더 화면을 처음 열 때 기다리지 않도록 미리 불러옴)
+        from modules import calendar_manager
+        from modules import news_fetcher
+    news_fetcher.start_feed_scheduler()
+    try:
+        calendar_manager.index_stored_events() # 지난번에 동기화한 일정도 바로 검색되도록 함
+    except Exception as e:
+        logger.warning("저장된 일정 색인 실패: %s", e)
+
+def launch_gui(startup_probe=False):
+    """
+    앱을 실행합니다.
+    startup_probe=True이면 첫 화면이 그려진 직후 걸린 시간을 출력하고 종료합니다. (시작 시간 측정용)
+    """
     root = tk.Tk()
     app = PlanManApp(root)
+    if startup_probe:
+        def report_and_quit():
+            if app.first_paint_ms is None:
+                root.after(10, report_and_quit)
+                return
+            print(f"first_paint_ms={app.first_paint_ms:.1f}")
+            root.quit()
+        root.after_idle(report_and_quit)
     root.mainloop()
+    app.runner.shutdown() # 진행 중인 작업을 기다리지 않고 종료
+    if app.month_prefetcher:
+        app.month_prefetcher.shutdown()
+    news_fetcher = sys.modules.get('modules.news_fetcher') # 불러오지 않았으면 멈출 스케줄러도 없음
+    if news_fetcher:
+        news_fetcher.stop_feed_scheduler()
+    article_reader = sys.modules.get('modules.article_reader')
+    if article_reader:
+        article_reader.shutdown()
 
 if __name__ == '__main__':
     launch_gui()
\ No newline at end of file